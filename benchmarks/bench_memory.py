@@ -0,0 +1,90 @@
+"""辞書と数値表現オブジェクトのメモリ使用量の計測スクリプト.
+
+Examples
+--------
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --objects 100000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable
+
+from pynormalizenumexp.expression.abstime import AbstimeExpression
+from pynormalizenumexp.expression.base import NNumber
+from pynormalizenumexp.expression.numerical import NumericalExpression
+from pynormalizenumexp.normalize_numexp import NormalizeNumexp
+
+
+def measure_memory(func: Callable[[], object]) -> tuple[int, object]:
+    """関数の実行前後で増えたメモリ使用量（バイト）を計測する.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        計測対象の関数（返り値は計測が終わるまで保持する）
+
+    Returns
+    -------
+    tuple[int, object]
+        増えたメモリ使用量（バイト）と関数の返り値
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return after - before, result
+
+
+def create_expressions(num_objects: int) -> list[object]:
+    """抽出処理で生成されるものと同じ種類の数値表現オブジェクトを生成する.
+
+    Parameters
+    ----------
+    num_objects : int
+        数値表現の種類ごとに生成するオブジェクト数
+
+    Returns
+    -------
+    list[object]
+        生成したオブジェクト
+    """
+    exprs: list[object] = []
+    for i in range(num_objects):
+        number = NNumber("100", i, i + 3)
+        exprs.append(number)
+        exprs.append(NumericalExpression(number))
+        exprs.append(AbstimeExpression(number))
+
+    return exprs
+
+
+def main() -> None:
+    """構築済みの辞書と、数値表現オブジェクト1個あたりのメモリ使用量を表示する."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=10000, help="数値表現の種類ごとに生成するオブジェクト数")
+    args = parser.parse_args()
+
+    def load_dictionaries() -> NormalizeNumexp:
+        normalizer = NormalizeNumexp("ja")
+        normalizer.warmup()
+        return normalizer
+
+    dict_bytes, _ = measure_memory(load_dictionaries)
+    expr_bytes, _ = measure_memory(lambda: create_expressions(args.objects))
+    # NNumber・NumericalExpression・AbstimeExpressionの3個を1組として生成している
+    num_exprs = args.objects * 3
+
+    print(f"dictionaries      : {dict_bytes / 1024 / 1024:10.2f} MiB")
+    print(f"expression objects: {expr_bytes / 1024 / 1024:10.2f} MiB ({num_exprs} objects)")
+    print(f"per expression    : {expr_bytes / num_exprs:10.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""NormalizeNumexp.normalize_batchのスループット計測スクリプト.
+
+Examples
+--------
+    python benchmarks/bench_normalize_batch.py --repeat 200
+    python benchmarks/bench_normalize_batch.py --input /path/to/texts.txt
+    python benchmarks/bench_normalize_batch.py --workers 8
+"""
+import argparse
+import time
+from typing import Callable
+
+from pynormalizenumexp.normalize_numexp import NormalizeNumexp
+
+SAMPLE_TEXTS = [
+    "1911年から2011年の間、その100年間において、9.3万人もの死傷者がでた。",
+    "15年前、戦争があった",
+    "昨年3月、僕たち２人は結婚した",
+    "131.1ポイントというスコアを叩き出した",
+    "午後3時45分に待ち合わせ",
+    "【今日から開催】The Fruits of Adventures @ ZEIT-FOTO SALON(東京・京橋)  4/26(Tue)まで",
+    "数十人が十数人と喧嘩して、百数十円落とした",
+    "2012/4/3~6に行われる",
+    "彼の打率は3割4分5厘だ",
+    "数字を含まない短いテキスト",
+]
+
+
+def make_unique(texts: list[str]) -> list[str]:
+    """繰り返したテキストが互いに異なるように、数値表現を含まない接尾辞を付ける.
+
+    Parameters
+    ----------
+    texts : list[str]
+        テキスト群
+
+    Returns
+    -------
+    list[str]
+        接尾辞を付けたテキスト群（normalize_batchで同じテキストの抽出結果が使い回されないようにする）
+    """
+    def suffix(i: int) -> str:
+        # ギリシャ文字の24進数表記
+        chars = ""
+        while True:
+            chars += chr(ord("α") + i % 24)
+            i //= 24
+            if i == 0:
+                return chars
+
+    return [f"{text} {suffix(i)}" for i, text in enumerate(texts)]
+
+
+def measure(func: Callable[[], object]) -> float:
+    """関数の実行時間（秒）を計測する.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        計測対象の関数
+
+    Returns
+    -------
+    float
+        実行時間（秒）
+    """
+    start = time.perf_counter()
+    func()
+
+    return time.perf_counter() - start
+
+
+def report(label: str, num_texts: int, sec: float) -> None:
+    """計測結果を出力する.
+
+    Parameters
+    ----------
+    label : str
+        計測対象の名前
+    num_texts : int
+        処理したテキスト数
+    sec : float
+        実行時間（秒）
+    """
+    print(f"{label:<27}: {num_texts / sec:10.1f} docs/sec ({sec:.3f} sec)")
+
+
+def main() -> None:
+    """normalizeのループとnormalize_batch、normalize_parallelのdocs/secを比較する.
+
+    Notes
+    -----
+        * 辞書の読み込みを計測に含めないよう、事前にwarmupを呼ぶ
+        * 通常は互いに異なるテキストで計測し、同じテキストの繰り返し（normalize_batchの重複除去が効く場合）は別に計測する
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--input", help="1行1テキストの入力ファイル（未指定の場合は組み込みのサンプルを使う）")
+    parser.add_argument("--repeat", type=int, default=100, help="入力テキストを繰り返す回数")
+    parser.add_argument("--workers", type=int, default=None, help="normalize_parallelのワーカープロセス数（未指定の場合はCPU数）")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input) as fp:
+            texts = [line.rstrip("\n") for line in fp]
+    else:
+        texts = SAMPLE_TEXTS
+    repeated_texts = texts * args.repeat
+    unique_texts = make_unique(repeated_texts)
+
+    normalizer = NormalizeNumexp("ja")
+    normalizer.warmup()
+
+    loop_sec = measure(lambda: [normalizer.normalize(text) for text in unique_texts])
+    batch_sec = measure(lambda: normalizer.normalize_batch(unique_texts))
+    parallel_sec = measure(lambda: list(normalizer.normalize_parallel(unique_texts, workers=args.workers)))
+    repeated_loop_sec = measure(lambda: [normalizer.normalize(text) for text in repeated_texts])
+    repeated_batch_sec = measure(lambda: normalizer.normalize_batch(repeated_texts))
+
+    print(f"documents                  : {len(unique_texts)}")
+    print("unique texts:")
+    report("  normalize loop", len(unique_texts), loop_sec)
+    report("  normalize_batch", len(unique_texts), batch_sec)
+    report("  normalize_parallel", len(unique_texts), parallel_sec)
+    print(f"repeated texts ({len(set(texts))} distinct, deduplicated by normalize_batch):")
+    report("  normalize loop", len(repeated_texts), repeated_loop_sec)
+    report("  normalize_batch", len(repeated_texts), repeated_batch_sec)
+
+
+if __name__ == "__main__":
+    main()
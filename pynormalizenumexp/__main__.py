@@ -0,0 +1,347 @@
+"""ファイルや標準入力のテキストから数値表現を抽出・正規化するコマンドラインツール.
+
+Examples
+--------
+    python -m pynormalizenumexp texts.txt > results.jsonl
+    cat docs.jsonl | python -m pynormalizenumexp --format jsonl --text-field body --id-field doc_id
+    python -m pynormalizenumexp --workers 8 --types numerical,abstime -o results.jsonl texts1.txt texts2.txt
+"""
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from .normalize_numexp import EXPRESSION_TYPES, NormalizeNumexp, replace_non_finite
+
+# 入出力のバッファサイズ（バイト）
+IO_BUFFER_SIZE = 1 << 20
+
+
+class InputError(ValueError):
+    """入力ファイルの内容が不正な場合の例外."""
+
+
+def parse_types(value: str) -> list[str]:
+    """カンマ区切りの表現種別を分割する.
+
+    Parameters
+    ----------
+    value : str
+        カンマ区切りの表現種別
+
+    Returns
+    -------
+    list[str]
+        表現種別
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        不正な表現種別が含まれている場合
+    """
+    types = [expr_type.strip() for expr_type in value.split(",") if expr_type.strip()]
+    for expr_type in types:
+        if expr_type not in EXPRESSION_TYPES:
+            raise argparse.ArgumentTypeError(f'Invalid type: "{expr_type}" (choose from {", ".join(EXPRESSION_TYPES)})')
+
+    return types
+
+
+def parse_positive_int(value: str) -> int:
+    """1以上の整数を解析する.
+
+    Parameters
+    ----------
+    value : str
+        解析する文字列
+
+    Returns
+    -------
+    int
+        解析した整数
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        1以上の整数でない場合
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'Invalid positive integer: "{value}"')
+
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを作成する.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        コマンドライン引数のパーサー
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pynormalizenumexp",
+        description="テキストから数値表現を抽出・正規化し、入力1行ごとに結果を1行のJSON（NDJSON）で出力する")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="入力ファイルのパス（省略時または「-」の場合は標準入力）")
+    parser.add_argument("-o", "--output", default="-", help="出力ファイルのパス（省略時または「-」の場合は標準出力）")
+    parser.add_argument("--format", choices=["text", "jsonl"], default="text",
+                        help="入力の形式（text：1行1テキスト、jsonl：1行1オブジェクト）")
+    parser.add_argument("--text-field", default="text", help="jsonlの場合にテキストを取り出すフィールド名")
+    parser.add_argument("--id-field", default=None, help="jsonlの場合にIDとして出力するフィールド名（省略時は入力全体での行番号）")
+    parser.add_argument("--workers", type=parse_positive_int, default=1, help="ワーカープロセス数")
+    parser.add_argument("--batch-size", type=parse_positive_int, default=64,
+                        help="ワーカープロセスにまとめて渡し、まとめて出力するテキストの数")
+    parser.add_argument("--types", type=parse_types, default=None,
+                        help=f"抽出対象の表現種別（カンマ区切りで{', '.join(EXPRESSION_TYPES)}から指定。省略時はすべて）")
+    parser.add_argument("--custom-dict", default=None, help="カスタム辞書のファイルパス")
+    parser.add_argument("--language", default="ja", help="利用する言語")
+
+    return parser
+
+
+def open_input(path: str) -> IO[str]:
+    """入力ファイル（「-」の場合は標準入力）を開く.
+
+    Parameters
+    ----------
+    path : str
+        入力ファイルのパス
+
+    Returns
+    -------
+    IO[str]
+        バッファ付きで開いたテキストストリーム（標準入力の場合は閉じても標準入力自体は閉じない）
+    """
+    if path == "-":
+        return open(sys.stdin.fileno(), encoding="utf-8", buffering=IO_BUFFER_SIZE, closefd=False)
+
+    return open(path, encoding="utf-8", buffering=IO_BUFFER_SIZE)
+
+
+def open_output(path: str) -> IO[bytes]:
+    """出力ファイル（「-」の場合は標準出力）を開く.
+
+    Parameters
+    ----------
+    path : str
+        出力ファイルのパス
+
+    Returns
+    -------
+    IO[bytes]
+        バッファ付きで開いたバイナリストリーム（標準出力の場合は閉じても標準出力自体は閉じない）
+    """
+    if path == "-":
+        sys.stdout.flush()
+        return open(sys.stdout.fileno(), "wb", buffering=IO_BUFFER_SIZE, closefd=False)
+
+    return open(path, "wb", buffering=IO_BUFFER_SIZE)
+
+
+def parse_jsonl_line(line: str, text_field: str, id_field: Optional[str], location: str) -> tuple[Any, str]:
+    """JSONLの1行からIDとテキストを取り出す.
+
+    Parameters
+    ----------
+    line : str
+        JSONLの1行
+    text_field : str
+        テキストを取り出すフィールド名
+    id_field : Optional[str]
+        IDを取り出すフィールド名（Noneの場合はIDを取り出さない）
+    location : str
+        エラーメッセージに含める入力中の位置
+
+    Returns
+    -------
+    tuple[Any, str]
+        IDとテキストのタプル（IDを取り出さない場合のIDはNone）
+
+    Raises
+    ------
+    InputError
+        JSONとして不正な場合や、オブジェクトでない場合、テキストが文字列でない場合
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise InputError(f"Invalid JSON at {location}: {e}") from e
+    if not isinstance(record, dict):
+        raise InputError(f"JSON object is expected at {location}")
+
+    text = record.get(text_field)
+    if not isinstance(text, str):
+        raise InputError(f'String field "{text_field}" is not found at {location}')
+
+    return (record.get(id_field) if id_field is not None else None), text
+
+
+def read_documents(paths: Iterable[str], input_format: str, text_field: str, id_field: Optional[str]) -> Iterator[tuple[Any, str]]:
+    """入力ファイルからIDとテキストを1件ずつ読み込む.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        入力ファイルのパス（「-」の場合は標準入力）
+    input_format : str
+        入力の形式（text, jsonlのいずれか）
+    text_field : str
+        jsonlの場合にテキストを取り出すフィールド名
+    id_field : Optional[str]
+        jsonlの場合にIDを取り出すフィールド名（Noneの場合はIDを入力全体での行番号にする）
+
+    Yields
+    ------
+    tuple[Any, str]
+        IDとテキストのタプル
+
+    Raises
+    ------
+    InputError
+        UTF-8として不正な場合や、jsonlの行が不正な場合
+
+    Notes
+    -----
+        jsonlの場合、空行は読み飛ばす（行番号には含める）
+    """
+    line_number = 0
+    for path in paths:
+        with open_input(path) as f:
+            try:
+                for i, line in enumerate(f, 1):
+                    line = line.rstrip("\r\n")
+                    doc_id: Any = line_number
+                    line_number += 1
+                    if input_format == "jsonl":
+                        if not line.strip():
+                            continue
+                        record_id, line = parse_jsonl_line(line, text_field, id_field, f"{path}:{i}")
+                        if id_field is not None:
+                            doc_id = record_id
+                    yield doc_id, line
+            except UnicodeDecodeError as e:
+                raise InputError(f"Invalid UTF-8 in {path}: {e}") from e
+
+
+def format_result(doc_id: Any, result: bytes) -> bytes:
+    """1件分の結果を出力する1行に変換する.
+
+    Parameters
+    ----------
+    doc_id : Any
+        ID
+    result : bytes
+        JSON形式の抽出・正規化結果
+
+    Returns
+    -------
+    bytes
+        {"id": ID, "expressions": 結果}のJSONと改行
+
+    Notes
+    -----
+        入力のJSONLのIDに標準のJSONで表せない値（Infinity・NaN）が含まれる場合はnullとして出力する
+    """
+    id_json = json.dumps(replace_non_finite(doc_id), ensure_ascii=False, allow_nan=False)
+
+    return b'{"id":' + id_json.encode("utf-8") + b',"expressions":' + result + b"}\n"
+
+
+def run(args: argparse.Namespace, output: IO[bytes]) -> tuple[int, int]:
+    """入力のテキストから数値表現を抽出・正規化し、結果を出力する.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        コマンドライン引数
+    output : IO[bytes]
+        出力先
+
+    Returns
+    -------
+    tuple[int, int]
+        処理したテキスト数と抽出した数値表現の数
+
+    Notes
+    -----
+        途中で例外が発生した場合も、それまでに処理したテキストの結果は出力してから例外を送出する
+    """
+    normalizer = NormalizeNumexp(args.language, args.custom_dict, types=args.types)
+
+    # テキストはワーカープロセスに渡し、IDは結果と同じ順序で取り出せるようにこのプロセスで保持する
+    doc_ids: deque[Any] = deque()
+    # 読み込み中の例外をそのまま送出すると、ワーカープロセスにまとめて渡す途中のテキストが処理されないので、
+    # 読み込みを終えて、それまでのテキストを処理してから送出する
+    input_errors: list[InputError] = []
+
+    def read_texts() -> Iterator[str]:
+        try:
+            for doc_id, text in read_documents(args.inputs, args.format, args.text_field, args.id_field):
+                doc_ids.append(doc_id)
+                yield text
+        except InputError as e:
+            input_errors.append(e)
+
+    results = normalizer.normalize_parallel(read_texts(), as_dict=True, workers=args.workers, chunksize=args.batch_size)
+
+    num_texts = num_exprs = 0
+    lines: list[bytes] = []
+    try:
+        for result in results:
+            lines.append(format_result(doc_ids.popleft(), normalizer.dumps_json(result)))
+            num_texts += 1
+            num_exprs += len(result)
+            if len(lines) >= args.batch_size:
+                output.write(b"".join(lines))
+                lines.clear()
+        if input_errors:
+            raise input_errors[0]
+    finally:
+        output.write(b"".join(lines))
+
+    return num_texts, num_exprs
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """コマンドラインツールのエントリーポイント.
+
+    Parameters
+    ----------
+    argv : Optional[list[str]], optional
+        コマンドライン引数（Noneの場合はsys.argv）, by default None
+
+    Returns
+    -------
+    int
+        終了コード（0：正常終了、1：入力エラー）
+
+    Notes
+    -----
+        * 処理したテキスト数・抽出した数値表現の数・スループットは標準エラー出力に出力する
+        * 入力の内容が不正な場合と入出力に失敗した場合のみ終了コード1を返し、それ以外の例外はそのまま送出する
+    """
+    args = build_parser().parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        with open_output(args.output) as output:
+            num_texts, num_exprs = run(args, output)
+    except (OSError, InputError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    throughput = num_texts / elapsed if elapsed > 0 else 0.0
+    print(f"{num_texts} texts, {num_exprs} expressions in {elapsed:.2f}s ({throughput:.1f} texts/s)", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,21 @@
 """各種表現パターンクラスの定義モジュール."""
+import struct
 import typing
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Any, Optional, TypeVar, Union
 
 # 定数定義
 INF = float("inf")
 PLACE_HOLDER = "ǂ"
 
+ExpressionType = TypeVar("ExpressionType", bound="BaseExpression")
+
+# NTimeの6つの属性を64bit浮動小数点数として詰めた形式
+NTIME_STRUCT = struct.Struct("<6d")
+
+# クラスごとの全属性名（基底クラスの__slots__を含む）のキャッシュ
+SLOT_NAMES: dict[type, tuple[str, ...]] = {}
+
 
 class NotationType(Enum):
     """数値表現の列挙クラス."""
@@ -22,7 +31,15 @@ class NotationType(Enum):
 
 
 class NTime:
-    """時間情報を保持するためのクラス."""
+    """時間情報を保持するためのクラス.
+
+    Notes
+    -----
+        * 年・月・日・時・分・秒のうち、値がないものはINF（下限）または-INF（上限）で表す
+        * 抽出処理で大量に生成・複製されるので、属性は__slots__で宣言して__dict__を持たないようにする
+    """
+
+    __slots__ = ("year", "month", "day", "hour", "minute", "second")
 
     @typing.overload
     def __init__(self, value: Union[int, float]) -> None:
@@ -37,10 +54,11 @@ class NTime:
 
     def __init__(self, *args) -> None:  # type: ignore
         """コンストラクタ."""
-        try:
-            self.year, self.month, self.day, self.hour, self.minute, self.second = args
-        except ValueError:
+        if len(args) == 1:
+            # NTime(INF)のように頻繁に呼ばれるので、例外を使わずに引数の数で分岐する
             self.year = self.month = self.day = self.hour = self.minute = self.second = args[0]
+        else:
+            self.year, self.month, self.day, self.hour, self.minute, self.second = args
 
     def __eq__(self, o: object) -> bool:  # noqa: D105
         if not isinstance(o, NTime):
@@ -49,6 +67,105 @@ class NTime:
         return o.year == self.year and o.month == self.month and o.day == self.day \
             and o.hour == self.hour and o.minute == self.minute and o.second == self.second
 
+    def copy(self) -> "NTime":
+        """複製したオブジェクトを返す.
+
+        Returns
+        -------
+        NTime
+            複製したオブジェクト
+        """
+        return NTime(self.year, self.month, self.day, self.hour, self.minute, self.second)
+
+    def is_filled_with(self, value: Union[int, float]) -> bool:
+        """すべての属性が与えられた値かどうかを判定する.
+
+        Parameters
+        ----------
+        value : Union[int, float]
+            判定に使う値
+
+        Returns
+        -------
+        bool
+            True：すべての属性が与えられた値である、False：そうでない
+
+        Notes
+        -----
+            NTime(value)との比較と同じ結果を、オブジェクトを生成せずに得る
+        """
+        return self.year == value and self.month == value and self.day == value \
+            and self.hour == value and self.minute == value and self.second == value
+
+    def is_null(self) -> bool:
+        """値がない（すべての属性がINFまたは-INFになっている）かどうかを判定する.
+
+        Returns
+        -------
+        bool
+            True：Nullである、False：Nullでない
+        """
+        return self.is_filled_with(INF) or self.is_filled_with(-INF)
+
+    def identify_time_detail(self) -> str:
+        """値がある最も細かい単位を判定する.
+
+        Returns
+        -------
+        str
+            単位を表す文字列（s: 秒、mn: 分、h: 時、d: 日、m: 月、 y: 年、値がない場合は空文字列）
+        """
+        if self.second != INF and self.second != -INF:
+            return "s"
+        elif self.minute != INF and self.minute != -INF:
+            return "mn"
+        elif self.hour != INF and self.hour != -INF:
+            return "h"
+        elif self.day != INF and self.day != -INF:
+            return "d"
+        elif self.month != INF and self.month != -INF:
+            return "m"
+        elif self.year != INF and self.year != -INF:
+            return "y"
+        else:
+            return ""
+
+    def as_tuple(self) -> tuple[Union[int, float], ...]:
+        """属性を年・月・日・時・分・秒の順に並べたタプルを返す.
+
+        Returns
+        -------
+        tuple[Union[int, float], ...]
+            年・月・日・時・分・秒のタプル
+        """
+        return (self.year, self.month, self.day, self.hour, self.minute, self.second)
+
+    def pack(self) -> bytes:
+        """6つの属性を64bit浮動小数点数として詰めたバイト列を返す.
+
+        Returns
+        -------
+        bytes
+            年・月・日・時・分・秒の順に詰めた48バイトのバイト列（リトルエンディアン）
+        """
+        return NTIME_STRUCT.pack(self.year, self.month, self.day, self.hour, self.minute, self.second)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "NTime":
+        """packで詰めたバイト列から時間オブジェクトを復元する.
+
+        Parameters
+        ----------
+        data : bytes
+            packで詰めたバイト列
+
+        Returns
+        -------
+        NTime
+            復元した時間オブジェクト（値はすべてfloatになる）
+        """
+        return cls(*NTIME_STRUCT.unpack(data))
+
     @typing.no_type_check
     def __str__(self, only_params: bool = False) -> Union[str, dict[str, int]]:  # noqa: D105
         params = {
@@ -105,7 +222,15 @@ class NTime:
 
 
 class BaseExpression(object):
-    """各種表現の基底クラス."""
+    """各種表現の基底クラス.
+
+    Notes
+    -----
+        * 大量に生成・保持されるので、属性は__slots__で宣言して__dict__を持たないようにする
+        * 派生クラスでも新たな属性は__slots__で宣言すること
+    """
+
+    __slots__ = ("original_expr", "position_start", "position_end", "pattern", "value_lower_bound", "value_upper_bound")
 
     def __init__(self) -> None:
         """コンストラクタ."""
@@ -142,10 +267,53 @@ class BaseExpression(object):
 
         return f'{self.__class__}({str_params})'
 
+    def copy(self: ExpressionType) -> ExpressionType:
+        """複製したオブジェクトを返す.
+
+        Returns
+        -------
+        ExpressionType
+            複製したオブジェクト
+
+        Notes
+        -----
+            * 属性はint/float/str/bool/Enumなどの変更されない値、NTime、変更されない値のリストのいずれかなので、
+              NTimeとリストだけを複製すれば、deepcopyと同じ結果をより低コストで得られる
+            * 各処理では入力の表現を直接変更せず、変更する表現だけをこのメソッドで複製してから変更する
+        """
+        new_expr = self.__class__.__new__(self.__class__)
+        for name in self.get_slot_names():
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                # 値が設定されていない属性（NumberModifierの基底クラスの属性など）は複製しない
+                continue
+            setattr(new_expr, name, value.copy() if isinstance(value, (NTime, list)) else value)
+
+        return new_expr
+
+    @classmethod
+    def get_slot_names(cls) -> tuple[str, ...]:
+        """基底クラスのものも含めた全属性名を取得する.
+
+        Returns
+        -------
+        tuple[str, ...]
+            __slots__で宣言された全属性名
+        """
+        slot_names = SLOT_NAMES.get(cls)
+        if slot_names is None:
+            slot_names = tuple(name for klass in reversed(cls.__mro__) for name in getattr(klass, "__slots__", ()))
+            SLOT_NAMES[cls] = slot_names
+
+        return slot_names
+
 
 class BasePattern(BaseExpression):
     """パターン辞書用の各種表現の基底クラス."""
 
+    __slots__ = ("ordinary", "option", "total_number_of_place_holder", "len_of_after_final_place_holder")
+
     def __init__(self) -> None:
         """コンストラクタ."""
         super().__init__()
@@ -199,6 +367,8 @@ class BasePattern(BaseExpression):
 class NNumber(BaseExpression):
     """任意の数値表現のクラス."""
 
+    __slots__ = ("notation_type",)
+
     value_lower_bound: Union[int, float]
     value_upper_bound: Union[int, float]
 
@@ -243,6 +413,8 @@ class NNumber(BaseExpression):
 class NormalizedExpression(BaseExpression):
     """各種正規化表現の基底クラス."""
 
+    __slots__ = ("number_notation_type", "include_lower_bound", "include_upper_bound", "is_over", "is_less", "ordinary", "options")
+
     def __init__(self, original_expr: str, position_start: int, position_end: int) -> None:
         """コンストラクタ.
 
@@ -315,6 +487,8 @@ class NormalizedExpression(BaseExpression):
 class NumberModifier(NormalizedExpression):
     """修飾表現用クラス."""
 
+    __slots__ = ("process_type",)
+
     def __init__(self, pattern: str, process_type: str) -> None:
         """コンストラクタ.
 
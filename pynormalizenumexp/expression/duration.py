@@ -8,6 +8,8 @@ from .base import INF, BasePattern, NNumber, NormalizedExpression, NTime
 class DurationPattern(BasePattern):
     """パターン辞書用の相対時間表現クラス."""
 
+    __slots__ = ("corresponding_time_position", "process_type")
+
     def __init__(self) -> None:
         """コンストラクタ."""
         super().__init__()
@@ -35,6 +37,8 @@ class DurationPattern(BasePattern):
 class DurationExpression(NormalizedExpression):
     """期間の表現クラス."""
 
+    __slots__ = ("org_value_lower_bound", "org_value_upper_bound")
+
     value_lower_bound: NTime
     value_upper_bound: NTime
     org_value_lower_bound: Union[int, float]
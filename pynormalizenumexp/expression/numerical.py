@@ -8,6 +8,8 @@ from .base import BasePattern, NNumber, NormalizedExpression
 class NumericalPattern(BasePattern):
     """時間系以外の数値表現表現クラス."""
 
+    __slots__ = ("counter", "si_prefix", "optional_power_of_ten")
+
     def __init__(self) -> None:
         """コンストラクタ."""
         super().__init__()
@@ -36,6 +38,8 @@ class NumericalPattern(BasePattern):
 class NumericalExpression(NormalizedExpression):
     """時間系以外の数値表現クラス."""
 
+    __slots__ = ("counter",)
+
     value_lower_bound: float
     value_upper_bound: float
 
@@ -0,0 +1,235 @@
+"""抽出・正規化した数値表現を列ごとに保持するクラスの定義モジュール."""
+import math
+from array import array
+from typing import Any, Optional, Union
+
+from .normalize_numexp import EXPRESSION_TYPES, Expression, Time
+
+# 表現種別ごとの種別コード
+TYPE_CODES = {expr_type: i for i, expr_type in enumerate(EXPRESSION_TYPES)}
+# 時間の列の単位（列名は「{時間の種類}_{単位}」になる）
+TIME_COMPONENTS = ("year", "month", "day", "hour", "minute", "second")
+# 時間の列の種類（time：絶対時間・期間などの下限・上限、abs・rel：相対時間表現の絶対時間・相対時間の下限・上限）
+TIME_COLUMN_GROUPS = ("time_lower", "time_upper", "abs_lower", "abs_upper", "rel_lower", "rel_upper")
+# 値がないことを表す値
+MISSING_VALUE = float("nan")
+
+# 列ごとのarrayの型コードとNumPyのdtype
+INT_TYPECODE, INT_DTYPE = "q", "int64"
+TYPE_CODE_TYPECODE, TYPE_CODE_DTYPE = "b", "int8"
+FLOAT_TYPECODE, FLOAT_DTYPE = "d", "float64"
+
+
+def to_float(value: Union[int, float]) -> float:
+    """数値を浮動小数点数の列に入れる値に変換する.
+
+    Parameters
+    ----------
+    value : Union[int, float]
+        変換する数値
+
+    Returns
+    -------
+    float
+        変換後の値（浮動小数点数で表せない大きさの整数は符号に応じてinfまたは-infになる）
+    """
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+class ExpressionColumns(object):
+    """抽出・正規化した数値表現を列ごとの配列で保持するクラス.
+
+    Notes
+    -----
+        * 1つの数値表現が各列の同じ位置の要素に対応する
+        * 各列は標準ライブラリのarrayで保持するので、数値表現ごとのPythonオブジェクトを保持しない
+        * 数値（value_lower_bound・value_upper_bound）や時間の列で値がないものはNaNになる（INF・-INFは表現中で値が指定されていないことを表す）
+        * to_numpyやto_arrowで、NumPyやApache Arrowの配列にコピーせずに変換できる（それぞれのライブラリのインストールが必要）
+    """
+
+    def __init__(self) -> None:
+        """コンストラクタ."""
+        self.doc_index: array[int] = array(INT_TYPECODE)
+        self.type_code: array[int] = array(TYPE_CODE_TYPECODE)
+        self.position_start: array[int] = array(INT_TYPECODE)
+        self.position_end: array[int] = array(INT_TYPECODE)
+        self.counter_id: array[int] = array(INT_TYPECODE)
+        self.value_lower_bound: array[float] = array(FLOAT_TYPECODE)
+        self.value_upper_bound: array[float] = array(FLOAT_TYPECODE)
+        self.time_columns: dict[str, array[float]] = {
+            f"{group}_{component}": array(FLOAT_TYPECODE) for group in TIME_COLUMN_GROUPS for component in TIME_COMPONENTS
+        }
+
+        # 単位は文字列の種類が少ないので、IDに置き換えて保持する（Key：単位、Value：ID）
+        self.counter_ids: dict[str, int] = {}
+        self.counters: list[str] = []
+
+    def __len__(self) -> int:
+        """保持している数値表現の数を返す.
+
+        Returns
+        -------
+        int
+            数値表現の数
+        """
+        return len(self.doc_index)
+
+    def get_counter_id(self, counter: str) -> int:
+        """単位のIDを取得する（未登録の場合は登録する）.
+
+        Parameters
+        ----------
+        counter : str
+            単位
+
+        Returns
+        -------
+        int
+            単位のID（countersでのインデックス）
+        """
+        counter_id = self.counter_ids.get(counter)
+        if counter_id is None:
+            counter_id = len(self.counters)
+            self.counter_ids[counter] = counter_id
+            self.counters.append(counter)
+
+        return counter_id
+
+    def append_time(self, group: str, time: Optional[Time]) -> None:
+        """時間の列に値を追加する.
+
+        Parameters
+        ----------
+        group : str
+            時間の列の種類（TIME_COLUMN_GROUPSのいずれか）
+        time : Optional[Time]
+            追加する時間（Noneの場合はすべての単位にNaNを追加する）
+        """
+        for component in TIME_COMPONENTS:
+            value = MISSING_VALUE if time is None else to_float(getattr(time, component))
+            self.time_columns[f"{group}_{component}"].append(value)
+
+    def append(self, doc_index: int, expr: Expression) -> None:
+        """数値表現を追加する.
+
+        Parameters
+        ----------
+        doc_index : int
+            数値表現を抽出したテキストの入力中の順番
+        expr : Expression
+            追加する数値表現
+        """
+        def split_bound(value: Optional[Union[int, float, Time]]) -> tuple[float, Optional[Time]]:
+            # 数値は数値の列、時間は時間の列に入れる
+            if isinstance(value, Time):
+                return MISSING_VALUE, value
+            return MISSING_VALUE if value is None else to_float(value), None
+
+        lower_value, lower_time = split_bound(expr.value_lower_bound)
+        upper_value, upper_time = split_bound(expr.value_upper_bound)
+
+        self.doc_index.append(doc_index)
+        self.type_code.append(TYPE_CODES[expr.type])
+        self.position_start.append(expr.position_start)
+        self.position_end.append(expr.position_end)
+        self.counter_id.append(self.get_counter_id(expr.counter))
+        self.value_lower_bound.append(lower_value)
+        self.value_upper_bound.append(upper_value)
+        self.append_time("time_lower", lower_time)
+        self.append_time("time_upper", upper_time)
+        self.append_time("abs_lower", expr.value_lower_bound_abs)
+        self.append_time("abs_upper", expr.value_upper_bound_abs)
+        self.append_time("rel_lower", expr.value_lower_bound_rel)
+        self.append_time("rel_upper", expr.value_upper_bound_rel)
+
+    def get_columns(self) -> "dict[str, array[Any]]":
+        """列名ごとの配列を取得する.
+
+        Returns
+        -------
+        dict[str, array[Any]]
+            列名ごとの配列（保持している配列そのものなので、変更すると元のオブジェクトも変わる）
+
+        Notes
+        -----
+            列はdoc_index, type_code, position_start, position_end, counter_id, value_lower_bound, value_upper_bound,
+            time_lower_year〜rel_upper_secondの順に並ぶ
+        """
+        columns: dict[str, array[Any]] = {
+            "doc_index": self.doc_index,
+            "type_code": self.type_code,
+            "position_start": self.position_start,
+            "position_end": self.position_end,
+            "counter_id": self.counter_id,
+            "value_lower_bound": self.value_lower_bound,
+            "value_upper_bound": self.value_upper_bound
+        }
+        columns.update(self.time_columns)
+
+        return columns
+
+    def get_column_dtypes(self) -> dict[str, str]:
+        """列名ごとのNumPyのdtypeを取得する.
+
+        Returns
+        -------
+        dict[str, str]
+            列名ごとのdtype（int8, int64, float64のいずれか）
+        """
+        dtypes = {INT_TYPECODE: INT_DTYPE, TYPE_CODE_TYPECODE: TYPE_CODE_DTYPE, FLOAT_TYPECODE: FLOAT_DTYPE}
+
+        return {name: dtypes[column.typecode] for name, column in self.get_columns().items()}
+
+    def to_numpy(self) -> dict[str, Any]:
+        """列名ごとのNumPyの配列に変換する.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            列名ごとの配列（arrayのバッファをコピーせずに参照する）
+
+        Raises
+        ------
+        ImportError
+            NumPyがインストールされていない場合
+
+        Notes
+        -----
+            変換後の配列が元のarrayを参照している間は、数値表現を追加できない（BufferErrorになる）ので、変換はすべて追加し終えてから行うこと
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("to_numpy requires numpy (pip install numpy)") from e
+
+        dtypes = self.get_column_dtypes()
+
+        return {name: np.frombuffer(column, dtype=dtypes[name]) for name, column in self.get_columns().items()}
+
+    def to_arrow(self) -> Any:
+        """Apache Arrowのテーブルに変換する.
+
+        Returns
+        -------
+        pyarrow.Table
+            列名ごとの列を持つテーブル（数値の列はコピーせずに参照し、counterは単位の辞書型の列として加える）
+
+        Raises
+        ------
+        ImportError
+            pyarrowまたはNumPyがインストールされていない場合
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow requires pyarrow (pip install pyarrow)") from e
+
+        columns = self.to_numpy()
+        counter = pa.DictionaryArray.from_arrays(pa.array(columns["counter_id"]), pa.array(self.counters, type=pa.string()))
+
+        table = pa.table({name: pa.array(column) for name, column in columns.items()})
+
+        return table.append_column("counter", counter)
@@ -1,6 +1,14 @@
 """各種数値表現の抽出・正規化を行う処理の定義モジュール."""
-from dataclasses import asdict, dataclass, field
-from typing import Optional, Union, cast
+import gc
+import json
+import math
+import multiprocessing
+import os
+import re
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union, cast
 
 from .expression.abstime import AbstimeExpression
 from .expression.base import NormalizedExpression, NTime
@@ -8,12 +16,21 @@ from .expression.duration import DurationExpression
 from .expression.numerical import NumericalExpression
 from .expression.reltime import ReltimeExpression
 from .normalizer.abstime_expr_normalizer import AbstimeExpressionNormalizer
+from .normalizer.base import BaseNormalizer
 from .normalizer.duration_expr_normalizer import DurationExpressionNormalizer
 from .normalizer.inappropriate_expr_remover import InappropriateExpressionRemover
+from .normalizer.number_normalizer import NumberNormalizer
 from .normalizer.numerical_expr_normalizer import NumericalExpressionNormalizer
 from .normalizer.reltime_expr_normalizer import ReltimeExpressionNormalizer
-from .utility.custom_type import ReturnExpressionDict
+from .utility.custom_type import PrefilterStatDict, ReturnExpressionDict
 from .utility.dict_loader import DictLoader
+from .utility.prefetcher import Prefetcher
+from .utility.result_cache import ResultCache
+from .utility.stage_profiler import StageProfiler
+
+if TYPE_CHECKING:
+    # expression_columnsはこのモジュールのExpressionを使うので、実行時は利用する時に読み込む
+    from .expression_columns import ExpressionColumns
 
 
 @dataclass
@@ -27,6 +44,59 @@ class Time:
     minute: Union[int, float]
     second: Union[int, float]
 
+    def copy(self) -> "Time":
+        """複製したオブジェクトを返す.
+
+        Returns
+        -------
+        Time
+            複製したオブジェクト
+        """
+        return Time(self.year, self.month, self.day, self.hour, self.minute, self.second)
+
+
+def time2dict(time: Optional[Union[Time, NTime]]) -> Optional[dict[str, Union[int, float]]]:
+    """時間オブジェクトを返却用のdict型に変換する.
+
+    Parameters
+    ----------
+    time : Optional[Union[Time, NTime]]
+        変換対象の時間オブジェクト
+
+    Returns
+    -------
+    Optional[dict[str, Union[int, float]]]
+        年・月・日・時・分・秒をKeyとするdict（timeがNoneの場合はNone）
+    """
+    if time is None:
+        return None
+
+    return {"year": time.year, "month": time.month, "day": time.day,
+            "hour": time.hour, "minute": time.minute, "second": time.second}
+
+
+def replace_non_finite(value: Any) -> Any:
+    """JSONで表せない値（無限大・NaN）をNoneに置き換える.
+
+    Parameters
+    ----------
+    value : Any
+        置き換え対象の値（dict・listの場合は要素を再帰的に置き換える）
+
+    Returns
+    -------
+    Any
+        無限大・NaNをNoneに置き換えた値（dict・listの場合は新たなdict・list）
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: replace_non_finite(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [replace_non_finite(v) for v in value]
+
+    return value
+
 
 @dataclass
 class Expression:
@@ -73,11 +143,123 @@ class Expression:
     value_upper_bound_rel: Optional[Time] = None
     options: list[str] = field(default_factory=list)
 
+    def copy(self) -> "Expression":
+        """複製したオブジェクトを返す.
+
+        Returns
+        -------
+        Expression
+            複製したオブジェクト（Timeとoptionsも複製するので、変更しても元のオブジェクトに影響しない）
+        """
+        def copy_value(value: Any) -> Any:
+            return value.copy() if isinstance(value, Time) else value
+
+        return Expression(
+            type=self.type, original_expr=self.original_expr, position_start=self.position_start,
+            position_end=self.position_end, counter=self.counter,
+            value_lower_bound=copy_value(self.value_lower_bound), value_upper_bound=copy_value(self.value_upper_bound),
+            value_lower_bound_abs=copy_value(self.value_lower_bound_abs), value_upper_bound_abs=copy_value(self.value_upper_bound_abs),
+            value_lower_bound_rel=copy_value(self.value_lower_bound_rel), value_upper_bound_rel=copy_value(self.value_upper_bound_rel),
+            options=list(self.options)
+        )
+
+    def to_dict(self) -> ReturnExpressionDict:
+        """返却用のdict型に変換する.
+
+        Returns
+        -------
+        ReturnExpressionDict
+            dataclasses.asdictと同じ内容のdict（値を再帰的に複製せずに直接作成する）
+        """
+        def conv_value(value: Optional[Union[int, float, Time]]) -> Any:
+            return time2dict(value) if isinstance(value, Time) else value
+
+        return {
+            "type": self.type, "original_expr": self.original_expr,
+            "position_start": self.position_start, "position_end": self.position_end, "counter": self.counter,
+            "value_lower_bound": conv_value(self.value_lower_bound), "value_upper_bound": conv_value(self.value_upper_bound),
+            "value_lower_bound_abs": time2dict(self.value_lower_bound_abs), "value_upper_bound_abs": time2dict(self.value_upper_bound_abs),
+            "value_lower_bound_rel": time2dict(self.value_lower_bound_rel), "value_upper_bound_rel": time2dict(self.value_upper_bound_rel),
+            "options": list(self.options)
+        }
+
+    def estimate_size(self) -> int:
+        """おおよそのメモリ使用量を返す.
+
+        Returns
+        -------
+        int
+            オブジェクト本体と文字列・Time・optionsのバイト数の合計
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.__dict__) + sys.getsizeof(self.original_expr) \
+            + sys.getsizeof(self.counter) + sys.getsizeof(self.options)
+        for value in [self.value_lower_bound, self.value_upper_bound, self.value_lower_bound_abs,
+                      self.value_upper_bound_abs, self.value_lower_bound_rel, self.value_upper_bound_rel]:
+            if isinstance(value, Time):
+                size += sys.getsizeof(value) + sys.getsizeof(value.__dict__)
+
+        return size
+
+
+# 抽出・正規化できる表現種別
+EXPRESSION_TYPES = ("numerical", "abstime", "reltime", "duration")
+
+# 表現種別ごとのノーマライザのクラス
+NORMALIZER_CLASSES: dict[str, type[BaseNormalizer]] = {
+    "numerical": NumericalExpressionNormalizer,
+    "abstime": AbstimeExpressionNormalizer,
+    "reltime": ReltimeExpressionNormalizer,
+    "duration": DurationExpressionNormalizer
+}
+
+# 並列処理のワーカープロセスで利用するインスタンスと設定
+worker_normalizer: Optional["NormalizeNumexp"] = None
+worker_as_dict: bool = False
+worker_types: Optional[tuple[str, ...]] = None
+
+
+def init_worker(normalizer: "NormalizeNumexp", as_dict: bool, types: Optional[tuple[str, ...]] = None) -> None:
+    """並列処理のワーカープロセスを初期化する.
+
+    Parameters
+    ----------
+    normalizer : NormalizeNumexp
+        親プロセスで構築済みのインスタンス（forkの場合はコピーされずに共有される）
+    as_dict : bool
+        dict型で結果を返すかどうか
+    types : Optional[tuple[str, ...]], optional
+        抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+    """
+    global worker_normalizer, worker_as_dict, worker_types
+    worker_normalizer = normalizer
+    worker_as_dict = as_dict
+    worker_types = types
+
+
+def normalize_in_worker(text: str) -> Union[list["Expression"], list[ReturnExpressionDict]]:
+    """ワーカープロセスで数値表現の抽出・正規化を行う.
+
+    Parameters
+    ----------
+    text : str
+        抽出対象のテキスト
+
+    Returns
+    -------
+    Union[list[Expression], list[ReturnExpressionDict]]
+        抽出・正規化した数値表現
+    """
+    if worker_normalizer is None:
+        raise RuntimeError("Worker process is not initialized")
+
+    return worker_normalizer.normalize(text, as_dict=worker_as_dict, types=worker_types)
+
 
 class NormalizeNumexp(object):
     """各種数値表現の抽出・正規化を行うクラス."""
 
-    def __init__(self, language: str, custom_dict_file: Optional[str] = None) -> None:
+    def __init__(self, language: str, custom_dict_file: Optional[str] = None, result_cache: Optional[ResultCache] = None,
+                 types: Optional[Iterable[str]] = None) -> None:
         """コンストラクタ.
 
         Parameters
@@ -86,16 +268,385 @@ class NormalizeNumexp(object):
             利用する言語（ja）
         custom_dict_file : Optional[str]
             カスタム辞書のファイルパス, default None
+        result_cache : Optional[ResultCache]
+            テキストごとの抽出・正規化結果を保持するキャッシュ（Noneの場合はキャッシュしない）, default None
+        types : Optional[Iterable[str]]
+            抽出対象の表現種別（numerical, abstime, reltime, durationのいずれか。Noneの場合はすべて）, default None
+
+        Raises
+        ------
+        ValueError
+            typesに不正な表現種別が含まれている場合
+
+        Notes
+        -----
+            * result_cacheを指定すると、同じテキストが繰り返し入力される場合に2回目以降の抽出・正規化を省略する
+            * typesを指定すると、指定した表現種別のノーマライザと辞書だけを読み込む
+            * 各ノーマライザと辞書は初めて利用する時に読み込む（事前に読み込んでおく場合はwarmupを呼ぶ）
+        """
+        self.types = self.validate_types(types) if types is not None else EXPRESSION_TYPES
+
+        self.dict_loader = DictLoader(language, custom_dict_file)
+
+        # 各ノーマライザは初めて利用する時に作成する（作成するまではNone。同名のプロパティから参照すると作成する）
+        self._number_normalizer: Optional[NumberNormalizer] = None
+        self._numerical_expr_normalizer: Optional[NumericalExpressionNormalizer] = None
+        self._abstime_expr_normalizer: Optional[AbstimeExpressionNormalizer] = None
+        self._reltime_expr_normalizer: Optional[ReltimeExpressionNormalizer] = None
+        self._duration_expr_normalizer: Optional[DurationExpressionNormalizer] = None
+        self._inappropriate_expr_remover: Optional[InappropriateExpressionRemover] = None
+
+        self.profiler: Optional[StageProfiler] = None
+
+        # 結果のキャッシュを他のインスタンスと共有しても結果が混ざらないよう、言語やカスタム辞書の内容をキーに含める
+        # （キーの計算にはカスタム辞書全体のハッシュ化が必要なので、キャッシュを使う場合のみ計算する）
+        self.result_cache = result_cache
+        self.result_cache_key = self.dict_loader.make_cache_key(self.__class__.__name__) if result_cache is not None else ""
+
+        # 数値表現を含み得ないテキストを事前に判定するための正規表現（Key：抽出対象の表現種別）と、判定結果の集計
+        self.trigger_regs: dict[tuple[str, ...], re.Pattern[str]] = {}
+        self.num_texts = 0
+        self.num_skipped_texts = 0
+
+    def validate_types(self, types: Iterable[str]) -> tuple[str, ...]:
+        """抽出対象の表現種別を検証し、EXPRESSION_TYPESの順に並べる.
+
+        Parameters
+        ----------
+        types : Iterable[str]
+            抽出対象の表現種別
+
+        Returns
+        -------
+        tuple[str, ...]
+            重複を除いてEXPRESSION_TYPESの順に並べた表現種別
+
+        Raises
+        ------
+        ValueError
+            不正な表現種別が含まれている場合
+        """
+        # 表現種別を1つだけ文字列で指定した場合は、その表現種別のみとみなす
+        types = {types} if isinstance(types, str) else set(types)
+        for expr_type in types:
+            if expr_type not in EXPRESSION_TYPES:
+                raise ValueError(f'Invalid type: "{expr_type}"')
+
+        return tuple(expr_type for expr_type in EXPRESSION_TYPES if expr_type in types)
+
+    @property
+    def number_normalizer(self) -> NumberNormalizer:
+        """数値の抽出・正規化を行うノーマライザ（未作成の場合は作成する）."""
+        return self.get_number_normalizer()
+
+    @property
+    def numerical_expr_normalizer(self) -> NumericalExpressionNormalizer:
+        """数量表現のノーマライザ（未作成の場合は辞書を読み込んで作成する）."""
+        return cast(NumericalExpressionNormalizer, self.get_normalizer("numerical"))
+
+    @property
+    def abstime_expr_normalizer(self) -> AbstimeExpressionNormalizer:
+        """絶対時間表現のノーマライザ（未作成の場合は辞書を読み込んで作成する）."""
+        return cast(AbstimeExpressionNormalizer, self.get_normalizer("abstime"))
+
+    @property
+    def reltime_expr_normalizer(self) -> ReltimeExpressionNormalizer:
+        """相対時間表現のノーマライザ（未作成の場合は辞書を読み込んで作成する）."""
+        return cast(ReltimeExpressionNormalizer, self.get_normalizer("reltime"))
+
+    @property
+    def duration_expr_normalizer(self) -> DurationExpressionNormalizer:
+        """期間表現のノーマライザ（未作成の場合は辞書を読み込んで作成する）."""
+        return cast(DurationExpressionNormalizer, self.get_normalizer("duration"))
+
+    @property
+    def inappropriate_expr_remover(self) -> InappropriateExpressionRemover:
+        """不適切な数値表現を削除するオブジェクト（未作成の場合は作成する）."""
+        return self.get_inappropriate_expr_remover()
+
+    def get_number_normalizer(self) -> NumberNormalizer:
+        """数値の抽出・正規化を行うノーマライザを取得する（未作成の場合は作成する）.
+
+        Returns
+        -------
+        NumberNormalizer
+            数値の抽出・正規化を行うノーマライザ
+        """
+        if self._number_normalizer is None:
+            self._number_normalizer = NumberNormalizer(self.dict_loader)
+            self.instrument_loaded_object(self._number_normalizer)
+
+        return self._number_normalizer
+
+    def get_inappropriate_expr_remover(self) -> InappropriateExpressionRemover:
+        """不適切な数値表現を削除するオブジェクトを取得する（未作成の場合は作成する）.
+
+        Returns
+        -------
+        InappropriateExpressionRemover
+            不適切な数値表現を削除するオブジェクト
+        """
+        if self._inappropriate_expr_remover is None:
+            self._inappropriate_expr_remover = InappropriateExpressionRemover(self.dict_loader)
+            self.instrument_loaded_object(self._inappropriate_expr_remover)
+
+        return self._inappropriate_expr_remover
+
+    def get_normalizer(self, expr_type: str) -> BaseNormalizer:
+        """表現種別のノーマライザを取得する（未作成の場合は辞書を読み込んで作成する）.
+
+        Parameters
+        ----------
+        expr_type : str
+            表現種別（numerical, abstime, reltime, duration）
+
+        Returns
+        -------
+        BaseNormalizer
+            表現種別のノーマライザ
+
+        Raises
+        ------
+        ValueError
+            インスタンス生成時に指定していない表現種別の場合
+        """
+        if expr_type not in self.types:
+            raise ValueError(f'Type is not loaded: "{expr_type}"')
+
+        normalizer = self.get_loaded_normalizers().get(expr_type)
+        if normalizer is None:
+            # 数値の抽出・正規化の辞書や変換結果のキャッシュを共有するよう、同じNumberNormalizerを渡す
+            normalizer = NORMALIZER_CLASSES[expr_type](self.dict_loader, self.get_number_normalizer())
+            setattr(self, f"_{expr_type}_expr_normalizer", normalizer)
+            self.instrument_loaded_object(normalizer)
+
+        return normalizer
+
+    def get_normalizers(self, types: Optional[tuple[str, ...]] = None) -> dict[str, BaseNormalizer]:
+        """表現種別ごとのノーマライザを取得する（未作成の場合は作成する）.
+
+        Parameters
+        ----------
+        types : Optional[tuple[str, ...]], optional
+            取得する表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        dict[str, BaseNormalizer]
+            表現種別（numerical, abstime, reltime, duration）ごとのノーマライザ
+        """
+        if types is None:
+            types = self.types
+
+        return {expr_type: self.get_normalizer(expr_type) for expr_type in types}
+
+    def get_loaded_normalizers(self) -> dict[str, BaseNormalizer]:
+        """作成済みの表現種別ごとのノーマライザを取得する.
+
+        Returns
+        -------
+        dict[str, BaseNormalizer]
+            表現種別（numerical, abstime, reltime, duration）ごとのノーマライザ（作成済みのもののみ）
+        """
+        normalizers: dict[str, Optional[BaseNormalizer]] = {
+            "numerical": self._numerical_expr_normalizer,
+            "abstime": self._abstime_expr_normalizer,
+            "reltime": self._reltime_expr_normalizer,
+            "duration": self._duration_expr_normalizer
+        }
+
+        return {expr_type: normalizer for expr_type, normalizer in normalizers.items() if normalizer is not None}
+
+    def warmup(self, types: Optional[Iterable[str]] = None) -> None:
+        """ノーマライザの作成と辞書の読み込みを事前に行う.
+
+        Parameters
+        ----------
+        types : Optional[Iterable[str]], optional
+            読み込む表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Raises
+        ------
+        ValueError
+            typesに不正な表現種別や、インスタンス生成時に指定していない表現種別が含まれている場合
+
+        Notes
+        -----
+            サーバーでワーカープロセスをforkする前などに呼ぶと、読み込み済みの辞書をワーカープロセスと共有できる
+        """
+        selected_types = self.select_types(types)
+
+        self.get_number_normalizer()
+        self.get_inappropriate_expr_remover()
+        self.get_normalizers(selected_types)
+        self.get_trigger_reg(selected_types)
+
+    def get_trigger_reg(self, types: tuple[str, ...]) -> re.Pattern[str]:
+        """数値表現を含み得るテキストかどうかを判定する正規表現を取得する（未作成の場合は作成する）.
+
+        Parameters
+        ----------
+        types : tuple[str, ...]
+            抽出対象の表現種別
+
+        Returns
+        -------
+        re.Pattern[str]
+            抽出対象の表現種別についての判定用の正規表現
+        """
+        trigger_reg = self.trigger_regs.get(types)
+        if trigger_reg is None:
+            trigger_reg = self.build_trigger_reg(types)
+            self.trigger_regs[types] = trigger_reg
+
+        return trigger_reg
+
+    def build_trigger_reg(self, types: tuple[str, ...]) -> re.Pattern[str]:
+        """数値表現を含み得るテキストかどうかを判定する正規表現を作成する.
+
+        Parameters
+        ----------
+        types : tuple[str, ...]
+            抽出対象の表現種別
+
+        Returns
+        -------
+        re.Pattern[str]
+            数字（アラビア数字・漢数字）か、数値を含まなくても抽出されるパターン（「今日」など）にマッチする正規表現
+        """
+        patterns = [self.get_number_normalizer().digit_utility.number_chars_reg.pattern]
+        for normalizer in self.get_normalizers(types).values():
+            patterns += [re.escape(pattern) for pattern in normalizer.get_patterns_without_number()]
+
+        return re.compile("|".join(patterns))
+
+    def may_contain_expression(self, text: str, types: Optional[Iterable[str]] = None) -> bool:
+        """テキストが数値表現を含み得るかどうかを判定する.
+
+        Parameters
+        ----------
+        text : str
+            判定対象のテキスト
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        bool
+            True：数値表現を含み得る、False：数値表現を含まない（抽出結果が必ず空になる）
+        """
+        return self.get_trigger_reg(self.select_types(types)).search(text) is not None
+
+    def get_prefilter_stats(self) -> PrefilterStatDict:
+        """事前判定の集計結果を取得する.
+
+        Returns
+        -------
+        PrefilterStatDict
+            normalizeで処理したテキスト数と、そのうち数値表現を含まないと判定して処理を省略したテキスト数
+
+        Notes
+        -----
+            normalize_parallelのワーカープロセスで処理したテキストは集計されない
+        """
+        return PrefilterStatDict(total=self.num_texts, skipped=self.num_skipped_texts)
+
+    def reset_prefilter_stats(self) -> None:
+        """事前判定の集計結果を初期化する."""
+        self.num_texts = 0
+        self.num_skipped_texts = 0
+
+    def get_profiling_targets(self) -> list[tuple[object, dict[str, str], str]]:
+        """処理時間の計測対象を取得する.
+
+        Returns
+        -------
+        list[tuple[object, dict[str, str], str]]
+            計測対象のオブジェクト、メソッド名ごとの段階名、段階名の前に付ける名前のタプルのリスト（作成済みのノーマライザのみ）
+        """
+        targets: list[tuple[object, dict[str, str], str]] = [
+            (self, {"normalize": "total", "may_contain_expression": "prefilter", "merge_expressions": "merge",
+                    "serialize_expressions": "serialize"}, "normalize")
+        ]
+        if self._number_normalizer is not None:
+            targets.append((self._number_normalizer, {"process_all": "number_extraction"}, "normalize"))
+        if self._inappropriate_expr_remover is not None:
+            targets.append((self._inappropriate_expr_remover,
+                            {"remove_inappropriate_extraction": "inappropriate_removal"}, "normalize"))
+        targets += [(normalizer, normalizer.profiling_stages, name) for name, normalizer in self.get_loaded_normalizers().items()]
+
+        return targets
+
+    def instrument_loaded_object(self, obj: object) -> None:
+        """計測中に新たに作成したノーマライザなどを計測対象にする.
+
+        Parameters
+        ----------
+        obj : object
+            新たに作成したオブジェクト
+        """
+        if self.profiler is None:
+            return
+
+        for target, stages, prefix in self.get_profiling_targets():
+            if target is obj:
+                self.profiler.instrument(target, stages, prefix)
+
+    def enable_profiling(self, profiler: Optional[StageProfiler] = None) -> StageProfiler:
+        """段階ごとの処理時間の計測を開始する.
+
+        Parameters
+        ----------
+        profiler : Optional[StageProfiler], optional
+            計測結果を集計するオブジェクト（Noneの場合は新たに作成する）, by default None
+
+        Returns
+        -------
+        StageProfiler
+            計測結果を集計するオブジェクト（get_statsで「normalize.total」や「numerical.limited_expression」などの段階ごとの集計結果を取得できる）
+
+        Notes
+        -----
+            normalize_parallelのワーカープロセスでの計測結果は集計されない
         """
-        dict_loader = DictLoader(language, custom_dict_file)
+        self.disable_profiling()
 
-        self.numerical_expr_normalizer = NumericalExpressionNormalizer(dict_loader)
-        self.abstime_expr_normalizer = AbstimeExpressionNormalizer(dict_loader)
-        self.reltime_expr_normalizer = ReltimeExpressionNormalizer(dict_loader)
-        self.duration_expr_normalizer = DurationExpressionNormalizer(dict_loader)
-        self.inappropriate_expr_remover = InappropriateExpressionRemover(dict_loader)
+        self.profiler = profiler if profiler is not None else StageProfiler()
+        for obj, stages, prefix in self.get_profiling_targets():
+            self.profiler.instrument(obj, stages, prefix)
 
-    def normalize(self, text: str, as_dict: bool = False) -> Union[list[Expression], list[ReturnExpressionDict]]:
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """段階ごとの処理時間の計測を終了する."""
+        if self.profiler is None:
+            return
+
+        for obj, stages, _ in self.get_profiling_targets():
+            self.profiler.uninstrument(obj, stages)
+        self.profiler = None
+
+    @contextmanager
+    def profile(self, profiler: Optional[StageProfiler] = None) -> Iterator[StageProfiler]:
+        """withブロック内の処理について段階ごとの処理時間を計測する.
+
+        Parameters
+        ----------
+        profiler : Optional[StageProfiler], optional
+            計測結果を集計するオブジェクト（Noneの場合は新たに作成する）, by default None
+
+        Yields
+        ------
+        StageProfiler
+            計測結果を集計するオブジェクト
+        """
+        try:
+            yield self.enable_profiling(profiler)
+        finally:
+            self.disable_profiling()
+
+    def normalize(self, text: str, as_dict: bool = False, types: Optional[Iterable[str]] = None) \
+            -> Union[list[Expression], list[ReturnExpressionDict]]:
         """各種数値表現の抽出・正規化を行う.
 
         Parameters
@@ -104,32 +655,396 @@ class NormalizeNumexp(object):
             抽出対象のテキスト
         as_dict : bool, optional
             dict型で結果を返すかどうか（デフォルト：False＝dict型にしない）
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
 
         Returns
         -------
         Union[list[Expression], list[ReturnExpressionDict]]
             抽出・正規化した数値表現
+
+        Raises
+        ------
+        ValueError
+            typesに不正な表現種別や、インスタンス生成時に指定していない表現種別が含まれている場合
+
+        Notes
+        -----
+            異なる表現種別間の重複の削除は抽出対象の表現種別の間でのみ行うので、
+            すべての表現種別を抽出した結果を表現種別で絞り込んだものとは異なる場合がある
         """
-        # 各normalizerで数値表現の抽出・正規化を行う
-        numerical_exprs = cast(list[NumericalExpression], self.numerical_expr_normalizer.process(text))
-        abstime_exprs = cast(list[AbstimeExpression], self.abstime_expr_normalizer.process(text))
-        reltime_exprs = cast(list[ReltimeExpression], self.reltime_expr_normalizer.process(text))
-        duration_exprs = cast(list[DurationExpression], self.duration_expr_normalizer.process(text))
+        selected_types = self.select_types(types)
 
-        # 不適切な数値表現を削除する
-        numerical_exprs, abstime_exprs, reltime_exprs, duration_exprs \
-            = self.inappropriate_expr_remover.remove_inappropriate_extraction(
-                text, numerical_exprs, abstime_exprs, reltime_exprs, duration_exprs)
+        self.num_texts += 1
+        if not self.may_contain_expression(text, selected_types):
+            # 数字も数値を含まないパターンもなければ何も抽出されないので、以降の処理を省略する
+            self.num_skipped_texts += 1
+            return []
 
-        # 統一的な数値表現オブジェクトに変換する
-        exprs = self.merge_expressions(numerical_exprs, abstime_exprs, reltime_exprs, duration_exprs)
+        if self.result_cache is None:
+            if as_dict:
+                # Expressionオブジェクトを経由せずに、抽出した数値表現から直接dict型に変換する
+                return self.serialize_expressions(*self.extract_normalized_expressions(text, selected_types))
+            return self.extract_expressions(text, selected_types)
+
+        cache_key = (self.result_cache_key, selected_types, text)
+        cached_exprs = self.result_cache.get(cache_key)
+        if cached_exprs is None:
+            exprs = self.extract_expressions(text, selected_types)
+            size = sys.getsizeof(text) + sum(expr.estimate_size() for expr in exprs)
+            # 呼び出し側で結果を変更してもキャッシュに影響しないよう、呼び出し側に返すものとは別のオブジェクトをキャッシュする
+            self.result_cache.put(cache_key, exprs if as_dict else [expr.copy() for expr in exprs], size)
+        else:
+            exprs = cached_exprs if as_dict else [expr.copy() for expr in cached_exprs]
 
         if as_dict:
-            # asdictでdataclassオブジェクトをdict型に変換する
-            return [cast(ReturnExpressionDict, asdict(expr)) for expr in exprs]
+            # to_dictは新たなdictを作成するので、キャッシュしているオブジェクトを複製する必要はない
+            return [expr.to_dict() for expr in exprs]
 
         return exprs
 
+    def normalize_json(self, text: str, types: Optional[Iterable[str]] = None) -> bytes:
+        """各種数値表現の抽出・正規化を行い、結果をJSON形式のバイト列で返す.
+
+        Parameters
+        ----------
+        text : str
+            抽出対象のテキスト
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        bytes
+            normalize(as_dict=True)の結果をUTF-8でエンコードしたJSON（配列）
+
+        Notes
+        -----
+            無限大の値（時間の未指定の要素や、浮動小数点数で表せない大きさの数値）はnullとして出力する
+        """
+        return self.dumps_json(self.normalize(text, as_dict=True, types=types))
+
+    def dumps_json(self, result: Union[list[Expression], list[ReturnExpressionDict]]) -> bytes:
+        """抽出・正規化した結果をJSON形式のバイト列に変換する.
+
+        Parameters
+        ----------
+        result : Union[list[Expression], list[ReturnExpressionDict]]
+            normalizeの結果
+
+        Returns
+        -------
+        bytes
+            UTF-8でエンコードしたJSON（配列）
+
+        Notes
+        -----
+            標準のJSONにはInfinity・NaNがないので、無限大・NaNの値はnullとして出力する
+        """
+        dicts = [replace_non_finite(expr.to_dict() if isinstance(expr, Expression) else expr) for expr in result]
+
+        return json.dumps(dicts, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def select_types(self, types: Optional[Iterable[str]]) -> tuple[str, ...]:
+        """normalizeで抽出対象にする表現種別を決める.
+
+        Parameters
+        ----------
+        types : Optional[Iterable[str]]
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）
+
+        Returns
+        -------
+        tuple[str, ...]
+            EXPRESSION_TYPESの順に並べた抽出対象の表現種別
+
+        Raises
+        ------
+        ValueError
+            不正な表現種別や、インスタンス生成時に指定していない表現種別が含まれている場合
+        """
+        if types is None:
+            return self.types
+
+        selected_types = self.validate_types(types)
+        for expr_type in selected_types:
+            if expr_type not in self.types:
+                raise ValueError(f'Type is not loaded: "{expr_type}"')
+
+        return selected_types
+
+    def extract_expressions(self, text: str, types: Optional[tuple[str, ...]] = None) -> list[Expression]:
+        """各種数値表現の抽出・正規化を行う（キャッシュや事前判定を使わない）.
+
+        Parameters
+        ----------
+        text : str
+            抽出対象のテキスト
+        types : Optional[tuple[str, ...]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        list[Expression]
+            抽出・正規化した数値表現
+        """
+        # 統一的な数値表現オブジェクトに変換する
+        return self.merge_expressions(*self.extract_normalized_expressions(text, types))
+
+    def extract_normalized_expressions(self, text: str, types: Optional[tuple[str, ...]] = None) \
+            -> tuple[list[NumericalExpression], list[AbstimeExpression], list[ReltimeExpression], list[DurationExpression]]:
+        """各種数値表現の抽出・正規化と不適切な数値表現の削除を行う.
+
+        Parameters
+        ----------
+        text : str
+            抽出対象のテキスト
+        types : Optional[tuple[str, ...]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        tuple[list[NumericalExpression], list[AbstimeExpression], list[ReltimeExpression], list[DurationExpression]]
+            表現種別ごとの抽出・正規化した数値表現（抽出対象でない表現種別は空のリスト）
+        """
+        if types is None:
+            types = self.types
+        normalizers = self.get_normalizers(types)
+
+        # 数値の抽出は全normalizerで共通なので1度だけ行う
+        extracted_numbers = self.get_number_normalizer().process_all(text)
+
+        # 抽出対象の表現種別のnormalizerでのみ数値表現の抽出・正規化を行う
+        exprs_by_type: dict[str, list[NormalizedExpression]] = {expr_type: [] for expr_type in EXPRESSION_TYPES}
+        for expr_type in types:
+            exprs_by_type[expr_type] = normalizers[expr_type].process(text, extracted_numbers)
+        numerical_exprs = cast(list[NumericalExpression], exprs_by_type["numerical"])
+        abstime_exprs = cast(list[AbstimeExpression], exprs_by_type["abstime"])
+        reltime_exprs = cast(list[ReltimeExpression], exprs_by_type["reltime"])
+        duration_exprs = cast(list[DurationExpression], exprs_by_type["duration"])
+
+        # 不適切な数値表現を削除する
+        return self.get_inappropriate_expr_remover().remove_inappropriate_extraction(
+            text, numerical_exprs, abstime_exprs, reltime_exprs, duration_exprs)
+
+    def normalize_batch(self, texts: Iterable[str], as_dict: bool = False, types: Optional[Iterable[str]] = None) \
+            -> Union[list[list[Expression]], list[list[ReturnExpressionDict]]]:
+        """複数のテキストに対して各種数値表現の抽出・正規化をまとめて行う.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            抽出対象のテキスト群
+        as_dict : bool, optional
+            dict型で結果を返すかどうか（デフォルト：False＝dict型にしない）
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        Union[list[list[Expression]], list[list[ReturnExpressionDict]]]
+            テキストごとの抽出・正規化した数値表現（入力と同じ順序）
+
+        Notes
+        -----
+            * 表現種別の検証、ノーマライザと事前判定用の正規表現の取得はバッチ全体で1度だけ行う
+            * 同じテキストがバッチ内に複数回現れる場合、数値表現の抽出・正規化は1度だけ行い、結果のオブジェクトはテキストごとに作成する
+            * 結果のキャッシュを使う場合や処理時間を計測している場合は、テキストごとにnormalizeを呼ぶ
+            * 数値表現を含まないと判定して処理を省略したテキスト数はget_prefilter_statsで取得できる
+        """
+        selected_types = self.select_types(types)
+        if self.result_cache is not None or self.profiler is not None:
+            results = [self.normalize(text, as_dict=as_dict, types=selected_types) for text in texts]
+            return cast(Union[list[list[Expression]], list[list[ReturnExpressionDict]]], results)
+
+        trigger_reg = self.get_trigger_reg(selected_types)
+        self.get_normalizers(selected_types)
+        convert_expressions = self.serialize_expressions if as_dict else self.merge_expressions
+
+        # 抽出・正規化した数値表現（Key：テキスト）。merge_expressionsやserialize_expressionsは元の数値表現を変更しないので使い回せる
+        extracted_exprs: dict[str, tuple[list[NumericalExpression], list[AbstimeExpression],
+                                         list[ReltimeExpression], list[DurationExpression]]] = {}
+        batch_results: list[Any] = []
+        for text in texts:
+            self.num_texts += 1
+            if trigger_reg.search(text) is None:
+                self.num_skipped_texts += 1
+                batch_results.append([])
+                continue
+
+            normalized_exprs = extracted_exprs.get(text)
+            if normalized_exprs is None:
+                normalized_exprs = self.extract_normalized_expressions(text, selected_types)
+                extracted_exprs[text] = normalized_exprs
+            batch_results.append(convert_expressions(*normalized_exprs))
+
+        return cast(Union[list[list[Expression]], list[list[ReturnExpressionDict]]], batch_results)
+
+    def normalize_columns(self, texts: Iterable[str], types: Optional[Iterable[str]] = None) -> "ExpressionColumns":
+        """複数のテキストに対して各種数値表現の抽出・正規化を行い、結果を列形式で返す.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            抽出対象のテキスト群
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Returns
+        -------
+        ExpressionColumns
+            全テキストの数値表現を列ごとの配列にまとめたもの（doc_indexはテキストの入力中の順番）
+
+        Notes
+        -----
+            テキストごとの結果は列に追加したら破棄するので、大量のテキストの結果を少ないメモリで保持できる
+        """
+        from .expression_columns import ExpressionColumns
+
+        selected_types = self.select_types(types)
+        columns = ExpressionColumns()
+        for doc_index, text in enumerate(texts):
+            for expr in cast(list[Expression], self.normalize(text, types=selected_types)):
+                columns.append(doc_index, expr)
+
+        return columns
+
+    def normalize_iter(self, documents: Iterable[Union[str, tuple[Any, str]]], as_dict: bool = False, prefetch: int = 0,
+                       types: Optional[Iterable[str]] = None) \
+            -> Iterator[tuple[Any, Union[list[Expression], list[ReturnExpressionDict]]]]:
+        """テキストを1件ずつ読み込みながら各種数値表現の抽出・正規化を行う.
+
+        Parameters
+        ----------
+        documents : Iterable[Union[str, tuple[Any, str]]]
+            抽出対象のテキスト、または(ID, テキスト)のタプルのイテラブル
+        as_dict : bool, optional
+            dict型で結果を返すかどうか（デフォルト：False＝dict型にしない）
+        prefetch : int, optional
+            別スレッドで先読みしておくテキストの最大数（0の場合は先読みしない）, by default 0
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Yields
+        ------
+        tuple[Any, Union[list[Expression], list[ReturnExpressionDict]]]
+            IDと抽出・正規化した数値表現のタプル（テキストのみが渡された場合のIDは入力中の順番）
+
+        Notes
+        -----
+            * 入力は必要な分だけ読み込み、結果は1件処理するごとに返すので、コーパス全体や結果全体をメモリに保持しない
+            * ファイルの読み込みなどが重い場合はprefetchを指定すると、読み込みと抽出・正規化を並行して行える
+        """
+        if prefetch < 0:
+            raise ValueError(f'Invalid prefetch: "{prefetch}"')
+        selected_types = self.select_types(types)
+        if prefetch > 0:
+            documents = self.prefetch_documents(documents, prefetch)
+
+        for i, document in enumerate(documents):
+            if isinstance(document, str):
+                doc_id, text = i, document
+            else:
+                doc_id, text = document
+
+            yield doc_id, self.normalize(text, as_dict=as_dict, types=selected_types)
+
+    def prefetch_documents(self, documents: Iterable[Union[str, tuple[Any, str]]], prefetch: int) \
+            -> Iterator[Union[str, tuple[Any, str]]]:
+        """別スレッドでテキストを先読みしながら1件ずつ返す.
+
+        Parameters
+        ----------
+        documents : Iterable[Union[str, tuple[Any, str]]]
+            先読みするテキスト、または(ID, テキスト)のタプルのイテラブル
+        prefetch : int
+            先読みしておくテキストの最大数
+
+        Yields
+        ------
+        Union[str, tuple[Any, str]]
+            入力と同じ順序のテキスト、または(ID, テキスト)のタプル
+
+        Notes
+        -----
+            * 読み込み中に発生した例外は呼び出し元に送出する
+            * 呼び出し元が途中で読み込みをやめた場合は、先読み用のスレッドも終了させる
+        """
+        prefetcher = Prefetcher(documents, prefetch)
+        prefetcher.start()
+        try:
+            yield from prefetcher.iter_items()
+        finally:
+            prefetcher.stop()
+
+    def normalize_parallel(self, texts: Iterable[str], as_dict: bool = False, workers: Optional[int] = None,
+                           chunksize: int = 16, types: Optional[Iterable[str]] = None) \
+            -> Iterator[Union[list[Expression], list[ReturnExpressionDict]]]:
+        """複数のテキストに対して各種数値表現の抽出・正規化を複数プロセスで並列に行う.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            抽出対象のテキスト群
+        as_dict : bool, optional
+            dict型で結果を返すかどうか（デフォルト：False＝dict型にしない）
+        workers : Optional[int], optional
+            ワーカープロセス数（Noneの場合はCPU数）, by default None
+        chunksize : int, optional
+            ワーカープロセスにまとめて渡すテキストの数, by default 16
+        types : Optional[Iterable[str]], optional
+            抽出対象の表現種別（Noneの場合はインスタンス生成時に指定したすべての表現種別）, by default None
+
+        Yields
+        ------
+        Union[list[Expression], list[ReturnExpressionDict]]
+            テキストごとの抽出・正規化した数値表現（入力と同じ順序）
+
+        Notes
+        -----
+            * forkが使える環境では構築済みの辞書やノーマライザをコピーせずにワーカープロセスと共有する
+            * fork前にgc.freezeで構築済みのオブジェクトをGCの対象から外し、ワーカープロセスでのGCによるメモリページのコピーを防ぐ
+            * forkが使えない環境ではspawnでワーカープロセスを生成し、このインスタンスをpickle化して渡す
+            * 処理時間を計測中の場合は、ワーカープロセスの生成中だけ計測用のラッパーを外す（ワーカープロセスでの処理は計測されない）
+            * workersが1の場合はプロセスを生成せずにこのプロセスで処理する
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f'Invalid workers: "{workers}"')
+        selected_types = self.select_types(types)
+
+        if workers == 1:
+            for text in texts:
+                yield self.normalize(text, as_dict=as_dict, types=selected_types)
+            return
+
+        context: multiprocessing.context.BaseContext
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context("spawn")
+
+        # ワーカープロセスごとに辞書を読み込まないよう、fork前に読み込んでおく
+        self.warmup(selected_types)
+
+        # 計測用のラッパーはpickle化できず、ワーカープロセスでの計測結果も集計されないので、ワーカープロセスの生成中は外しておく
+        profiler = self.profiler
+        self.disable_profiling()
+
+        gc.collect()
+        gc.freeze()
+        try:
+            pool = context.Pool(workers, initializer=init_worker, initargs=(self, as_dict, selected_types))
+        finally:
+            # ワーカープロセスの生成後は親プロセスのGCと計測を元に戻す
+            gc.unfreeze()
+            if profiler is not None:
+                self.enable_profiling(profiler)
+
+        with pool:
+            yield from pool.imap(normalize_in_worker, texts, chunksize=chunksize)
+
     def merge_expressions(self, numerical_exprs: list[NumericalExpression], abstime_exprs: list[AbstimeExpression],
                           reltime_exprs: list[ReltimeExpression], duration_exprs: list[DurationExpression]) \
             -> list[Expression]:
@@ -217,6 +1132,85 @@ class NormalizeNumexp(object):
 
         return list(sorted(total_exprs, key=lambda x: x.position_start))
 
+    def serialize_expressions(self, numerical_exprs: list[NumericalExpression], abstime_exprs: list[AbstimeExpression],
+                              reltime_exprs: list[ReltimeExpression], duration_exprs: list[DurationExpression]) \
+            -> list[ReturnExpressionDict]:
+        """抽出した各種数値表現を返却用のdict型に直接変換する.
+
+        Parameters
+        ----------
+        numerical_exprs : list[NumericalExpression]
+            数量表現
+        abstime_exprs : list[AbstimeExpression]
+            絶対時間表現
+        reltime_exprs : list[ReltimeExpression]
+            相対時間表現
+        duration_exprs : list[DurationExpression]
+            期間表現
+
+        Returns
+        -------
+        list[ReturnExpressionDict]
+            変換後の数値表現（merge_expressionsの結果をdataclasses.asdictで変換したものと同じ内容）
+
+        Notes
+        -----
+            ExpressionやTimeのオブジェクトを作らず、asdictのような再帰的な複製も行わない
+        """
+        total_exprs: list[ReturnExpressionDict] = []
+
+        for numerical_expr in numerical_exprs:
+            total_exprs.append({
+                "type": "numerical", "original_expr": numerical_expr.original_expr,
+                "position_start": numerical_expr.position_start, "position_end": numerical_expr.position_end,
+                "counter": numerical_expr.counter,
+                "value_lower_bound": numerical_expr.value_lower_bound, "value_upper_bound": numerical_expr.value_upper_bound,
+                "value_lower_bound_abs": None, "value_upper_bound_abs": None,
+                "value_lower_bound_rel": None, "value_upper_bound_rel": None,
+                "options": self.show_options(numerical_expr)
+            })
+
+        for abstime_expr in abstime_exprs:
+            total_exprs.append({
+                "type": "abstime", "original_expr": abstime_expr.original_expr,
+                "position_start": abstime_expr.position_start, "position_end": abstime_expr.position_end,
+                "counter": "none",
+                "value_lower_bound": time2dict(abstime_expr.value_lower_bound),
+                "value_upper_bound": time2dict(abstime_expr.value_upper_bound),
+                "value_lower_bound_abs": None, "value_upper_bound_abs": None,
+                "value_lower_bound_rel": None, "value_upper_bound_rel": None,
+                "options": self.show_options(abstime_expr)
+            })
+
+        for reltime_expr in reltime_exprs:
+            total_exprs.append({
+                "type": "reltime", "original_expr": reltime_expr.original_expr,
+                "position_start": reltime_expr.position_start, "position_end": reltime_expr.position_end,
+                "counter": "none",
+                "value_lower_bound": None,
+                "value_upper_bound": time2dict(reltime_expr.value_upper_bound),
+                "value_lower_bound_abs": time2dict(reltime_expr.value_lower_bound_abs),
+                "value_upper_bound_abs": time2dict(reltime_expr.value_upper_bound_abs),
+                "value_lower_bound_rel": time2dict(reltime_expr.value_lower_bound_rel),
+                "value_upper_bound_rel": time2dict(reltime_expr.value_upper_bound_rel),
+                "options": self.show_options(reltime_expr)
+            })
+
+        for duration_expr in duration_exprs:
+            total_exprs.append({
+                "type": "duration", "original_expr": duration_expr.original_expr,
+                "position_start": duration_expr.position_start, "position_end": duration_expr.position_end,
+                "counter": "none",
+                "value_lower_bound": time2dict(duration_expr.value_lower_bound),
+                "value_upper_bound": time2dict(duration_expr.value_upper_bound),
+                "value_lower_bound_abs": None, "value_upper_bound_abs": None,
+                "value_lower_bound_rel": None, "value_upper_bound_rel": None,
+                "options": self.show_options(duration_expr)
+            })
+
+        # merge_expressionsと同じく、表現種別の順に並べたものを開始位置で安定ソートする
+        return sorted(total_exprs, key=lambda x: x["position_start"])
+
     def show_options(self, expr: NormalizedExpression) -> list[str]:
         """optionsを整理.
 
@@ -1,5 +1,5 @@
 """絶対時間の抽出・正規化処理を定義するモジュール."""
-from copy import deepcopy
+from typing import Optional
 
 from pynormalizenumexp.expression.abstime import AbstimeExpression, AbstimePattern
 from pynormalizenumexp.expression.base import INF, NNumber, NTime, NumberModifier
@@ -15,17 +15,20 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
     limited_expressions: list[AbstimePattern]
     prefix_counters: list[AbstimePattern]
 
-    def __init__(self, dict_loader: DictLoader) -> None:
+    # 絶対時間表現では、前もって記号を処理させない
+    do_fix_symbol = False
+
+    def __init__(self, dict_loader: DictLoader, number_normalizer: Optional[NumberNormalizer] = None) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         dict_loader : DictLoader
             辞書ファイルのローダー
+        number_normalizer : Optional[NumberNormalizer], optional
+            数値の抽出・正規化に使うノーマライザ（Noneの場合は新たに作成する）, by default None
         """
-        super().__init__(dict_loader)
-
-        self.number_normalizer = NumberNormalizer(dict_loader)
+        super().__init__(dict_loader, number_normalizer)
 
         self.load_dictionaries("abstime_expression.json", "abstime_prefix_counter.json",
                                "abstime_prefix.json", "abstime_suffix.json")
@@ -74,7 +77,7 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         list[NNumber]
             抽出した数値表現
         """
-        return self.number_normalizer.process(text, do_fix_symbol=False)
+        return self.number_normalizer.process(text, do_fix_symbol=self.do_fix_symbol)
 
     def numbers2expressions(self, numbers: list[NNumber]) -> list[AbstimeExpression]:  # type: ignore[override]
         """抽出した数値表現を絶対時間表現のオブジェクトに変換する.
@@ -107,7 +110,7 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         AbstimeExpression
             補正後の絶対時間表現
         """
-        new_abstime_expr = deepcopy(abstime_expr)
+        new_abstime_expr = abstime_expr.copy()
         if process_type == "gozen":
             if new_abstime_expr.value_lower_bound.hour == INF:
                 new_abstime_expr.value_lower_bound.hour = 0
@@ -157,7 +160,9 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         list[AbstimeExpression]
             補正済みの絶対時間表現
         """
-        new_exprs = deepcopy(exprs)
+        # 補正する絶対時間表現だけを複製する
+        new_exprs = list(exprs)
+        new_exprs[expr_id] = new_exprs[expr_id].copy()
         final_expr_id = expr_id + matching_expr.total_number_of_place_holder
         new_exprs[expr_id].position_end = new_exprs[final_expr_id].position_end \
             + matching_expr.len_of_after_final_place_holder
@@ -194,7 +199,7 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
             補正済みの絶対時間表現
         """
         # 一致したパターンに応じて、規格化を行う（数字の前側に単位等が来る場合。絶対時間表現の場合「西暦」など）
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if matching_expr.option == "seireki":
             tmp = int(matching_expr.process_type[0])
             new_expr.value_lower_bound.year += tmp
@@ -228,7 +233,7 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         AbstimeExpression
             補正後の絶対時間表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if number_modifier.process_type == "or_over":
             new_expr.value_upper_bound = NTime(-INF)
         elif number_modifier.process_type == "or_less":
@@ -574,17 +579,17 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         tuple[AbstimeExpression, AbstimeExpression]
             修正後のi番目とi+1番目の絶対時間表現
         """
-        if abstime1.value_lower_bound == NTime(INF):
+        if abstime1.value_lower_bound.is_filled_with(INF):
             # lower_boundが空 = 時間として認識されていない場合（例：「4~12月」の「4~」）、lower_boundを設定
             # TODO 本当は、[i+1]の最上位時間単位を指定したいので、最下位時間単位を返すidentify_time_detailを用いるのは誤り
             # -> このパターンのとき、2つ以上の時間単位がでてくることは考えられないので、とりあえずこの実装でOK
             target_time_position = self.normalizer_utility.identify_time_detail(abstime2.value_upper_bound)
-            abstime1 = self.set_time(abstime1, target_time_position, deepcopy(abstime1))
-        elif abstime2.value_upper_bound == NTime(-INF):
+            abstime1 = self.set_time(abstime1, target_time_position, abstime1)
+        elif abstime2.value_upper_bound.is_filled_with(-INF):
             # upper_boundが空 = 時間として認識されていない場合（例：「2012/4/3~6」の「~6」）、upper_boundを設定
             abstime2.value_upper_bound = abstime1.value_upper_bound
             target_time_position = self.normalizer_utility.identify_time_detail(abstime1.value_upper_bound)
-            abstime2 = self.set_time(abstime2, target_time_position, deepcopy(abstime2))
+            abstime2 = self.set_time(abstime2, target_time_position, abstime2)
 
         return abstime1, abstime2
 
@@ -606,7 +611,7 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         AbstimeExpression
             セット後の絶対時間表現
         """
-        new_abstime_expr = deepcopy(abstime_expr)
+        new_abstime_expr = abstime_expr.copy()
         if time_position == "y":
             new_abstime_expr.value_lower_bound.year = integrate_abstime_expr.org_value_lower_bound
             new_abstime_expr.value_upper_bound.year = integrate_abstime_expr.org_value_upper_bound
@@ -647,8 +652,8 @@ class AbstimeExpressionNormalizer(BaseNormalizer):
         tuple[AbstimeExpression, AbstimeExpression]
             補完後のi番目とi+1番目の絶対時間表現
         """
-        new_abstime1 = deepcopy(abstime1)
-        new_abstime2 = deepcopy(abstime2)
+        new_abstime1 = abstime1.copy()
+        new_abstime2 = abstime2.copy()
 
         if self.is_abstime_val_inf(abstime1.value_lower_bound.year, abstime1.value_upper_bound.year):
             new_abstime1.value_lower_bound.year = abstime2.value_lower_bound.year
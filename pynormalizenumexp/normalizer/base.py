@@ -1,24 +1,49 @@
 """各種ノーマライザの基底クラス定義モジュール."""
-from copy import deepcopy
 from typing import Optional, Sequence, Union
 
 from pynormalizenumexp.expression.base import BasePattern, NNumber, NormalizedExpression, NumberModifier
 from pynormalizenumexp.utility.dict_loader import DictLoader
-from pynormalizenumexp.utility.normalizer_utility import NormalizerUtility
+from pynormalizenumexp.utility.normalizer_utility import NormalizerUtility, ShortenedText
+from pynormalizenumexp.utility.pattern_trie import PatternTrie
+
+from .number_normalizer import ExtractedNumbers, NumberNormalizer
 
 
 class BaseNormalizer(object):
     """各種ノーマライザの基底クラス."""
 
-    def __init__(self, dict_loader: DictLoader) -> None:
+    # 数値表現の抽出時に記号の処理を行うかどうか
+    do_fix_symbol: bool = True
+    # 処理時間の計測対象のメソッドと段階名
+    profiling_stages: dict[str, str] = {
+        "process": "total",
+        "normalize_number": "number_extraction",
+        "numbers2expressions": "numbers2expressions",
+        "normalize_limited_expression": "limited_expression",
+        "normalize_prefix_counter": "prefix_counter",
+        "normalize_suffix_number_modifier": "suffix_number_modifier",
+        "normalize_prefix_number_modifier": "prefix_number_modifier",
+        "fix_by_range_expression": "range_expression",
+        "fix_kara_expression": "kara_expression",
+        "delete_not_expression": "delete_not_expression"
+    }
+
+    def __init__(self, dict_loader: DictLoader, number_normalizer: Optional[NumberNormalizer] = None) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         dict_loader : DictLoader
             辞書ファイルのローダー
+        number_normalizer : Optional[NumberNormalizer], optional
+            数値の抽出・正規化に使うノーマライザ（Noneの場合は新たに作成する）, by default None
+
+        Notes
+        -----
+            NumberNormalizerは同じ言語のノーマライザ間で共有できる（漢数字の辞書と数値変換のキャッシュを共有する。キャッシュの更新はロックで保護しているので、複数のスレッドから利用しても安全）
         """
         self.dict_loader = dict_loader
+        self.number_normalizer = number_normalizer if number_normalizer is not None else NumberNormalizer(dict_loader)
         self.normalizer_utility = NormalizerUtility()
 
         self.limited_expressions: Sequence[BasePattern] = []
@@ -26,17 +51,31 @@ class BaseNormalizer(object):
         self.prefix_number_modifier: list[NumberModifier] = []
         self.suffix_number_modifier: list[NumberModifier] = []
 
-        self.limited_expression_patterns: dict[str, int] = dict()
-        self.prefix_counter_patterns: dict[str, int] = dict()
-        self.prefix_number_modifier_patterns: dict[str, int] = dict()
-        self.suffix_number_modifier_patterns: dict[str, int] = dict()
+        self.limited_expression_patterns = PatternTrie(dict())
+        self.prefix_counter_patterns = PatternTrie(dict())
+        self.prefix_number_modifier_patterns = PatternTrie(dict())
+        self.suffix_number_modifier_patterns = PatternTrie(dict())
 
     def load_dictionaries(self, limited_expr_dict_path: str, prefix_counter_dict_path: str,
                           prefix_number_modifier_dict_path: str, suffix_number_modifier_dict_path: str) -> None:
         """辞書ファイルの読み込み."""
         raise NotImplementedError()
 
-    def build_patterns(self, expressions: Sequence[Union[BasePattern, NormalizedExpression]]) -> dict[str, int]:
+    def get_patterns_without_number(self) -> list[str]:
+        """数値を含まなくても表現として抽出されるパターン文字列を取得する.
+
+        Returns
+        -------
+        list[str]
+            パターン文字列
+
+        Notes
+        -----
+            数値もこれらのパターン文字列も含まないテキストからは、このノーマライザで表現が抽出されることはない
+        """
+        return []
+
+    def build_patterns(self, expressions: Sequence[Union[BasePattern, NormalizedExpression]]) -> PatternTrie:
         """パターンオブジェクトからパターン文字列をパターンIDのマップを作成する.
 
         Parameters
@@ -46,18 +85,24 @@ class BaseNormalizer(object):
 
         Returns
         -------
-        dict[str, int]
-            パターン文字列ごとのパターンIDのマップ
+        PatternTrie
+            パターン文字列ごとのパターンIDのマップを最長一致検索用に構築したトライ木
+
+        Notes
+        -----
+            同じパターン文字列が複数ある場合は後のものを採用する
         """
-        return {expr.pattern: i for i, expr in enumerate(expressions)}
+        return PatternTrie({expr.pattern: i for i, expr in enumerate(expressions)})
 
-    def process(self, text: str) -> list[NormalizedExpression]:
+    def process(self, text: str, extracted_numbers: Optional[ExtractedNumbers] = None) -> list[NormalizedExpression]:
         """数値表現の抽出を正規化を行う.
 
         Parameters
         ----------
         text : str
             抽出・正規化対象のテキスト
+        extracted_numbers : Optional[ExtractedNumbers], optional
+            他のノーマライザと共有する抽出済みの数値表現（Noneの場合はここで抽出する）, by default None
 
         Returns
         -------
@@ -65,19 +110,24 @@ class BaseNormalizer(object):
             正規化済みの数値表現
         """
         # 数値表現を抽出
-        numbers = self.normalize_number(text)
+        if extracted_numbers is None:
+            numbers = self.normalize_number(text)
+        else:
+            numbers = extracted_numbers.get(self.do_fix_symbol)
 
         # 抽出した数値表現を適切な表現（絶対時間など）に変換
         expressions = self.numbers2expressions(numbers)
 
         # 探索のためにテキスト中の数値文字列を * に置換する
         replaced_text = self.normalizer_utility.replace_numbers_in_text(text, numbers)
+        # 連続する * の縮約はテキスト全体に対して1回だけ行い、以降の探索で使い回す
+        shortened_text = ShortenedText(replaced_text)
 
         # 単位の探索と正規化
         i = 0
         while i < len(expressions):
             # 変換済みの数値表現を正規化する
-            normalized_id, new_expressions = self.normalize_limited_expression(replaced_text, expressions, i)
+            normalized_id, new_expressions = self.normalize_limited_expression(shortened_text, expressions, i)
             if new_expressions is None:
                 # TODO 単位が存在しなかった場合の処理をどうするか要検討
                 pass
@@ -85,18 +135,18 @@ class BaseNormalizer(object):
                 i = normalized_id
                 expressions = new_expressions
 
-            new_expression = self.normalize_prefix_counter(replaced_text, expressions[i])
+            new_expression = self.normalize_prefix_counter(shortened_text, expressions[i])
             if new_expression:
                 expressions[i] = new_expression
 
-            new_expression = self.normalize_suffix_number_modifier(replaced_text, expressions[i])
+            new_expression = self.normalize_suffix_number_modifier(shortened_text, expressions[i])
             if new_expression:
                 expressions[i] = new_expression
 
-            new_expression = self.normalize_prefix_number_modifier(replaced_text, expressions[i])
+            new_expression = self.normalize_prefix_number_modifier(shortened_text, expressions[i])
             if new_expression:
                 expressions[i] = new_expression
-                new_expression = self.normalize_prefix_counter(replaced_text, expressions[i])
+                new_expression = self.normalize_prefix_counter(shortened_text, expressions[i])
                 if new_expression:
                     expressions[i] = new_expression
 
@@ -123,13 +173,13 @@ class BaseNormalizer(object):
         """数値表現を適切な表現（絶対時間など）に変換する."""
         raise NotImplementedError()
 
-    def search_matching_limited_expression(self, replaced_text: str, expr: NormalizedExpression) -> int:
+    def search_matching_limited_expression(self, shortened_text: ShortenedText, expr: NormalizedExpression) -> int:
         """テキスト中にどの表現パターンが出現するか検索する.
 
         Parameters
         ----------
-        replaced_text : str
-            数値文字列がマスクされた元のテキスト
+        shortened_text : ShortenedText
+            数値文字列がマスクされた元のテキストを縮約したもの
         expr : NormalizedExpression
             抽出された数値表現
 
@@ -142,19 +192,17 @@ class BaseNormalizer(object):
         -----
             「2021年」の「2021」が数値表現として抽出されているので、それに続く「年」という表現が辞書中にあるか調べているイメージ
         """
-        after_text = replaced_text[expr.position_end:]
-        matching_pattern_id = self.normalizer_utility.search_pattern(after_text,
-                                                                     self.limited_expression_patterns, "prefix")
+        matching_pattern_id = shortened_text.search_prefix(expr.position_end, self.limited_expression_patterns)
 
         return matching_pattern_id
 
-    def search_matching_prefix_counter(self, replaced_text: str, expr: NormalizedExpression) -> int:
+    def search_matching_prefix_counter(self, shortened_text: ShortenedText, expr: NormalizedExpression) -> int:
         """数値表現の直前に出現する単位表現を検索する.
 
         Parameters
         ----------
-        replaced_text : str
-            数値文字列がマスクされた元のテキスト
+        shortened_text : ShortenedText
+            数値文字列がマスクされた元のテキストを縮約したもの
         expr : NormalizedExpression
             抽出された数値表現
 
@@ -163,9 +211,7 @@ class BaseNormalizer(object):
         int
             見つかった単位表現パターンのID
         """
-        before_text = replaced_text[:expr.position_start]
-        matching_pattern_id = self.normalizer_utility.search_pattern(before_text,
-                                                                     self.prefix_counter_patterns, "suffix")
+        matching_pattern_id = shortened_text.search_suffix(expr.position_start, self.prefix_counter_patterns)
 
         return matching_pattern_id
 
@@ -201,7 +247,7 @@ class BaseNormalizer(object):
         NormalizedExpression
             補正後の数値表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         new_expr.position_start -= len(number_modifier.pattern)
 
         new_expr = self.revise_expr_by_number_modifier(new_expr, number_modifier)
@@ -224,22 +270,22 @@ class BaseNormalizer(object):
         NormalizedExpression
             補正後の数値表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         new_expr.position_end += len(number_modifier.pattern)
 
         new_expr = self.revise_expr_by_number_modifier(new_expr, number_modifier)
 
         return new_expr
 
-    def normalize_limited_expression(self, replaced_text: str,
+    def normalize_limited_expression(self, shortened_text: ShortenedText,
                                      exprs: Sequence[NormalizedExpression], expr_id: int) \
             -> tuple[int, Optional[list[NormalizedExpression]]]:
         """抽出された数値表現の正規化.
 
         Parameters
         ----------
-        replaced_text : str
-            数値文字列がマスクされた元のテキスト
+        shortened_text : ShortenedText
+            数値文字列がマスクされた元のテキストを縮約したもの
         exprs : Sequence[NormalizedExpression]
             抽出された数値表現
         expr_id : int
@@ -251,7 +297,7 @@ class BaseNormalizer(object):
             マッチしたパターン辞書のIDと正規化された数値表現（マッチするものがなければNoneを返す）
         """
         # どの表現パターンにマッチするか検索する
-        matching_pattern_id = self.search_matching_limited_expression(replaced_text, exprs[expr_id])
+        matching_pattern_id = self.search_matching_limited_expression(shortened_text, exprs[expr_id])
         if matching_pattern_id == -1:
             # マッチするものがなければIDは-1、正規化済みの数値表現はNoneで返す
             return -1, None
@@ -262,14 +308,14 @@ class BaseNormalizer(object):
 
         return expr_id, new_exprs
 
-    def normalize_prefix_counter(self, replaced_text: str, expr: NormalizedExpression) \
+    def normalize_prefix_counter(self, shortened_text: ShortenedText, expr: NormalizedExpression) \
             -> Optional[NormalizedExpression]:
         """数値表現の直前に出現する単位表現の正規化.
 
         Parameters
         ----------
-        replaced_text : str
-            数値文字列がマスクされた元のテキスト
+        shortened_text : ShortenedText
+            数値文字列がマスクされた元のテキストを縮約したもの
         expr : NormalizedExpression
             抽出された数値表現
 
@@ -282,20 +328,20 @@ class BaseNormalizer(object):
         -----
             単位表現：毎週や北緯、摂氏など
         """
-        matching_pattern_id = self.search_matching_prefix_counter(replaced_text, expr)
+        matching_pattern_id = self.search_matching_prefix_counter(shortened_text, expr)
         if matching_pattern_id == -1:
             return None
 
         return self.revise_expr_by_matching_prefix_counter(expr, self.prefix_counters[matching_pattern_id])
 
-    def normalize_prefix_number_modifier(self, replaced_text: str, expr: NormalizedExpression) \
+    def normalize_prefix_number_modifier(self, shortened_text: ShortenedText, expr: NormalizedExpression) \
             -> Optional[NormalizedExpression]:
         """数値表現の直前に出現する修飾表現の正規化.
 
         Parameters
         ----------
-        replaced_text : str
-            数値文字列がマスクされた元のテキスト
+        shortened_text : ShortenedText
+            数値文字列がマスクされた元のテキストを縮約したもの
         expr : NormalizedExpression
             抽出された数値表現
 
@@ -305,21 +351,21 @@ class BaseNormalizer(object):
             正規化された修飾表現（マッチする修飾表現がなければNone）
         """
         matching_pattern_id = self.normalizer_utility.search_prefix_number_modifier(
-            replaced_text, expr.position_start, self.prefix_number_modifier_patterns)
+            shortened_text, expr.position_start, self.prefix_number_modifier_patterns)
         if matching_pattern_id == -1:
             return None
 
         return self.revise_expr_by_matching_prefix_number_modifier(
             expr, self.prefix_number_modifier[matching_pattern_id])
 
-    def normalize_suffix_number_modifier(self, replaced_text: str, expr: NormalizedExpression) \
+    def normalize_suffix_number_modifier(self, shortened_text: ShortenedText, expr: NormalizedExpression) \
             -> Optional[NormalizedExpression]:
         """数値表現の直後に出現する修飾表現の正規化.
 
         Parameters
         ----------
-        replaced_text : str
-            数値文字列がマスクされた元のテキスト
+        shortened_text : ShortenedText
+            数値文字列がマスクされた元のテキストを縮約したもの
         expr : NormalizedExpression
             抽出された数値表現
 
@@ -329,7 +375,7 @@ class BaseNormalizer(object):
             正規化された修飾表現（マッチする修飾表現がなければNone）
         """
         matching_pattern_id = self.normalizer_utility.search_suffix_number_modifier(
-            replaced_text, expr.position_end, self.suffix_number_modifier_patterns)
+            shortened_text, expr.position_end, self.suffix_number_modifier_patterns)
         if matching_pattern_id == -1:
             return None
 
@@ -358,14 +404,16 @@ class BaseNormalizer(object):
         list[NormalizedExpression]
             修正後の数値表現
         """
-        new_exprs = deepcopy(exprs)
+        new_exprs = list(exprs)
         for i, expr in enumerate(new_exprs):
             if expr.original_expr.startswith("から"):
+                expr = expr.copy()
                 expr.original_expr = expr.original_expr[2:]
                 expr.position_start += 2
                 # optionsに入っているkara_prefixを削除
                 del expr.options[0]
             elif expr.original_expr.endswith("から"):
+                expr = expr.copy()
                 expr.original_expr = expr.original_expr[:-2]
                 expr.position_end -= 2
                 # optionsに入っているkara_suffixを削除
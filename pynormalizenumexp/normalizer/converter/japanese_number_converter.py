@@ -1,21 +1,23 @@
 """日本語の数値文字列を数値に変換するクラスの定義モジュール."""
 from pynormalizenumexp.utility.digit_utility import DigitUtility
 
-from .number_converter import NumberConverter
+from .number_converter import DEFAULT_CACHE_SIZE, NumberConverter
 
 
 class JapaneseNumberConverter(NumberConverter):
     """日本語の数値文字列を数値に変換するクラス."""
 
-    def __init__(self, digit_utility: DigitUtility) -> None:
+    def __init__(self, digit_utility: DigitUtility, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         digit_utility : DigitUtility
             数字操作ユーティリティ
+        cache_size : int, optional
+            変換結果をキャッシュする数値文字列の数の上限（0の場合はキャッシュしない）, by default DEFAULT_CACHE_SIZE
         """
-        super().__init__(digit_utility)
+        super().__init__(digit_utility, cache_size)
 
     def convert_arabic_kansuji_mixed_of_4digits(self, number_string: str) -> int:
         """アラビア数字や漢数字からなる数値文字列を数値に変換する.
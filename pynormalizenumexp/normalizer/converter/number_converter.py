@@ -1,25 +1,106 @@
 """数値文字列を数値に変換する処理の基底クラス定義モジュール."""
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
 from unicodedata import normalize
 
+from pynormalizenumexp.utility.custom_type import NumberCacheStatDict
 from pynormalizenumexp.utility.digit_utility import DigitUtility
 
+# 変換結果をキャッシュする数値文字列の数のデフォルト値
+DEFAULT_CACHE_SIZE = 4096
+# 半角・全角のアラビア数字だけからなる数値文字列（int()でそのまま変換できる）
+ARABIC_NUMBER_REG = re.compile(r"[0-9０-９]+")
+
 
 class NumberConverter(object):
     """数値文字列を数値に変換する処理の基底クラス."""
 
-    def __init__(self, digit_utility: DigitUtility) -> None:
+    def __init__(self, digit_utility: DigitUtility, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         digit_utility : DigitUtility
             数字操作ユーティリティ
+        cache_size : int, optional
+            変換結果をキャッシュする数値文字列の数の上限（0の場合はキャッシュしない）, by default DEFAULT_CACHE_SIZE
         """
         self.digit_utility = digit_utility
 
+        self.cache_size = cache_size
+        self.cache: OrderedDict[str, int] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # NumberNormalizerは複数の表現種別のノーマライザやスレッドで共有されるので、キャッシュの操作はロックを取って行う
+        self.lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """pickle化する状態を返す（ロックはpickle化できないので除く）.
+
+        Returns
+        -------
+        dict[str, Any]
+            pickle化する属性
+        """
+        state = self.__dict__.copy()
+        del state["lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """pickleから状態を復元する.
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            pickle化した属性
+        """
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
     def convert_number(self, number_string: str) -> int:
         """数値文字列を数値に変換する.
 
+        Parameters
+        ----------
+        number_string : str
+            変換対象の数値文字列
+
+        Returns
+        -------
+        int
+            変換後の数値
+
+        Notes
+        -----
+            同じ数値文字列は繰り返し出現しやすいので、変換結果を最近使われた順に上限数までキャッシュする
+        """
+        if self.cache_size <= 0:
+            return self.convert_number_without_cache(number_string)
+
+        with self.lock:
+            value = self.cache.get(number_string)
+            if value is not None:
+                self.cache.move_to_end(number_string)
+                self.cache_hits += 1
+                return value
+            self.cache_misses += 1
+
+        # 変換はロックの外で行う（同じ数値文字列を同時に変換した場合は、どちらの結果も同じなので後から登録した方が残る）
+        value = self.convert_number_without_cache(number_string)
+        with self.lock:
+            self.cache[number_string] = value
+            while len(self.cache) > self.cache_size:
+                # 最も長く使われていないものから削除する
+                self.cache.popitem(last=False)
+
+        return value
+
+    def convert_number_without_cache(self, number_string: str) -> int:
+        """キャッシュを使わずに数値文字列を数値に変換する.
+
         Parameters
         ----------
         number_string : str
@@ -30,6 +111,14 @@ class NumberConverter(object):
         int
             変換後の数値
         """
+        if ARABIC_NUMBER_REG.fullmatch(number_string):
+            # アラビア数字だけの場合は位表記の処理が不要なのでそのまま変換する
+            try:
+                return int(number_string)
+            except ValueError:
+                # 桁数がint()で変換できる上限（sys.get_int_max_str_digits）を超える場合は、以降の処理で1桁ずつ変換する
+                pass
+
         new_number_string = self.delete_connma(number_string)
         new_number_string = normalize("NFKC", new_number_string)
 
@@ -54,6 +143,25 @@ class NumberConverter(object):
 
         return value
 
+    def get_cache_stats(self) -> NumberCacheStatDict:
+        """変換結果のキャッシュの集計結果を取得する.
+
+        Returns
+        -------
+        NumberCacheStatDict
+            キャッシュのヒット数、ミス数、キャッシュしている数値文字列の数とその上限
+        """
+        with self.lock:
+            return NumberCacheStatDict(hits=self.cache_hits, misses=self.cache_misses,
+                                       size=len(self.cache), max_size=self.cache_size)
+
+    def clear_cache(self) -> None:
+        """変換結果のキャッシュと集計結果を初期化する."""
+        with self.lock:
+            self.cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+
     def delete_connma(self, number_string: str) -> str:
         """文字列からコンマ表記を削除する.
 
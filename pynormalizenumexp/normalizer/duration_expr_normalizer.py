@@ -1,5 +1,5 @@
 """期間の抽出・正規化処理を定義するモジュール."""
-from copy import deepcopy
+from typing import Optional
 
 from pynormalizenumexp.expression.base import INF, NNumber, NTime, NumberModifier
 from pynormalizenumexp.expression.duration import DurationExpression, DurationPattern
@@ -15,17 +15,17 @@ class DurationExpressionNormalizer(BaseNormalizer):
     limited_expressions: list[DurationPattern]
     prefix_counters: list[DurationPattern]
 
-    def __init__(self, dict_loader: DictLoader) -> None:
+    def __init__(self, dict_loader: DictLoader, number_normalizer: Optional[NumberNormalizer] = None) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         dict_loader : DictLoader
             辞書ファイルのローダー
+        number_normalizer : Optional[NumberNormalizer], optional
+            数値の抽出・正規化に使うノーマライザ（Noneの場合は新たに作成する）, by default None
         """
-        super().__init__(dict_loader)
-
-        self.number_normalizer = NumberNormalizer(dict_loader)
+        super().__init__(dict_loader, number_normalizer)
 
         self.load_dictionaries("duration_expression.json", "duration_prefix_counter.json",
                                "duration_prefix.json", "duration_suffix.json")
@@ -110,7 +110,7 @@ class DurationExpressionNormalizer(BaseNormalizer):
         DurationExpression
             補正後の期間表現
         """
-        new_duration_expr = deepcopy(duration_expr)
+        new_duration_expr = duration_expr.copy()
         if process_type == "han":
             if len(matching_duration_expr.corresponding_time_position) == 0:
                 return new_duration_expr
@@ -139,7 +139,9 @@ class DurationExpressionNormalizer(BaseNormalizer):
         list[DurationExpression]
             補正済みの期間表現
         """
-        new_exprs = deepcopy(exprs)
+        # 補正する期間表現だけを複製する
+        new_exprs = list(exprs)
+        new_exprs[expr_id] = new_exprs[expr_id].copy()
         final_expr_id = expr_id + matching_expr.total_number_of_place_holder
         new_exprs[expr_id].position_end = new_exprs[final_expr_id].position_end \
             + matching_expr.len_of_after_final_place_holder
@@ -175,7 +177,7 @@ class DurationExpressionNormalizer(BaseNormalizer):
             補正済みの期間表現
         """
         # 期間表現にprefix_counterは存在しないので何もしない
-        return deepcopy(expr)
+        return expr.copy()
 
     def revise_expr_by_number_modifier(self, expr: DurationExpression,  # type: ignore[override] # noqa: C901
                                        number_modifier: NumberModifier) -> DurationExpression:
@@ -193,7 +195,7 @@ class DurationExpressionNormalizer(BaseNormalizer):
         DurationExpression
             補正後の期間表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if number_modifier.process_type == "or_over":
             new_expr.value_upper_bound = NTime(-INF)
         elif number_modifier.process_type == "or_less":
@@ -455,7 +457,7 @@ class DurationExpressionNormalizer(BaseNormalizer):
         DurationExpression
             セット後の期間表現
         """
-        new_duration_expr = deepcopy(duration_expr)
+        new_duration_expr = duration_expr.copy()
         if time_position == "y":
             new_duration_expr.value_lower_bound.year = integrate_duration_expr.org_value_lower_bound
             new_duration_expr.value_upper_bound.year = integrate_duration_expr.org_value_upper_bound
@@ -1,7 +1,6 @@
 """抽出・正規化した数値表現から不適切なものを除去する処理の定義モジュール."""
 import re
 import typing
-from copy import deepcopy
 from typing import Optional, Union
 from unicodedata import normalize
 
@@ -11,6 +10,7 @@ from pynormalizenumexp.expression.duration import DurationExpression
 from pynormalizenumexp.expression.numerical import NumericalExpression
 from pynormalizenumexp.expression.reltime import ReltimeExpression
 from pynormalizenumexp.utility.dict_loader import DictLoader
+from pynormalizenumexp.utility.span_index import SpanIndex
 
 INAPPROPRIATE_PREFIX_LIST = ["ver", "ｖｅｒ"]
 URL_REG = re.compile(r"https?://[\w!\?/\+\-_~=;\.,\*&@#\$%\(\)'\[\]]+", flags=re.DOTALL)
@@ -50,6 +50,8 @@ class InappropriateExpressionRemover(object):
 
         Parameters
         ----------
+        text : str
+            元テキスト
         numerical_exprs : list[NumericalExpression]
             時間系以外の数値表現
         abstime_exprs : list[AbstimeExpression]
@@ -63,7 +65,14 @@ class InappropriateExpressionRemover(object):
         -------
         tuple[list[NumericalExpression], list[AbstimeExpression], list[ReltimeExpression], list[DurationExpression]]
             不適切なものを取り除いた各数値表現
+
+        Notes
+        -----
+            抽出対象外の表現タイプは空のリストを渡せばよい（空のリストとの重複判定やURLの探索は省略する）
         """
+        if len(numerical_exprs) + len(abstime_exprs) + len(reltime_exprs) + len(duration_exprs) == 0:
+            return numerical_exprs, abstime_exprs, reltime_exprs, duration_exprs
+
         abstime_exprs = self.delete_inappropriate_abstime_exprs(abstime_exprs)
 
         numerical_exprs = self.delete_duplicate_extraction(numerical_exprs,
@@ -75,10 +84,12 @@ class InappropriateExpressionRemover(object):
         abstime_exprs = self.delete_duplicate_extraction(abstime_exprs,
                                                          numerical_exprs+reltime_exprs+duration_exprs)
 
-        numerical_exprs = self.delete_inappropriate_extraction_using_dict(text, numerical_exprs)
-        abstime_exprs = self.delete_inappropriate_extraction_using_dict(text, abstime_exprs)
-        reltime_exprs = self.delete_inappropriate_extraction_using_dict(text, reltime_exprs)
-        duration_exprs = self.delete_inappropriate_extraction_using_dict(text, duration_exprs)
+        # URLの区間は各表現タイプで共通なので1度だけ探索する
+        url_span_index = self.build_url_span_index(text)
+        numerical_exprs = self.delete_inappropriate_extraction_using_dict(text, numerical_exprs, url_span_index)
+        abstime_exprs = self.delete_inappropriate_extraction_using_dict(text, abstime_exprs, url_span_index)
+        reltime_exprs = self.delete_inappropriate_extraction_using_dict(text, reltime_exprs, url_span_index)
+        duration_exprs = self.delete_inappropriate_extraction_using_dict(text, duration_exprs, url_span_index)
 
         return numerical_exprs, abstime_exprs, reltime_exprs, duration_exprs
 
@@ -95,7 +106,8 @@ class InappropriateExpressionRemover(object):
         list[AbstimeExpression]
             削除後の絶対時間表現
         """
-        new_abstime_exprs = deepcopy(abstime_exprs)
+        # 補正後の表現は revise_abstime_expr で複製されるので、リストだけを複製する
+        new_abstime_exprs = list(abstime_exprs)
         for i, expr in enumerate(new_abstime_exprs):
             new_abstime_exprs[i] = self.revise_abstime_expr(expr)  # type: ignore
 
@@ -117,15 +129,39 @@ class InappropriateExpressionRemover(object):
         list[NormalizedExpression]
             削除後の数値表現
         """
+        if len(target_exprs) == 0 or len(other_exprs) == 0:
+            # 比較する数値表現がなければ重複するものもない
+            return list(target_exprs)
+
+        # 比較する数値表現の区間は判定対象ごとに変わらないので、先にインデックスを作成しておく
+        other_span_index = SpanIndex((expr.position_start, expr.position_end) for expr in other_exprs)
         for i, target_expr in enumerate(target_exprs):
             # 重複するものは削除対象にする
-            if self.is_converted_by_other_type_expressions(target_expr, other_exprs):
+            if self.is_converted_by_other_type_expressions(target_expr, other_span_index):
                 target_exprs[i] = None  # type: ignore
 
         return [expr for expr in target_exprs if expr]
 
+    def build_url_span_index(self, text: str) -> SpanIndex:
+        """テキスト中のURLの区間のインデックスを作成する.
+
+        Parameters
+        ----------
+        text : str
+            元テキスト
+
+        Returns
+        -------
+        SpanIndex
+            NFKC正規化したテキスト中に出現するすべてのURLの区間のインデックス
+        """
+        normalized_text = normalize("NFKC", text)
+
+        return SpanIndex(url_match.span() for url_match in URL_REG.finditer(normalized_text))
+
     def delete_inappropriate_extraction_using_dict(self, text: str,  # noqa: C901
-                                                   exprs: list[NormalizedExpression]) -> list[NormalizedExpression]:
+                                                   exprs: list[NormalizedExpression],
+                                                   url_span_index: Optional[SpanIndex] = None) -> list[NormalizedExpression]:
         """辞書情報などを使った数値表現の削除.
 
         Parameters
@@ -134,13 +170,20 @@ class InappropriateExpressionRemover(object):
             元テキスト
         exprs : list[NormalizedExpression]
             削除対象を含む数値表現
+        url_span_index : Optional[SpanIndex], optional
+            テキスト中のURLの区間のインデックス（Noneの場合はここで作成する）, by default None
 
         Returns
         -------
         list[NormalizedExpression]
             削除後の数値表現
         """
-        new_exprs = deepcopy(exprs)
+        # URLの区間は表現ごとに変わらないので先に探索しておく
+        if url_span_index is None:
+            url_span_index = self.build_url_span_index(text)
+
+        # 表現自体は変更しないので、リストだけを複製する
+        new_exprs = list(exprs)
         for i, expr in enumerate(new_exprs):
             # 指定した表現文字列のものは削除する
             if expr.original_expr in self.inappropriate_strings:
@@ -150,7 +193,8 @@ class InappropriateExpressionRemover(object):
             # 指定したPrefixが付いている表現を削除する
             is_break = False
             for prefix in INAPPROPRIATE_PREFIX_LIST:
-                if text[:expr.position_start].endswith(prefix):
+                # 表現の直前だけを見る（テキストの先頭から表現の開始位置までを切り出さない）
+                if text.endswith(prefix, 0, expr.position_start):
                     new_exprs[i] = None  # type: ignore
                     is_break = True
                     break
@@ -158,8 +202,7 @@ class InappropriateExpressionRemover(object):
                 continue
 
             # URLの一部に表現がある場合は削除する
-            url_match = URL_REG.search(normalize("NFKC", text))
-            if url_match and (url_match.start() <= expr.position_start and expr.position_end <= url_match.end()):
+            if url_span_index.is_contained(expr.position_start, expr.position_end):
                 new_exprs[i] = None  # type: ignore
                 continue
 
@@ -202,7 +245,7 @@ class InappropriateExpressionRemover(object):
         AbstimeExpression
             補正後の絶対時間表現
         """
-        new_abstime_expr = deepcopy(abstime_expr)
+        new_abstime_expr = abstime_expr.copy()
         # 「西暦」とついてたら処理を行わない
         if "西" in new_abstime_expr.original_expr:
             return new_abstime_expr
@@ -247,25 +290,23 @@ class InappropriateExpressionRemover(object):
             or is_out_of_range(t.hour, 0, 30) or is_out_of_range(t.minute, 0, 59) or is_out_of_range(t.second, 0, 59)
 
     def is_converted_by_other_type_expressions(self, any_type_expression1: NormalizedExpression,
-                                               any_type_expressions2: list[NormalizedExpression]) -> bool:
+                                               any_type_expressions2: Union[list[NormalizedExpression], SpanIndex]) -> bool:
         """2つの数値表現が重複するかどうか判定する.
 
         Parameters
         ----------
         any_type_expression1 : NormalizedExpression
             判定対象の数値表現
-        any_type_expressions2 : list[NormalizedExpression]
-            もう片方の数値表現
+        any_type_expressions2 : Union[list[NormalizedExpression], SpanIndex]
+            もう片方の数値表現（またはその区間のインデックス）
 
         Returns
         -------
         bool
             True：重複する、False：重複しない
         """
-        # any_type_expression1の開始位置と終了位置がany_type_expression2の中に含まれる場合は重複するとみなす
-        for any_type_expression2 in any_type_expressions2:
-            if any_type_expression2.position_start <= any_type_expression1.position_start \
-                    and any_type_expression1.position_end <= any_type_expression2.position_end:
-                return True
+        if not isinstance(any_type_expressions2, SpanIndex):
+            any_type_expressions2 = SpanIndex((expr.position_start, expr.position_end) for expr in any_type_expressions2)
 
-        return False
+        # any_type_expression1の開始位置と終了位置がany_type_expression2の中に含まれる場合は重複するとみなす
+        return any_type_expressions2.is_contained(any_type_expression1.position_start, any_type_expression1.position_end)
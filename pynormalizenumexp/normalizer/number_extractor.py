@@ -1,16 +1,16 @@
 """数値表現の抽出処理の定義モジュール."""
-import re
-
 from pynormalizenumexp.expression.base import NNumber, NotationType
 from pynormalizenumexp.utility.digit_utility import DigitUtility
 
-INVALID_NOTATION_TYPE_REG = re.compile(f"{NotationType.HANKAKU} {NotationType.ZENKAKU}"
-                                       + f"|{NotationType.ZENKAKU} {NotationType.HANKAKU}"
-                                       + f"|{NotationType.HANKAKU} {NotationType.KANSUJI_09}"
-                                       + f"|{NotationType.KANSUJI_09} {NotationType.HANKAKU}"
-                                       + f"|{NotationType.ZENKAKU} {NotationType.KANSUJI_09}"
-                                       + f"|{NotationType.KANSUJI_09} {NotationType.ZENKAKU}",
-                                       flags=re.DOTALL)
+# 隣り合うと数字の表記が入り乱れていると判定する数字種の組
+INVALID_NOTATION_TYPE_PAIRS = frozenset([
+    (NotationType.HANKAKU, NotationType.ZENKAKU),
+    (NotationType.ZENKAKU, NotationType.HANKAKU),
+    (NotationType.HANKAKU, NotationType.KANSUJI_09),
+    (NotationType.KANSUJI_09, NotationType.HANKAKU),
+    (NotationType.ZENKAKU, NotationType.KANSUJI_09),
+    (NotationType.KANSUJI_09, NotationType.ZENKAKU)
+])
 
 
 class NumberExtractor(object):
@@ -43,12 +43,8 @@ class NumberExtractor(object):
         -----
             「２０００30」や「2000三十」などの、数字の表記が入り乱れているものを見つける
         """
-        # notation_typeは数値のリストなので、スペースで結合した文字列にして正規表現でチェックする
-        notation_type_str = " ".join([str(n) for n in notation_type])
-        if INVALID_NOTATION_TYPE_REG.search(notation_type_str):
-            return True
-
-        return False
+        # 隣り合う数字種の組ごとに不適切な組かどうかを表から引く
+        return any(pair in INVALID_NOTATION_TYPE_PAIRS for pair in zip(notation_type, notation_type[1:]))
 
     def split_number_by_kansuji_kurai(self, number: NNumber) -> list[NNumber]:
         """漢数字の位表記で不適切な箇所ごとに分割する.
@@ -143,7 +139,7 @@ class NumberExtractor(object):
         position_start = 0
         for i in range(1, len(number.notation_type)-1):
             # 数字の表記が入り乱れているか
-            if self.is_invalid_notation_type(number.notation_type[i-1:i+1]):
+            if (number.notation_type[i-1], number.notation_type[i]) in INVALID_NOTATION_TYPE_PAIRS:
                 # 新たに数値表現を切り出す
                 new_num_str = number.original_expr[position_start:i]
                 new_position_start = number.position_start + position_start
@@ -181,29 +177,12 @@ class NumberExtractor(object):
         list[NNumber]
             抽出された数値表現情報
         """
-        # テキストの各文字がどの数字種にあたるか調べる
-        text_notation_type = [self.digit_utility.chars2full_notation_type(char) for char in text]
-
-        # 数字である部分の文字列を抜き出す
+        # 数字である文字が連続する箇所を数値表現の候補として切り出す（数字がなければ何もせずに終わる）
         numbers: list[NNumber] = []
-        num_str = ""
-        i = 0
-        while i < len(text):
-            if text_notation_type[i] == NotationType.NOT_NUMBER:
-                if len(num_str) > 0:
-                    number = NNumber(num_str, i-len(num_str), i)
-                    number.notation_type = text_notation_type[i-len(num_str):i]
-                    numbers.append(number)
-
-                    num_str = ""
-            else:
-                num_str += text[i]
-
-            i += 1
-
-        if len(num_str) > 0:
-            number = NNumber(num_str, i-len(num_str), i)
-            number.notation_type = text_notation_type[i-len(num_str):i]
+        for match in self.digit_utility.number_chars_reg.finditer(text):
+            num_str = match.group()
+            number = NNumber(num_str, match.start(), match.end())
+            number.notation_type = self.digit_utility.text2full_notation_type(num_str)
             numbers.append(number)
 
         # 不適切な数字種の並びから数値表現を分割する
@@ -1,5 +1,5 @@
 """数値表現のノーマライザ定義モジュール."""
-from copy import deepcopy
+from dataclasses import dataclass
 from typing import Any, Optional
 
 from pynormalizenumexp.expression.base import NNumber
@@ -10,6 +10,37 @@ from .number_extractor import NumberExtractor
 from .symbol_fixer import SymbolFixer
 
 
+@dataclass
+class ExtractedNumbers:
+    """テキストから抽出・正規化した数値表現を記号処理の有無ごとに保持するクラス.
+
+    Parameters
+    ----------
+    symbol_fixed : list[NNumber]
+        記号の処理を行った数値表現
+    symbol_not_fixed : list[NNumber]
+        記号の処理を行っていない数値表現
+    """
+
+    symbol_fixed: list[NNumber]
+    symbol_not_fixed: list[NNumber]
+
+    def get(self, do_fix_symbol: bool) -> list[NNumber]:
+        """記号処理の有無に応じた数値表現を取得する.
+
+        Parameters
+        ----------
+        do_fix_symbol : bool
+            記号の処理を行ったものを取得するかのフラグ（True：行ったもの、False：行っていないもの）
+
+        Returns
+        -------
+        list[NNumber]
+            数値表現
+        """
+        return self.symbol_fixed if do_fix_symbol else self.symbol_not_fixed
+
+
 class NumberNormalizer(object):
     """数値表現のノーマライザクラス."""
 
@@ -49,6 +80,58 @@ class NumberNormalizer(object):
         list[NNumber]
             抽出・正規化した数値表現
         """
+        numbers = self.extract_and_convert_number(input)
+
+        # 絶対時間表現の規格化の際は実行しない（絶対時間表現では、前もって記号を処理させないため）
+        if do_fix_symbol:
+            # 記号の処理を行う
+            numbers = self.symbol_fixer.fix_numbers_by_symbol(input, numbers)
+
+        # 不要なデータを削除
+        numbers = self.remove_unnecessary_data(numbers)
+
+        return numbers
+
+    def process_all(self, input: str) -> ExtractedNumbers:
+        """テキストから数値表現を抽出し、記号処理の有無それぞれの正規化結果をまとめて返す.
+
+        Parameters
+        ----------
+        input : str
+            入力テキスト
+
+        Returns
+        -------
+        ExtractedNumbers
+            記号処理の有無ごとの抽出・正規化した数値表現
+
+        Notes
+        -----
+            記号の処理より前の工程は共通なので1度だけ実行する
+            記号の処理で変化がなかった場合は同じ数値表現のリストを共有する
+        """
+        numbers = self.extract_and_convert_number(input)
+        symbol_fixed_numbers = self.symbol_fixer.fix_numbers_by_symbol(input, numbers)
+
+        symbol_not_fixed_numbers = self.remove_unnecessary_data(numbers)
+        if symbol_fixed_numbers == numbers:
+            return ExtractedNumbers(symbol_not_fixed_numbers, symbol_not_fixed_numbers)
+
+        return ExtractedNumbers(self.remove_unnecessary_data(symbol_fixed_numbers), symbol_not_fixed_numbers)
+
+    def extract_and_convert_number(self, input: str) -> list[NNumber]:
+        """テキストから数値表現を抽出し、記号の処理を除いた数値への変換を行う.
+
+        Parameters
+        ----------
+        input : str
+            入力テキスト
+
+        Returns
+        -------
+        list[NNumber]
+            抽出・変換した数値表現
+        """
         # 入力文に含まれる数値表現を抽出
         numbers = self.number_extractor.extract_number(input)
 
@@ -65,14 +148,6 @@ class NumberNormalizer(object):
         # 「京」「万」など「万」以上の桁区切り文字しかないものを削除
         numbers = self.remove_only_kansuji_kurai_man(numbers)
 
-        # 絶対時間表現の規格化の際は実行しない（絶対時間表現では、前もって記号を処理させないため）
-        if do_fix_symbol:
-            # 記号の処理を行う
-            numbers = self.symbol_fixer.fix_numbers_by_symbol(input, numbers)
-
-        # 不要なデータを削除
-        numbers = self.remove_unnecessary_data(numbers)
-
         return numbers
 
     def suffix_is_arabic(self, number_string: str) -> bool:
@@ -143,7 +218,7 @@ class NumberNormalizer(object):
         list[NNumber]
             コンマで連結したものを含む数値表現
         """
-        new_numbers = deepcopy(numbers)
+        new_numbers = list(numbers)
         for i in list(reversed(range(1, len(new_numbers)))):
             a = new_numbers[i-1].position_end
             b = new_numbers[i].position_start - 1
@@ -158,6 +233,7 @@ class NumberNormalizer(object):
                 # 連続する数値表現がコンマで連結できなければ次へ
                 continue
 
+            new_numbers[i-1] = new_numbers[i-1].copy()
             new_numbers[i-1].position_end = new_numbers[i].position_end
             new_numbers[i-1].original_expr += char_intermediate + new_numbers[i].original_expr
             # i番目は不要なので削除する
@@ -179,11 +255,11 @@ class NumberNormalizer(object):
         list[NNumber]
             変換後の数値表現
         """
-        new_numbers = deepcopy(numbers)
-        for i, number in enumerate(new_numbers):
+        new_numbers = [number.copy() for number in numbers]
+        for number in new_numbers:
             converted_number = self.number_converter.convert_number(number.original_expr)
-            new_numbers[i].value_lower_bound = converted_number
-            new_numbers[i].value_upper_bound = converted_number
+            number.value_lower_bound = converted_number
+            number.value_upper_bound = converted_number
 
         return new_numbers
 
@@ -211,7 +287,7 @@ class NumberNormalizer(object):
         if text[number.position_start-1] != "数":
             return number
 
-        new_number = deepcopy(number)
+        new_number = number.copy()
 
         # 「数」の範囲の操作
         new_number.value_upper_bound *= 9
@@ -247,8 +323,8 @@ class NumberNormalizer(object):
         if text[cur_number.position_end] != "数":
             return cur_number
 
-        new_cur_number = deepcopy(cur_number)
-        new_next_number = deepcopy(next_number)
+        new_cur_number = cur_number.copy()
+        new_next_number = next_number.copy()
 
         # 「数」の範囲の操作
         # new_cur_number.valueを、new_next_number.valueのスケールに合わせる
@@ -297,7 +373,7 @@ class NumberNormalizer(object):
         if text[number.position_end] != "数":
             return number
 
-        new_number = deepcopy(number)
+        new_number = number.copy()
 
         new_number.value_upper_bound += 9
         new_number.value_lower_bound += 1
@@ -321,7 +397,8 @@ class NumberNormalizer(object):
         list[NNumber]
             変換後の数値表現
         """
-        new_numbers = deepcopy(numbers)
+        # fix_*_suは変換する場合のみ複製した数値表現を返すので、リストだけを複製する
+        new_numbers = list(numbers)
         i = 0
         while i < len(new_numbers):
             new_numbers[i] = self.fix_prefix_su(text, new_numbers[i])
@@ -369,13 +446,7 @@ class NumberNormalizer(object):
         list[NNumber]
             削除処理後の数値表現
         """
-        new_numbers = deepcopy(numbers)
-        for i, number in enumerate(new_numbers):
-            if self.is_only_kansuji_kurai_man(number.original_expr):
-                new_numbers[i] = None  # type: ignore
-
-        # 逆順にしていたのでもと順番に戻す
-        return [number for number in new_numbers if number]
+        return [number for number in numbers if not self.is_only_kansuji_kurai_man(number.original_expr)]
 
     def remove_unnecessary_data(self, numbers: list[NNumber]) -> list[NNumber]:
         """重複するような不要なデータを削除する.
@@ -1,5 +1,5 @@
 """時間系以外の数値表現の抽出・正規化処理を定義するモジュール."""
-from copy import deepcopy
+from typing import Optional
 
 from pynormalizenumexp.expression.base import INF, NumberModifier
 from pynormalizenumexp.expression.numerical import NumericalExpression, NumericalPattern
@@ -12,17 +12,17 @@ from .number_normalizer import NumberNormalizer
 class NumericalExpressionNormalizer(BaseNormalizer):
     """時間系以外の数値表現の抽出・正規化を行うクラス."""
 
-    def __init__(self, dict_loader: DictLoader) -> None:
+    def __init__(self, dict_loader: DictLoader, number_normalizer: Optional[NumberNormalizer] = None) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         dict_loader : DictLoader
             辞書ファイルのローダー
+        number_normalizer : Optional[NumberNormalizer], optional
+            数値の抽出・正規化に使うノーマライザ（Noneの場合は新たに作成する）, by default None
         """
-        super().__init__(dict_loader)
-
-        self.number_normalizer = NumberNormalizer(dict_loader)
+        super().__init__(dict_loader, number_normalizer)
 
         self.load_dictionaries("num_counter.json", "num_prefix_counter.json",
                                "num_prefix.json", "num_suffix.json")
@@ -113,7 +113,9 @@ class NumericalExpressionNormalizer(BaseNormalizer):
 
         # TODO : 今のところ特殊なタイプは分数しかないので、とりあえず保留
 
-        new_exprs = deepcopy(exprs)
+        # 補正する数値表現だけを複製する
+        new_exprs = list(exprs)
+        new_exprs[expr_id] = new_exprs[expr_id].copy()
         new_exprs[expr_id].position_end += len(matching_expr.pattern)
         new_exprs[expr_id].counter = matching_expr.counter
         new_exprs[expr_id] = self.multiply_numexp_value(new_exprs[expr_id], 10 ** matching_expr.si_prefix)
@@ -140,7 +142,9 @@ class NumericalExpressionNormalizer(BaseNormalizer):
         list[NumericalExpression]
             補正済みの数値表現
         """
-        new_num_exprs = deepcopy(num_exprs)
+        # 補正する数値表現だけを複製する
+        new_num_exprs = list(num_exprs)
+        new_num_exprs[expr_id] = new_num_exprs[expr_id].copy()
         new_num_exprs[expr_id].position_end += len(matching_expr.pattern)
         new_num_exprs[expr_id].counter = "%"
         new_num_exprs[expr_id].ordinary = False
@@ -181,7 +185,7 @@ class NumericalExpressionNormalizer(BaseNormalizer):
         NumericalExpression
             補正済みの数値表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if matching_expr.option == "counter":
             new_expr.position_start -= len(matching_expr.pattern)
             new_expr.counter = matching_expr.counter
@@ -213,7 +217,7 @@ class NumericalExpressionNormalizer(BaseNormalizer):
         NumericalExpression
             補正後の数値表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if number_modifier.process_type == "or_over":
             new_expr.value_upper_bound = INF
         elif number_modifier.process_type == "or_less":
@@ -328,7 +332,7 @@ class NumericalExpressionNormalizer(BaseNormalizer):
         NumericalExpression
             計算後の数値表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         new_expr.value_lower_bound *= x
         new_expr.value_upper_bound *= x
 
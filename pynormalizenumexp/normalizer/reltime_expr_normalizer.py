@@ -1,9 +1,10 @@
 """相対時間の抽出・正規化処理を定義するモジュール."""
-from copy import deepcopy
+from typing import Optional
 
 from pynormalizenumexp.expression.base import INF, NNumber, NTime, NumberModifier
 from pynormalizenumexp.expression.reltime import ReltimeExpression, ReltimePattern
 from pynormalizenumexp.utility.dict_loader import DictLoader, EnumExprType
+from pynormalizenumexp.utility.pattern_automaton import PatternAutomaton
 
 from .base import BaseNormalizer
 from .number_normalizer import NumberNormalizer
@@ -15,17 +16,20 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
     limited_expressions: list[ReltimePattern]
     prefix_counters: list[ReltimePattern]
 
-    def __init__(self, dict_loader: DictLoader) -> None:
+    def __init__(self, dict_loader: DictLoader, number_normalizer: Optional[NumberNormalizer] = None) -> None:
         """コンストラクタ.
 
         Parameters
         ----------
         dict_loader : DictLoader
             辞書ファイルのローダー
+        number_normalizer : Optional[NumberNormalizer], optional
+            数値の抽出・正規化に使うノーマライザ（Noneの場合は新たに作成する）, by default None
         """
-        super().__init__(dict_loader)
+        super().__init__(dict_loader, number_normalizer)
 
-        self.number_normalizer = NumberNormalizer(dict_loader)
+        # 「今日」「明日」などのprefix_counterだけの表現をテキストから一括で検索するためのオートマトン
+        self.prefix_counter_automaton = PatternAutomaton(dict())
 
         self.load_dictionaries("reltime_expression.json", "reltime_prefix_counter.json",
                                "reltime_prefix.json", "reltime_suffix.json")
@@ -60,6 +64,11 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
         for expr in self.limited_expressions:
             expr.set_total_number_of_place_holder()
             expr.set_len_of_after_final_place_holder()
+        for prefix_counter in self.prefix_counters:
+            prefix_counter.set_len_of_after_final_place_holder()
+        self.prefix_counter_automaton = PatternAutomaton(
+            {prefix_counter.pattern: i for i, prefix_counter in enumerate(self.prefix_counters)}
+        )
 
     def normalize_number(self, text: str) -> list[NNumber]:
         """テキストから数値表現を抽出する.
@@ -110,7 +119,7 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
         ReltimeExpression
             補正後の相対時間表現
         """
-        new_reltime_expr = deepcopy(reltime_expr)
+        new_reltime_expr = reltime_expr.copy()
         if process_type == "han":
             if len(matching_reltime_expr.corresponding_time_position) == 0:
                 return new_reltime_expr
@@ -153,7 +162,9 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
         list[ReltimeExpression]
             補正済みの相対時間表現
         """
-        new_exprs = deepcopy(exprs)
+        # 補正する相対時間表現だけを複製する
+        new_exprs = list(exprs)
+        new_exprs[expr_id] = new_exprs[expr_id].copy()
         final_expr_id = expr_id + matching_expr.total_number_of_place_holder
         new_exprs[expr_id].position_end = new_exprs[final_expr_id].position_end \
             + matching_expr.len_of_after_final_place_holder
@@ -188,7 +199,7 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
         ReltimeExpression
             補正済みの相対時間表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if matching_expr.option == "add_relation":
             # 「去年3月」などの、「相対時間表現」＋「絶対時間表現」からなる処理
             if self.normalizer_utility.is_null_time(new_expr.value_lower_bound_abs) \
@@ -230,7 +241,7 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
         ReltimeExpression
             補正後の相対時間表現
         """
-        new_expr = deepcopy(expr)
+        new_expr = expr.copy()
         if number_modifier.process_type == "about":
             val_lb_rel, val_ub_rel = self.do_time_about(new_expr)
             new_expr.value_lower_bound_rel = val_lb_rel
@@ -327,33 +338,39 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
 
         exprs = [expr for expr in exprs if expr]
 
-        # 今日、明日、来年だけの表現を抽出する
+        # 今日、明日、来年だけの表現を抽出する（同じ表現が複数回出現する場合もすべて抽出する）
         add_reltime_exprs: list[ReltimeExpression] = []
-        for prefix_counter in self.prefix_counters:
-            try:
-                idx = text.index(prefix_counter.pattern)
-                prefix_counter.set_len_of_after_final_place_holder()
-                number = NNumber(prefix_counter.pattern, idx, idx+prefix_counter.len_of_after_final_place_holder)
-                if is_registered(number, exprs):
-                    continue
-
-                reltime_expr = ReltimeExpression(number)
-                relation_val = int(prefix_counter.process_type[0])
-                if prefix_counter.corresponding_time_position[0] == "y":
-                    reltime_expr.value_lower_bound_rel.year = reltime_expr.value_upper_bound_rel.year = relation_val
-                elif prefix_counter.corresponding_time_position[0] == "m":
-                    reltime_expr.value_lower_bound_rel.month = reltime_expr.value_upper_bound_rel.month = relation_val
-                elif prefix_counter.corresponding_time_position[0] == "d":
-                    reltime_expr.value_lower_bound_rel.day = reltime_expr.value_upper_bound_rel.day = relation_val
-
-                add_reltime_exprs.append(reltime_expr)
-            except ValueError:
-                pass
+        for idx, _, pattern_id in self.prefix_counter_automaton.search_all(text):
+            prefix_counter = self.prefix_counters[pattern_id]
+            number = NNumber(prefix_counter.pattern, idx, idx+prefix_counter.len_of_after_final_place_holder)
+            if is_registered(number, exprs):
+                continue
+
+            reltime_expr = ReltimeExpression(number)
+            relation_val = int(prefix_counter.process_type[0])
+            if prefix_counter.corresponding_time_position[0] == "y":
+                reltime_expr.value_lower_bound_rel.year = reltime_expr.value_upper_bound_rel.year = relation_val
+            elif prefix_counter.corresponding_time_position[0] == "m":
+                reltime_expr.value_lower_bound_rel.month = reltime_expr.value_upper_bound_rel.month = relation_val
+            elif prefix_counter.corresponding_time_position[0] == "d":
+                reltime_expr.value_lower_bound_rel.day = reltime_expr.value_upper_bound_rel.day = relation_val
+
+            add_reltime_exprs.append(reltime_expr)
 
         exprs += add_reltime_exprs
 
         return exprs
 
+    def get_patterns_without_number(self) -> list[str]:
+        """数値を含まなくても表現として抽出されるパターン文字列を取得する.
+
+        Returns
+        -------
+        list[str]
+            パターン文字列（「今日」「明日」「来年」などのprefix_counterのパターン）
+        """
+        return [prefix_counter.pattern for prefix_counter in self.prefix_counters]
+
     def do_option_han(self, reltime_expr: ReltimeExpression,  # noqa: C901
                       corresponding_time_position: str) -> tuple[NTime, NTime]:
         """「半」表現の場合の日付計算を行う.
@@ -653,7 +670,7 @@ class ReltimeExpressionNormalizer(BaseNormalizer):
         ReltimeExpression
             セット後の相対時間表現
         """
-        new_reltime_expr = deepcopy(reltime_expr)
+        new_reltime_expr = reltime_expr.copy()
         if time_position == "y":
             new_reltime_expr.value_lower_bound_abs.year = integrate_reltime_expr.org_value_lower_bound
             new_reltime_expr.value_upper_bound_abs.year = integrate_reltime_expr.org_value_upper_bound
@@ -1,5 +1,4 @@
 """数値表現に関わる表記（プラスマイナスや小数点、カンマ、範囲文字など）を考慮した数値表現の変換処理定義モジュール."""
-from copy import deepcopy
 from typing import Optional
 
 from pynormalizenumexp.expression.base import INF, NNumber
@@ -34,7 +33,8 @@ class SymbolFixer(object):
         list[NNumber]
             修正後の数値表現
         """
-        new_numbers = deepcopy(numbers)
+        # fix_*_symbolは修正する場合のみ複製した数値表現を返すので、リストだけを複製する
+        new_numbers = list(numbers)
         i = 0
         while i < len(new_numbers):
             number = new_numbers[i]
@@ -158,7 +158,7 @@ class SymbolFixer(object):
         NNumber
             変換後の数値表現
         """
-        new_number = deepcopy(number)
+        new_number = number.copy()
 
         # 3.14などの小数点以下の文字列（14）を数値（0.14）に変換する
         decimal = self.create_decimal_value(next_number)
@@ -193,7 +193,7 @@ class SymbolFixer(object):
         NNumber
             変換後の数値表現
         """
-        new_number = deepcopy(number)
+        new_number = number.copy()
         new_number.value_upper_bound = next_number.value_lower_bound
         new_number.original_expr += range_string + next_number.original_expr
         new_number.position_end = next_number.position_end
@@ -215,10 +215,9 @@ class SymbolFixer(object):
         NNumber
             プラス/マイナス表現を付加した数値表現
         """
-        new_number = deepcopy(number)
-
         plus_expr = self.extract_plus(text, number.position_start-1)
         if plus_expr:
+            new_number = number.copy()
             new_number.original_expr = plus_expr + number.original_expr
             new_number.position_start -= len(plus_expr)
 
@@ -226,6 +225,7 @@ class SymbolFixer(object):
 
         minus_expr = self.extract_minus(text, number.position_start-1)
         if minus_expr:
+            new_number = number.copy()
             new_number.original_expr = minus_expr + number.original_expr
             new_number.value_lower_bound *= -1
             new_number.value_upper_bound *= -1
@@ -233,7 +233,7 @@ class SymbolFixer(object):
 
             return new_number
 
-        return new_number
+        return number
 
     def fix_intermediate_symbol(self, text: str, number: NNumber, next_number: NNumber) -> NNumber:
         """2つの数値表現の間にある記号などに応じて数値表現をマージする.
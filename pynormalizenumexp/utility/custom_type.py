@@ -63,10 +63,41 @@ ReturnExpressionDict = TypedDict("ReturnExpressionDict", {
     "position_start": int,
     "position_end": int,
     "counter": str,
-    "value_lower_bound": Union[int, float, dict[str, Union[int, float]]],
-    "value_upper_bound": Union[int, float, dict[str, Union[int, float]]],
+    "value_lower_bound": Optional[Union[int, float, dict[str, Union[int, float]]]],
+    "value_upper_bound": Optional[Union[int, float, dict[str, Union[int, float]]]],
     "value_lower_bound_abs": Optional[dict[str, Union[int, float]]],
     "value_upper_bound_abs": Optional[dict[str, Union[int, float]]],
     "value_lower_bound_rel": Optional[dict[str, Union[int, float]]],
-    "value_upper_bound_rel": Optional[dict[str, Union[int, float]]]
+    "value_upper_bound_rel": Optional[dict[str, Union[int, float]]],
+    "options": list[str]
+})
+
+# 処理段階ごとの計測結果辞書
+StageStatDict = TypedDict("StageStatDict", {
+    "count": int,
+    "total_sec": float,
+    "mean_sec": float
+})
+
+# 数値表現を含み得ないテキストの事前判定の集計結果辞書
+PrefilterStatDict = TypedDict("PrefilterStatDict", {
+    "total": int,
+    "skipped": int
+})
+
+# 数値文字列の変換結果キャッシュの集計結果辞書
+NumberCacheStatDict = TypedDict("NumberCacheStatDict", {
+    "hits": int,
+    "misses": int,
+    "size": int,
+    "max_size": int
+})
+
+# 抽出・正規化結果のキャッシュの集計結果辞書
+ResultCacheStatDict = TypedDict("ResultCacheStatDict", {
+    "hits": int,
+    "misses": int,
+    "hit_rate": float,
+    "entries": int,
+    "bytes": int
 })
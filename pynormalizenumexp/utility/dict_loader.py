@@ -1,4 +1,5 @@
 """辞書ファイルの読み込み定義モジュール."""
+import hashlib
 import json
 import os
 from dataclasses import dataclass
@@ -75,6 +76,25 @@ class DictLoader(object):
         else:
             self.custom_patterns = []
 
+    def make_cache_key(self, name: str) -> str:
+        """キャッシュのキーを生成する.
+
+        Parameters
+        ----------
+        name : str
+            キャッシュの名前（キャッシュを利用するクラス名など）
+
+        Returns
+        -------
+        str
+            言語とカスタム辞書の内容から計算したハッシュ値
+        """
+        hash_obj = hashlib.sha256()
+        hash_obj.update(json.dumps([self.language, name]).encode("utf-8"))
+        hash_obj.update(json.dumps(self.custom_patterns, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+
+        return hash_obj.hexdigest()
+
     def make_chinese_char_pattern(self, pattern: ChineseCharacterDict) -> ChineseCharacter:
         """漢数字パターンオブジェクトの生成.
 
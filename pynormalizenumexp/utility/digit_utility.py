@@ -23,6 +23,11 @@ class DigitUtility(object):
         self.str_to_notation_type: dict[str, NotationType] = {}
         self.kansuji_09_to_value: dict[str, int] = {}
         self.kansuji_kurai_to_power_val: dict[str, int] = {}
+        # 1文字ごとの数字種（全数字種版）の表（テキスト全体の数字種を1回の走査で調べるために使う）
+        self.char_to_full_notation_type: dict[str, NotationType] = {}
+        # 数字である文字が連続する箇所を探索する正規表現
+        self.number_chars_reg: re.Pattern[str] = re.compile("")
+        self.init_notation_type_table()
 
     def init_kansuji(self) -> None:
         """漢数字に関する初期化処理."""
@@ -47,6 +52,27 @@ class DigitUtility(object):
 
         self.kansuji_kurai_to_power_val["　"] = 0
 
+        self.init_notation_type_table()
+
+    def init_notation_type_table(self) -> None:
+        """文字ごとの数字種の表と数字の連続を探索する正規表現の初期化処理.
+
+        Notes
+        -----
+            漢数字の情報はinit_kansujiで読み込んだものを使う（init_kansujiの呼び出し前はアラビア数字だけを対象にする）
+        """
+        # chars2full_notation_typeと同じく、アラビア数字の判定を漢数字の判定より優先する
+        self.char_to_full_notation_type = dict(self.str_to_notation_type)
+        for hankakusuji, zenkakusuji in zip("0123456789", "０１２３４５６７８９"):
+            self.char_to_full_notation_type[hankakusuji] = NotationType.HANKAKU
+            self.char_to_full_notation_type[zenkakusuji] = NotationType.ZENKAKU
+
+        number_chars = "".join(
+            re.escape(char) for char, notation_type in self.char_to_full_notation_type.items()
+            if len(char) == 1 and notation_type != NotationType.NOT_NUMBER
+        )
+        self.number_chars_reg = re.compile(f"[{number_chars}]+")
+
     def is_hankakusuji(self, chars: Optional[str]) -> bool:
         """与えられた文字列が半角数字かどうか判定する.
 
@@ -313,6 +339,9 @@ class DigitUtility(object):
         int
             数字種（Enumの変数）
         """
+        if chars is not None and len(chars) == 1 and chars in self.char_to_full_notation_type:
+            return self.char_to_full_notation_type[chars]
+
         if self.is_hankakusuji(chars):
             return NotationType.HANKAKU
         elif self.is_zenkakusuji(chars):
@@ -325,3 +354,26 @@ class DigitUtility(object):
             return NotationType.KANSUJI_KURAI_MAN
         else:
             return NotationType.NOT_NUMBER
+
+    def text2full_notation_type(self, text: str) -> list[NotationType]:
+        """テキストの各文字がどの数字種か調べる（全数字種版）.
+
+        Parameters
+        ----------
+        text : str
+            調査対象のテキスト
+
+        Returns
+        -------
+        list[NotationType]
+            各文字の数字種（Enumの変数）
+
+        Notes
+        -----
+            init_kansujiで作成した文字ごとの数字種の表を引くだけなので、
+            1文字ずつchars2full_notation_typeを呼び出すのと同じ結果をテキスト1回の走査で得られる
+        """
+        char_to_full_notation_type = self.char_to_full_notation_type
+        not_number = NotationType.NOT_NUMBER
+
+        return [char_to_full_notation_type.get(char, not_number) for char in text]
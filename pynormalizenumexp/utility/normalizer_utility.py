@@ -1,9 +1,108 @@
 """正規化・補正処理における共通処理を定義モジュール."""
 import re
-from typing import Optional, Tuple
+from typing import Union
 
 from pynormalizenumexp.expression.base import INF, PLACE_HOLDER, NNumber, NTime
 
+from .pattern_trie import PatternTrie
+
+PLACE_HOLDER_RUN_REG = re.compile(f"[{PLACE_HOLDER}]{{2,}}", flags=re.DOTALL)
+
+
+class ShortenedText(object):
+    """連続するPlaceholderを縮約したテキストと、元のテキストとの位置の対応を保持するクラス.
+
+    Notes
+    -----
+        * 元のテキストの任意の位置より前/後ろを縮約したテキストを、縮約済みのテキストの範囲として求められるようにする
+        * 数値表現ごとにテキストを切り出して縮約し直さずに済むよう、1テキストにつき1回だけ構築する
+    """
+
+    def __init__(self, text: str) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        text : str
+            数値文字列がPlaceholderに置換されたテキスト
+        """
+        self.original_text = text
+
+        # positions[p]：元のテキストの位置pの文字が、縮約後のテキストのどの位置に対応するか
+        # （p=len(text)は縮約後のテキストの末尾に対応させる）
+        self.positions: list[int] = []
+        shortened_parts: list[str] = []
+        offset = 0
+        prev_end = 0
+        for match in PLACE_HOLDER_RUN_REG.finditer(text):
+            start, end = match.span()
+            self.positions.extend(range(offset, offset + start - prev_end))
+            offset += start - prev_end
+            # 連続するPlaceholderはすべて縮約後の1文字に対応する
+            self.positions.extend([offset] * (end - start))
+            offset += 1
+            shortened_parts.append(text[prev_end:start])
+            shortened_parts.append(PLACE_HOLDER)
+            prev_end = end
+        self.positions.extend(range(offset, offset + len(text) - prev_end + 1))
+        shortened_parts.append(text[prev_end:])
+
+        self.text = "".join(shortened_parts)
+
+    def search_prefix(self, position: int, patterns: Union[dict[str, int], PatternTrie]) -> int:
+        """元のテキストの位置以降を縮約したテキストのprefixになっているパターンを探索する.
+
+        Parameters
+        ----------
+        position : int
+            元のテキストでの探索開始位置
+        patterns : Union[dict[str, int], PatternTrie]
+            パターン情報（Key：パターン文字列、Value：パターンID）またはそれを構築済みのトライ木
+
+        Returns
+        -------
+        int
+            マッチしたパターンID（マッチするものがなければ-1）
+
+        Notes
+        -----
+            NormalizerUtility().search_pattern(text[position:], patterns, "prefix")と同じ結果になる
+        """
+        if not isinstance(patterns, PatternTrie):
+            patterns = PatternTrie(patterns)
+
+        position = min(position, len(self.original_text))
+
+        return patterns.search_prefix(self.text, self.positions[position])
+
+    def search_suffix(self, position: int, patterns: Union[dict[str, int], PatternTrie]) -> int:
+        """元のテキストの位置より前を縮約したテキストのsuffixになっているパターンを探索する.
+
+        Parameters
+        ----------
+        position : int
+            元のテキストでの探索終了位置
+        patterns : Union[dict[str, int], PatternTrie]
+            パターン情報（Key：パターン文字列、Value：パターンID）またはそれを構築済みのトライ木
+
+        Returns
+        -------
+        int
+            マッチしたパターンID（マッチするものがなければ-1）
+
+        Notes
+        -----
+            NormalizerUtility().search_pattern(text[:position], patterns, "suffix")と同じ結果になる
+        """
+        if not isinstance(patterns, PatternTrie):
+            patterns = PatternTrie(patterns)
+
+        position = min(position, len(self.original_text))
+        # 位置の直前の文字が縮約後のテキストのどこに対応するかで終了位置を決める
+        end = self.positions[position - 1] + 1 if position > 0 else 0
+
+        return patterns.search_suffix(self.text, end)
+
 
 class NormalizerUtility(object):
     """正規化・補正処理における共通処理のクラス."""
@@ -48,17 +147,17 @@ class NormalizerUtility(object):
         -----
             「****年*月」 -> 「*年*月」のように数の部分を縮約する
         """
-        return re.sub(f"[{PLACE_HOLDER}]{{2,}}", PLACE_HOLDER, text, flags=re.DOTALL)
+        return PLACE_HOLDER_RUN_REG.sub(PLACE_HOLDER, text)
 
-    def search_pattern(self, text: str, patterns: dict[str, int], search_type: str) -> int:
+    def search_pattern(self, text: str, patterns: Union[dict[str, int], PatternTrie], search_type: str) -> int:
         """patternsの中から、テキストのprefix/suffixになっているものを探索する.
 
         Parameters
         ----------
         text : str
             探索対象のテキスト
-        patterns : dict[str, int]
-            パターン情報（Key：パターン文字列、Value：パターンID）
+        patterns : Union[dict[str, int], PatternTrie]
+            パターン情報（Key：パターン文字列、Value：パターンID）またはそれを構築済みのトライ木
         search_type : str
             先頭から見るprefixか末尾から見るsuffixか
 
@@ -70,35 +169,30 @@ class NormalizerUtility(object):
         Notes
         -----
             複数パターンがある場合はテキストのprefix/suffixが最長一致するものを採用する
+            辞書で渡された場合はその場でトライ木を構築するので、繰り返し探索する場合はPatternTrieを渡すこと
         """
+        if not isinstance(patterns, PatternTrie):
+            patterns = PatternTrie(patterns)
+
         shortened_text = self.shorten_place_holder_in_text(text)
         if search_type == "prefix":
-            match_patterns = [(p_str, p_id) for p_str, p_id in patterns.items() if shortened_text.startswith(p_str)]
+            return patterns.search_prefix(shortened_text)
         elif search_type == "suffix":
-            match_patterns = [(p_str, p_id) for p_str, p_id in patterns.items() if shortened_text.endswith(p_str)]
+            return patterns.search_suffix(shortened_text)
         else:
             raise ValueError(f'Invalid search_type: "{search_type}"')
 
-        fixed_pattern: Optional[Tuple[str, int]] = None
-        for pattern in match_patterns:
-            if fixed_pattern is None or len(pattern[0]) > len(fixed_pattern[0]):
-                fixed_pattern = pattern
-
-        if fixed_pattern is not None:
-            return fixed_pattern[1]
-
-        return -1
-
-    def search_prefix_number_modifier(self, text: str, expr_position_start: int, patterns: dict[str, int]) -> int:
+    def search_prefix_number_modifier(self, text: Union[str, ShortenedText], expr_position_start: int,
+                                      patterns: Union[dict[str, int], PatternTrie]) -> int:
         """数値表現の前に来る修飾表現を検索する.
 
         Parameters
         ----------
-        text : str
-            検索対象のテキスト
+        text : Union[str, ShortenedText]
+            検索対象のテキスト（縮約済みのものも可）
         expr_position_start : int
             数値表現の開始位置
-        patterns : dict[str, int]
+        patterns : Union[dict[str, int], PatternTrie]
             修飾表現パターン
 
         Returns
@@ -110,22 +204,26 @@ class NormalizerUtility(object):
         -----
             数値表現の直前から探していくので、search_patternにはsuffixを指定している
         """
-        before_text = text[:expr_position_start]
-
         # 「コンビニで$100を払った」の場合、「100」が数値表現になるので「コンビニで$」を末尾から見ていく
         # -> 「$」が修飾表現に該当する
+        if isinstance(text, ShortenedText):
+            return text.search_suffix(expr_position_start, patterns)
+
+        before_text = text[:expr_position_start]
+
         return self.search_pattern(before_text, patterns, "suffix")
 
-    def search_suffix_number_modifier(self, text: str, expr_position_end: int, patterns: dict[str, int]) -> int:
+    def search_suffix_number_modifier(self, text: Union[str, ShortenedText], expr_position_end: int,
+                                      patterns: Union[dict[str, int], PatternTrie]) -> int:
         """数値表現の後に来る修飾表現を検索する.
 
         Parameters
         ----------
-        text : str
-            検索対象のテキスト
+        text : Union[str, ShortenedText]
+            検索対象のテキスト（縮約済みのものも可）
         expr_position_end : int
             数値表現の終了位置
-        patterns : dict[str, int]
+        patterns : Union[dict[str, int], PatternTrie]
             修飾表現パターン
 
         Returns
@@ -137,6 +235,9 @@ class NormalizerUtility(object):
         -----
             数値表現の直後から探していくので、search_patternにはprefixを指定している
         """
+        if isinstance(text, ShortenedText):
+            return text.search_prefix(expr_position_end, patterns)
+
         after_text = text[expr_position_end:]
 
         return self.search_pattern(after_text, patterns, "prefix")
@@ -173,7 +274,7 @@ class NormalizerUtility(object):
         -----
             Nullの場合はNTimeのすべての属性がINFまたは-INFになっている
         """
-        return time == NTime(INF) or time == NTime(-INF)
+        return time.is_null()
 
     def identify_time_detail(self, time: NTime) -> str:
         """与えられた時間オブジェクトがどの単位のものかを判定する.
@@ -192,17 +293,4 @@ class NormalizerUtility(object):
         -----
             s: 秒、mn: 分、h: 時、d: 日、m: 月、 y: 年
         """
-        if self.is_finite(time.second):
-            return "s"
-        elif self.is_finite(time.minute):
-            return "mn"
-        elif self.is_finite(time.hour):
-            return "h"
-        elif self.is_finite(time.day):
-            return "d"
-        elif self.is_finite(time.month):
-            return "m"
-        elif self.is_finite(time.year):
-            return "y"
-        else:
-            return ""
+        return time.identify_time_detail()
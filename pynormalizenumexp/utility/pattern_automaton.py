@@ -0,0 +1,116 @@
+"""複数パターン文字列の一括検索用オートマトン（Aho-Corasick法）の定義モジュール."""
+
+
+class PatternAutomaton(object):
+    """複数パターン文字列の出現箇所をテキストの1回の走査ですべて検索するオートマトンクラス.
+
+    Notes
+    -----
+        * パターン文字列のトライ木に、遷移に失敗した場合の遷移先（失敗リンク）を加えたもの
+        * 各ノードは子ノードへの遷移（Key：文字、Value：ノードID）と、そのノードで出現が確定するパターンIDとパターン長のリストで表現する
+        * 空文字列のパターンは検索対象にしない
+    """
+
+    def __init__(self, patterns: dict[str, int]) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        patterns : dict[str, int]
+            パターン情報（Key：パターン文字列、Value：パターンID）
+        """
+        self.patterns = patterns
+
+        self.children: list[dict[str, int]] = [{}]
+        self.failures: list[int] = [0]
+        self.outputs: list[list[tuple[int, int]]] = [[]]
+
+        for pattern, pattern_id in patterns.items():
+            if len(pattern) > 0:
+                self.add_pattern(pattern, pattern_id)
+        self.build_failures()
+
+    def __len__(self) -> int:
+        """登録されているパターン数を返す.
+
+        Returns
+        -------
+        int
+            パターン数
+        """
+        return len(self.patterns)
+
+    def add_pattern(self, pattern: str, pattern_id: int) -> None:
+        """トライ木にパターン文字列を追加する.
+
+        Parameters
+        ----------
+        pattern : str
+            追加するパターン文字列
+        pattern_id : int
+            パターンID
+        """
+        node = 0
+        for char in pattern:
+            next_node = self.children[node].get(char)
+            if next_node is None:
+                next_node = len(self.children)
+                self.children[node][char] = next_node
+                self.children.append({})
+                self.failures.append(0)
+                self.outputs.append([])
+            node = next_node
+
+        self.outputs[node].append((pattern_id, len(pattern)))
+
+    def build_failures(self) -> None:
+        """幅優先でトライ木をたどり、各ノードの失敗リンクを設定する.
+
+        Notes
+        -----
+            失敗リンク先で出現が確定するパターンも、そのノードで出現が確定するパターンに加える
+        """
+        queue = list(self.children[0].values())
+        i = 0
+        while i < len(queue):
+            node = queue[i]
+            i += 1
+            for char, child in self.children[node].items():
+                failure = self.failures[node]
+                while failure != 0 and char not in self.children[failure]:
+                    failure = self.failures[failure]
+                self.failures[child] = self.children[failure].get(char, 0)
+                self.outputs[child] = self.outputs[child] + self.outputs[self.failures[child]]
+                queue.append(child)
+
+    def search_all(self, text: str) -> list[tuple[int, int, int]]:
+        """テキスト中のパターン文字列の出現箇所をすべて検索する.
+
+        Parameters
+        ----------
+        text : str
+            検索対象のテキスト
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            出現箇所ごとの開始位置、終了位置、パターンIDのタプルのリスト（終了位置の昇順、同じ終了位置では長いパターンから）
+
+        Notes
+        -----
+            重なり合う出現箇所（「一昨年」と「昨年」など）もそれぞれ出力する
+        """
+        children = self.children
+        failures = self.failures
+        outputs = self.outputs
+
+        matches: list[tuple[int, int, int]] = []
+        node = 0
+        for i, char in enumerate(text):
+            while node != 0 and char not in children[node]:
+                node = failures[node]
+            node = children[node].get(char, 0)
+            for pattern_id, pattern_length in outputs[node]:
+                matches.append((i + 1 - pattern_length, i + 1, pattern_id))
+
+        return matches
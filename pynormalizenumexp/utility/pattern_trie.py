@@ -0,0 +1,130 @@
+"""パターン文字列の最長一致検索用トライ木の定義モジュール."""
+from typing import Iterable, Optional
+
+
+class PatternTrie(object):
+    """パターン文字列の最長一致検索用トライ木クラス.
+
+    Notes
+    -----
+        * prefix検索用のトライ木と、パターン文字列を反転させたsuffix検索用のトライ木を持つ
+        * 各ノードは子ノードへの遷移（Key：文字、Value：ノードID）とパターンID（パターンの終端でなければ-1）で表現する
+    """
+
+    def __init__(self, patterns: dict[str, int]) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        patterns : dict[str, int]
+            パターン情報（Key：パターン文字列、Value：パターンID）
+        """
+        self.patterns = patterns
+
+        self.prefix_children: list[dict[str, int]] = [{}]
+        self.prefix_pattern_ids: list[int] = [-1]
+        self.suffix_children: list[dict[str, int]] = [{}]
+        self.suffix_pattern_ids: list[int] = [-1]
+
+        for pattern, pattern_id in patterns.items():
+            self.add_pattern(self.prefix_children, self.prefix_pattern_ids, pattern, pattern_id)
+            self.add_pattern(self.suffix_children, self.suffix_pattern_ids, reversed(pattern), pattern_id)
+
+    def __len__(self) -> int:
+        """登録されているパターン数を返す.
+
+        Returns
+        -------
+        int
+            パターン数
+        """
+        return len(self.patterns)
+
+    def add_pattern(self, children: list[dict[str, int]], pattern_ids: list[int],
+                    pattern: Iterable[str], pattern_id: int) -> None:
+        """トライ木にパターン文字列を追加する.
+
+        Parameters
+        ----------
+        children : list[dict[str, int]]
+            追加先のトライ木の各ノードの遷移
+        pattern_ids : list[int]
+            追加先のトライ木の各ノードのパターンID
+        pattern : Iterable[str]
+            追加するパターン文字列（suffix検索用の場合は反転したもの）
+        pattern_id : int
+            パターンID
+        """
+        node = 0
+        for char in pattern:
+            next_node = children[node].get(char)
+            if next_node is None:
+                next_node = len(children)
+                children[node][char] = next_node
+                children.append({})
+                pattern_ids.append(-1)
+            node = next_node
+
+        pattern_ids[node] = pattern_id
+
+    def search_prefix(self, text: str, start: int = 0) -> int:
+        """テキストのprefixになっているパターンのうち最長のものを探索する.
+
+        Parameters
+        ----------
+        text : str
+            探索対象のテキスト
+        start : int, optional
+            探索を開始する位置（text[start:]のprefixを探索する）, by default 0
+
+        Returns
+        -------
+        int
+            マッチしたパターンID（マッチするものがなければ-1）
+        """
+        children = self.prefix_children
+        pattern_ids = self.prefix_pattern_ids
+
+        node = 0
+        matched_id = pattern_ids[node]
+        for i in range(start, len(text)):
+            next_node = children[node].get(text[i])
+            if next_node is None:
+                break
+            node = next_node
+            if pattern_ids[node] != -1:
+                matched_id = pattern_ids[node]
+
+        return matched_id
+
+    def search_suffix(self, text: str, end: Optional[int] = None) -> int:
+        """テキストのsuffixになっているパターンのうち最長のものを探索する.
+
+        Parameters
+        ----------
+        text : str
+            探索対象のテキスト
+        end : Optional[int], optional
+            探索を終了する位置（text[:end]のsuffixを探索する）, by default None（テキストの末尾）
+
+        Returns
+        -------
+        int
+            マッチしたパターンID（マッチするものがなければ-1）
+        """
+        children = self.suffix_children
+        pattern_ids = self.suffix_pattern_ids
+
+        node = 0
+        matched_id = pattern_ids[node]
+        if end is None:
+            end = len(text)
+        for i in range(end - 1, -1, -1):
+            next_node = children[node].get(text[i])
+            if next_node is None:
+                break
+            node = next_node
+            if pattern_ids[node] != -1:
+                matched_id = pattern_ids[node]
+
+        return matched_id
@@ -0,0 +1,96 @@
+"""別スレッドでの先読みの定義モジュール."""
+import threading
+from queue import Full, Queue
+from typing import Any, Iterable, Iterator, Optional
+
+# 先読みの終端を表すオブジェクト
+END_OF_ITEMS = object()
+
+
+class Prefetcher(object):
+    """イテラブルの要素を別スレッドで先読みするクラス.
+
+    Notes
+    -----
+        * 読み込み中に発生した例外は、それまでの要素を返した後に呼び出し元に送出する
+        * stopを呼ぶと、先読み用のスレッドはキューの空きを待たずに終了する
+    """
+
+    def __init__(self, items: Iterable[Any], maxsize: int) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+            先読みするイテラブル
+        maxsize : int
+            先読みしておく要素の最大数（0以下の場合は制限しない）
+        """
+        self.items = items
+        self.queue: Queue[tuple[Any, Optional[BaseException]]] = Queue(maxsize=maxsize)
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.read, daemon=True)
+
+    def put(self, item: Any, error: Optional[BaseException] = None) -> bool:
+        """キューに空きができるまで待って要素を追加する.
+
+        Parameters
+        ----------
+        item : Any
+            追加する要素
+        error : Optional[BaseException], optional
+            読み込み中に発生した例外（終端のみに付ける）, by default None
+
+        Returns
+        -------
+        bool
+            追加できたかどうか（追加する前にstopが呼ばれた場合はFalse）
+        """
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put((item, error), timeout=0.1)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def read(self) -> None:
+        """先読み用のスレッドで要素を読み込み、最後に終端を追加する."""
+        try:
+            for item in self.items:
+                if not self.put(item):
+                    return
+        except BaseException as e:
+            self.put(END_OF_ITEMS, e)
+            return
+        self.put(END_OF_ITEMS)
+
+    def start(self) -> None:
+        """先読み用のスレッドを開始する."""
+        self.thread.start()
+
+    def stop(self) -> None:
+        """先読み用のスレッドを終了させる."""
+        self.stop_event.set()
+
+    def iter_items(self) -> Iterator[Any]:
+        """先読みした要素を1件ずつ返す.
+
+        Yields
+        ------
+        Any
+            入力と同じ順序の要素
+
+        Raises
+        ------
+        BaseException
+            読み込み中に発生した例外
+        """
+        while True:
+            item, error = self.queue.get()
+            if item is END_OF_ITEMS:
+                if error is not None:
+                    raise error
+                return
+            yield item
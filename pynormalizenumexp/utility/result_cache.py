@@ -0,0 +1,153 @@
+"""抽出・正規化結果のキャッシュの定義モジュール."""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from .custom_type import ResultCacheStatDict
+
+# キャッシュするテキスト数の上限のデフォルト値
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ResultCache(object):
+    """テキストごとの抽出・正規化結果を最近使われた順に保持するキャッシュクラス.
+
+    Notes
+    -----
+        * 件数の上限とおおよそのバイト数の上限のどちらかを超えた場合、最も長く使われていないものから削除する
+        * 複数のインスタンスやスレッドで共有できる（キーに設定の情報を含めることで、異なる設定の結果が混ざらないようにする）
+        * 保持するオブジェクトは呼び出し側で複製してから利用・変更すること
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: Optional[int] = None) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            キャッシュする件数の上限, by default DEFAULT_MAX_ENTRIES
+        max_bytes : Optional[int], optional
+            キャッシュするオブジェクトのおおよそのバイト数の合計の上限（Noneの場合は制限しない）, by default None
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """キャッシュしている件数を返す.
+
+        Returns
+        -------
+        int
+            キャッシュしている件数
+        """
+        return len(self.entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """pickle化する状態を返す（ロックはpickle化できないので除く）.
+
+        Returns
+        -------
+        dict[str, Any]
+            pickle化する属性
+        """
+        state = self.__dict__.copy()
+        del state["lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """pickleから状態を復元する.
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            pickle化した属性
+        """
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """キャッシュからオブジェクトを取得する.
+
+        Parameters
+        ----------
+        key : Hashable
+            キャッシュのキー
+
+        Returns
+        -------
+        Optional[Any]
+            キャッシュしていたオブジェクト（キャッシュしていない場合はNone）
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """オブジェクトをキャッシュに追加する.
+
+        Parameters
+        ----------
+        key : Hashable
+            キャッシュのキー
+        value : Any
+            キャッシュするオブジェクト
+        size : int
+            キャッシュするオブジェクトのおおよそのバイト数
+
+        Notes
+        -----
+            バイト数の上限を超える大きさのオブジェクトはキャッシュしない
+        """
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self.lock:
+            old_entry = self.entries.pop(key, None)
+            if old_entry is not None:
+                self.total_bytes -= old_entry[1]
+
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+
+            while len(self.entries) > self.max_entries \
+                    or (self.max_bytes is not None and self.total_bytes > self.max_bytes):
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def get_stats(self) -> ResultCacheStatDict:
+        """キャッシュの集計結果を取得する.
+
+        Returns
+        -------
+        ResultCacheStatDict
+            ヒット数、ミス数、ヒット率、キャッシュしている件数とおおよそのバイト数
+        """
+        with self.lock:
+            total = self.hits + self.misses
+            return ResultCacheStatDict(hits=self.hits, misses=self.misses, hit_rate=self.hits / total if total > 0 else 0.0,
+                                       entries=len(self.entries), bytes=self.total_bytes)
+
+    def clear(self) -> None:
+        """キャッシュと集計結果を初期化する."""
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
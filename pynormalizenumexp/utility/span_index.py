@@ -0,0 +1,56 @@
+"""テキスト中の区間の包含判定用インデックスの定義モジュール."""
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable
+
+
+class SpanIndex(object):
+    """テキスト中の区間（開始位置・終了位置）の包含判定用インデックスクラス.
+
+    Notes
+    -----
+        * 区間を開始位置の昇順に並べ、先頭からの終了位置の最大値を保持する
+        * 開始位置が判定対象の開始位置以下の区間のうち、終了位置の最大値が判定対象の終了位置以上であれば、判定対象を含む区間が存在する
+    """
+
+    def __init__(self, spans: Iterable[tuple[int, int]]) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        spans : Iterable[tuple[int, int]]
+            区間の開始位置と終了位置のタプル
+        """
+        sorted_spans = sorted(spans)
+
+        self.starts = [start for start, _ in sorted_spans]
+        self.max_ends = list(accumulate((end for _, end in sorted_spans), max))
+
+    def __len__(self) -> int:
+        """登録されている区間数を返す.
+
+        Returns
+        -------
+        int
+            区間数
+        """
+        return len(self.starts)
+
+    def is_contained(self, start: int, end: int) -> bool:
+        """与えられた区間を含む区間が存在するかどうか判定する.
+
+        Parameters
+        ----------
+        start : int
+            判定対象の区間の開始位置
+        end : int
+            判定対象の区間の終了位置
+
+        Returns
+        -------
+        bool
+            True：含む区間が存在する、False：含む区間が存在しない
+        """
+        i = bisect_right(self.starts, start)
+
+        return i > 0 and self.max_ends[i-1] >= end
@@ -0,0 +1,116 @@
+"""抽出・正規化処理の段階ごとの処理時間を計測するモジュール."""
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from .custom_type import StageStatDict
+
+
+class StageProfiler(object):
+    """抽出・正規化処理の段階ごとの処理時間と呼び出し回数を集計するクラス.
+
+    Notes
+    -----
+        計測対象のメソッドをインスタンス属性のラッパーで上書きすることで計測するので、
+        計測を無効にしている間は処理時間に影響しない
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, float], None]] = None) -> None:
+        """コンストラクタ.
+
+        Parameters
+        ----------
+        callback : Optional[Callable[[str, float], None]]
+            計測のたびに段階名と処理時間（秒）を渡して呼び出す関数（外部の監視システムへの連携用）, default None
+        """
+        self.callback = callback
+        self.counts: dict[str, int] = {}
+        self.total_secs: dict[str, float] = {}
+
+    def record(self, stage: str, elapsed_sec: float) -> None:
+        """計測結果を記録する.
+
+        Parameters
+        ----------
+        stage : str
+            段階名
+        elapsed_sec : float
+            処理時間（秒）
+        """
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+        self.total_secs[stage] = self.total_secs.get(stage, 0.0) + elapsed_sec
+
+        if self.callback is not None:
+            self.callback(stage, elapsed_sec)
+
+    def wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """関数を処理時間を計測する関数でラップする.
+
+        Parameters
+        ----------
+        stage : str
+            段階名
+        func : Callable[..., Any]
+            計測対象の関数
+
+        Returns
+        -------
+        Callable[..., Any]
+            処理時間を計測するようにラップした関数
+        """
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+
+        return wrapper
+
+    def instrument(self, obj: object, stages: dict[str, str], prefix: str) -> None:
+        """オブジェクトのメソッドを計測対象にする.
+
+        Parameters
+        ----------
+        obj : object
+            計測対象のオブジェクト
+        stages : dict[str, str]
+            計測対象のメソッド名ごとの段階名
+        prefix : str
+            段階名の前に付ける名前（ノーマライザの種類など）
+        """
+        for method_name, stage in stages.items():
+            setattr(obj, method_name, self.wrap(f"{prefix}.{stage}", getattr(obj, method_name)))
+
+    def uninstrument(self, obj: object, stages: dict[str, str]) -> None:
+        """オブジェクトのメソッドを計測対象から外す.
+
+        Parameters
+        ----------
+        obj : object
+            計測対象のオブジェクト
+        stages : dict[str, str]
+            計測対象のメソッド名ごとの段階名
+        """
+        for method_name in stages:
+            if method_name in vars(obj):
+                delattr(obj, method_name)
+
+    def get_stats(self) -> dict[str, StageStatDict]:
+        """段階ごとの集計結果を取得する.
+
+        Returns
+        -------
+        dict[str, StageStatDict]
+            段階名ごとの呼び出し回数、合計処理時間（秒）、平均処理時間（秒）
+        """
+        return {
+            stage: StageStatDict(count=count, total_sec=self.total_secs[stage], mean_sec=self.total_secs[stage] / count)
+            for stage, count in self.counts.items()
+        }
+
+    def reset(self) -> None:
+        """集計結果を初期化する."""
+        self.counts.clear()
+        self.total_secs.clear()
@@ -0,0 +1,84 @@
+# flake8: noqa
+import pickle
+
+import pytest
+
+from pynormalizenumexp.expression.abstime import AbstimeExpression, AbstimePattern
+from pynormalizenumexp.expression.base import INF, NNumber, NTime, NumberModifier
+from pynormalizenumexp.expression.numerical import NumericalExpression, NumericalPattern
+from pynormalizenumexp.expression.reltime import ReltimeExpression
+
+
+@pytest.fixture(scope="class")
+def number():
+    number = NNumber("2012", 0, 4)
+    number.value_lower_bound = number.value_upper_bound = 2012
+    return number
+
+
+class TestBaseExpression:
+    def test_slots(self, number: NNumber):
+        exprs = [number, NumericalExpression(number), AbstimeExpression(number), ReltimeExpression(number),
+                 NumericalPattern(), AbstimePattern(), NumberModifier("約", "about")]
+        for expr in exprs:
+            assert not hasattr(expr, "__dict__")
+
+        # __slots__で宣言していない属性は追加できない
+        with pytest.raises(AttributeError):
+            number.unknown_attribute = 1
+
+    def test_get_slot_names(self):
+        assert ReltimeExpression.get_slot_names()[:6] \
+            == ("original_expr", "position_start", "position_end", "pattern", "value_lower_bound", "value_upper_bound")
+        assert "value_lower_bound_abs" in ReltimeExpression.get_slot_names()
+        assert "corresponding_time_position" in AbstimePattern.get_slot_names()
+
+    def test_copy(self, number: NNumber):
+        expr = AbstimeExpression(number)
+        expr.value_lower_bound = NTime(2012, INF, INF, INF, INF, INF)
+        expr.options = ["option"]
+
+        new_expr = expr.copy()
+        assert new_expr == expr
+        assert str(new_expr) == str(expr)
+        assert new_expr.value_lower_bound is not expr.value_lower_bound
+        assert new_expr.options is not expr.options
+
+        # 値が設定されていない属性があっても複製できる
+        modifier = NumberModifier("約", "about")
+        assert modifier.copy() == modifier
+
+    def test_pickle(self, number: NNumber):
+        expr = NumericalExpression(number)
+        expr.counter = "年"
+        assert pickle.loads(pickle.dumps(expr)) == expr
+
+
+class TestNTime:
+    def test_init(self):
+        assert NTime(INF).as_tuple() == (INF, INF, INF, INF, INF, INF)
+        assert NTime(2012, 4, 3, INF, INF, INF).as_tuple() == (2012, 4, 3, INF, INF, INF)
+        assert not hasattr(NTime(INF), "__dict__")
+
+    def test_is_null(self):
+        assert NTime(INF).is_null() == True
+        assert NTime(-INF).is_null() == True
+        assert NTime(2012, INF, INF, INF, INF, INF).is_null() == False
+        # INFと-INFが混在している場合はNullではない
+        assert NTime(INF, INF, INF, -INF, -INF, -INF).is_null() == False
+
+        assert NTime(INF).is_filled_with(INF) == True
+        assert NTime(INF).is_filled_with(-INF) == False
+
+    def test_identify_time_detail(self):
+        assert NTime(2012, INF, INF, INF, INF, INF).identify_time_detail() == "y"
+        assert NTime(2012, 4, 3, INF, INF, INF).identify_time_detail() == "d"
+        assert NTime(INF, INF, INF, 10, 30, -INF).identify_time_detail() == "mn"
+        assert NTime(INF).identify_time_detail() == ""
+
+    def test_pack(self):
+        time = NTime(2012, 4, 3, INF, INF, -INF)
+        data = time.pack()
+        assert len(data) == 48
+        assert NTime.unpack(data) == time
+        assert NTime.unpack(data).year == 2012.0
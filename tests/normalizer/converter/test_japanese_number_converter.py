@@ -1,4 +1,6 @@
 # flake8: noqa
+import threading
+
 import pytest
 
 from pynormalizenumexp.normalizer.converter.japanese_number_converter import JapaneseNumberConverter
@@ -22,3 +24,56 @@ class TestJapaneseNumberConverter:
     def test_convert_number(self, japanese_number_converter: JapaneseNumberConverter):
         res = japanese_number_converter.convert_number("一億二千四百五十六万三千,九百二十一")
         assert res == 124563921
+
+        res = japanese_number_converter.convert_number("２０2０")
+        assert res == 2020
+
+        res = japanese_number_converter.convert_number("3,000万")
+        assert res == 30000000
+
+    def test_convert_number_cache(self):
+        digit_utility = DigitUtility(DictLoader("ja"))
+        digit_utility.init_kansuji()
+        japanese_number_converter = JapaneseNumberConverter(digit_utility, cache_size=2)
+
+        for number_string in ["十", "十", "2020", "十", "3,000"]:
+            japanese_number_converter.convert_number(number_string)
+        # 最も長く使われていない「2020」が削除される
+        assert list(japanese_number_converter.cache) == ["十", "3,000"]
+        assert japanese_number_converter.get_cache_stats() == {"hits": 2, "misses": 3, "size": 2, "max_size": 2}
+
+        japanese_number_converter.clear_cache()
+        assert japanese_number_converter.get_cache_stats() == {"hits": 0, "misses": 0, "size": 0, "max_size": 2}
+
+        # キャッシュしない場合
+        japanese_number_converter = JapaneseNumberConverter(digit_utility, cache_size=0)
+        assert japanese_number_converter.convert_number("十") == 10
+        assert japanese_number_converter.get_cache_stats() == {"hits": 0, "misses": 0, "size": 0, "max_size": 0}
+
+    def test_convert_number_long_digits(self, japanese_number_converter: JapaneseNumberConverter):
+        # int()で変換できる桁数の上限（4300桁）を超えるアラビア数字も変換できる
+        res = japanese_number_converter.convert_number("1" * 5000)
+        assert res == sum(10 ** i for i in range(5000))
+
+    def test_convert_number_threads(self):
+        digit_utility = DigitUtility(DictLoader("ja"))
+        digit_utility.init_kansuji()
+        japanese_number_converter = JapaneseNumberConverter(digit_utility, cache_size=8)
+        number_strings = [str(i) for i in range(64)] + ["十", "百", "千"]
+
+        def convert_all():
+            for _ in range(50):
+                for number_string in number_strings:
+                    japanese_number_converter.convert_number(number_string)
+
+        # 複数のスレッドから同時に変換してもキャッシュが壊れない
+        threads = [threading.Thread(target=convert_all) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = japanese_number_converter.get_cache_stats()
+        assert stats["size"] == 8
+        assert stats["hits"] + stats["misses"] == 8 * 50 * len(number_strings)
+        assert japanese_number_converter.convert_number("千") == 1000
@@ -304,3 +304,20 @@ class TestAbstimeExpressionNormalizer:
         expect[0].value_lower_bound.day = expect[0].value_upper_bound.day = 3
         expect[0].options = [""]
         assert res == expect
+
+    def test_revise_without_side_effect(self, abstime_expr_normalizer: AbstimeExpressionNormalizer):
+        number = NNumber("3時", 0, 2)
+        number.value_lower_bound = number.value_upper_bound = 3
+        expr = AbstimeExpression(number)
+        expr.value_lower_bound = NTime(INF)
+        expr.value_upper_bound = NTime(-INF)
+        expr.value_lower_bound.hour = expr.value_upper_bound.hour = 3
+        expr.options = [""]
+
+        res = abstime_expr_normalizer.revise_abstime_expr_by_process_type(expr, "gogo")
+        res.options.append("gogo")
+        assert res.value_lower_bound.hour == res.value_upper_bound.hour == 15
+        assert res.options == ["", "gogo"]
+        # 補正前の表現は変更されない
+        assert expr.value_lower_bound.hour == expr.value_upper_bound.hour == 3
+        assert expr.options == [""]
@@ -57,6 +57,14 @@ class TestInappropriateExpressionRemover:
         res = inappropriate_expr_remover.delete_inappropriate_extraction_using_dict("http://www.iphone3g.com", exprs)
         assert res == []
 
+        # 2つ目以降のURLに含まれる表現も削除する
+        text = "http://a.com と http://b.com/3g と 5g"
+        exprs = [NormalizedExpression("3g", 28, 30), NormalizedExpression("5g", 33, 35)]
+        url_span_index = inappropriate_expr_remover.build_url_span_index(text)
+        assert len(url_span_index) == 2
+        res = inappropriate_expr_remover.delete_inappropriate_extraction_using_dict(text, exprs, url_span_index)
+        assert res == [NormalizedExpression("5g", 33, 35)]
+
     def test_revise_abstime_expr(self, inappropriate_expr_remover: InappropriateExpressionRemover):
         expr = AbstimeExpression(NNumber("98年7月7日", 0, 7))
         expr.value_lower_bound = NTime(INF)
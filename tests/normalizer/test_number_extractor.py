@@ -64,3 +64,15 @@ class TestNumberExtractor():
         expect[2].notation_type = [NotationType.HANKAKU, NotationType.HANKAKU, NotationType.HANKAKU, NotationType.HANKAKU]
         expect[3].notation_type = [NotationType.KANSUJI_09, NotationType.KANSUJI_KURAI_SEN]
         assert res == expect
+
+        res = number_extractor.extract_number("１２3四五")
+        expect = [NNumber("１２", 0, 2), NNumber("3", 2, 3), NNumber("四五", 3, 5)]
+        expect[0].notation_type = [NotationType.ZENKAKU, NotationType.ZENKAKU]
+        expect[1].notation_type = [NotationType.HANKAKU]
+        expect[2].notation_type = [NotationType.KANSUJI_09, NotationType.KANSUJI_09]
+        assert res == expect
+        assert [number.notation_type for number in res] == [e.notation_type for e in expect]
+
+    def test_extract_number_without_number(self, number_extractor: NumberExtractor):
+        assert number_extractor.extract_number("数字を含まないテキスト") == []
+        assert number_extractor.extract_number("") == []
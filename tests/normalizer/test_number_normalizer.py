@@ -97,6 +97,19 @@ class TestNumberNormalizer:
         res = number_normalizer.process("あいうえお")
         assert res == []
 
+    def test_process_all(self, number_normalizer: NumberNormalizer):
+        text = "その10~20人が、-5度で"
+        res = number_normalizer.process_all(text)
+        assert res.symbol_fixed == number_normalizer.process(text)
+        assert res.symbol_not_fixed == number_normalizer.process(text, do_fix_symbol=False)
+        assert res.get(True) is res.symbol_fixed
+        assert res.get(False) is res.symbol_not_fixed
+
+        # 記号の処理で変化がない場合は同じリストを共有する
+        res = number_normalizer.process_all("その3人が5時に")
+        assert res.symbol_fixed is res.symbol_not_fixed
+        assert res.symbol_fixed == number_normalizer.process("その3人が5時に")
+
     def test_process_invalid_notation(self, number_normalizer: NumberNormalizer):
         res = number_normalizer.process("1千1千1千")
         expect = [NNumber("1千1", 0, 3), NNumber("千1", 3, 5), NNumber("千", 5, 6)]
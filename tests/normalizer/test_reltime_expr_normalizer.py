@@ -164,3 +164,15 @@ class TestReltimeExpressionNormalizer:
         expect[0].value_upper_bound_abs = NTime(-INF)
         expect[0].value_lower_bound_rel.year = expect[0].value_upper_bound_rel.year = 1
         assert res == expect
+
+        # 同じ表現が複数回出現する場合はすべて抽出する
+        res = reltime_expr_normalizer.process("今日は晴れ、明日と今日は雨")
+        expect = [ReltimeExpression(NNumber("今日", 0, 2)), ReltimeExpression(NNumber("明日", 6, 8)),
+                  ReltimeExpression(NNumber("今日", 9, 11))]
+        for e, day in zip(expect, [0, 1, 0]):
+            e.value_lower_bound_rel = NTime(INF)
+            e.value_lower_bound_abs = NTime(INF)
+            e.value_upper_bound_rel = NTime(-INF)
+            e.value_upper_bound_abs = NTime(-INF)
+            e.value_lower_bound_rel.day = e.value_upper_bound_rel.day = day
+        assert res == expect
@@ -0,0 +1,97 @@
+# flake8: noqa
+import math
+
+import pytest
+
+from pynormalizenumexp.expression.base import INF
+from pynormalizenumexp.expression_columns import TYPE_CODES, ExpressionColumns
+from pynormalizenumexp.normalize_numexp import NormalizeNumexp
+
+
+@pytest.fixture(scope="class")
+def normalize_numexp():
+    return NormalizeNumexp("ja")
+
+
+@pytest.fixture(scope="class")
+def texts():
+    return ["2012/4/3~6に彼の打率は3割4分5厘だった", "数字のないテキスト", "15年前、戦争があった"]
+
+
+class TestExpressionColumns:
+    def test_normalize_columns(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        columns = normalize_numexp.normalize_columns(texts)
+        exprs = [(i, expr) for i, text in enumerate(texts) for expr in normalize_numexp.normalize(text)]
+        assert len(columns) == len(exprs) == 3
+
+        assert list(columns.doc_index) == [i for i, _ in exprs]
+        assert list(columns.type_code) == [TYPE_CODES[expr.type] for _, expr in exprs]
+        assert list(columns.position_start) == [expr.position_start for _, expr in exprs]
+        assert list(columns.position_end) == [expr.position_end for _, expr in exprs]
+        assert [columns.counters[i] for i in columns.counter_id] == [expr.counter for _, expr in exprs]
+
+    def test_values(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        columns = normalize_numexp.normalize_columns(texts).get_columns()
+
+        # abstime：時間は時間の列に入り、数値の列は値なし（NaN）になる
+        assert math.isnan(columns["value_lower_bound"][0])
+        assert [columns[f"time_lower_{c}"][0] for c in ["year", "month", "day", "hour"]] == [2012, 4, 3, INF]
+        assert columns["time_upper_day"][0] == 6
+        assert math.isnan(columns["abs_lower_year"][0])
+
+        # numerical：数値は数値の列に入り、時間の列は値なしになる
+        assert columns["value_lower_bound"][1] == columns["value_upper_bound"][1] == 34.5
+        assert math.isnan(columns["time_lower_year"][1])
+
+        # reltime：相対時間は相対時間の列に入る
+        assert columns["rel_lower_year"][2] == columns["rel_upper_year"][2] == -15
+        assert columns["abs_lower_year"][2] == INF
+        assert math.isnan(columns["time_lower_year"][2])
+
+        assert len(columns) == 7 + 6 * 6
+        assert all(len(column) == 3 for column in columns.values())
+
+    def test_normalize_columns_types(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        columns = normalize_numexp.normalize_columns(texts, types=["numerical"])
+        assert list(columns.type_code) == [TYPE_CODES["numerical"]]
+
+        columns = normalize_numexp.normalize_columns([])
+        assert len(columns) == 0
+        assert all(len(column) == 0 for column in columns.get_columns().values())
+
+    def test_large_values(self, normalize_numexp: NormalizeNumexp):
+        # 浮動小数点数で表せない大きさの値は符号に応じてinf・-infになる
+        columns = normalize_numexp.normalize_columns(["1" * 400 + "人", "-" + "1" * 400 + "人", "1" * 400 + "年間"])
+        assert list(columns.value_lower_bound[:2]) == list(columns.value_upper_bound[:2]) == [INF, -INF]
+        assert columns.time_columns["time_lower_year"][2] == INF
+
+    def test_counter_id(self):
+        columns = ExpressionColumns()
+        assert columns.get_counter_id("人") == 0
+        assert columns.get_counter_id("円") == 1
+        assert columns.get_counter_id("人") == 0
+        assert columns.counters == ["人", "円"]
+
+    def test_get_column_dtypes(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        dtypes = normalize_numexp.normalize_columns(texts).get_column_dtypes()
+        assert dtypes["doc_index"] == "int64"
+        assert dtypes["type_code"] == "int8"
+        assert dtypes["value_lower_bound"] == "float64"
+        assert dtypes["rel_upper_second"] == "float64"
+
+    def test_to_numpy(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        np = pytest.importorskip("numpy")
+        columns = normalize_numexp.normalize_columns(texts)
+        arrays = columns.to_numpy()
+        assert arrays["doc_index"].tolist() == list(columns.doc_index)
+        assert arrays["type_code"].dtype == np.int8
+        # コピーせずにarrayのバッファを参照する
+        assert not arrays["position_start"].flags.owndata
+
+    def test_to_arrow(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow")
+        columns = normalize_numexp.normalize_columns(texts)
+        table = columns.to_arrow()
+        assert table.num_rows == 3
+        assert table.column("counter").to_pylist() == [columns.counters[i] for i in columns.counter_id]
@@ -0,0 +1,120 @@
+# flake8: noqa
+import json
+import subprocess
+import sys
+
+import pytest
+
+from pynormalizenumexp.__main__ import main, parse_types
+from pynormalizenumexp.normalize_numexp import NormalizeNumexp
+
+
+@pytest.fixture(scope="class")
+def normalize_numexp():
+    return NormalizeNumexp("ja")
+
+
+@pytest.fixture(scope="class")
+def texts():
+    return ["2012年4月3日に100人が参加する", "数字のないテキスト", "", "15年前、戦争があった", "彼の打率は3割4分5厘だ"]
+
+
+def reject_constant(name):
+    raise ValueError(f"Non-standard JSON constant: {name}")
+
+
+def read_ndjson(path):
+    # 出力は標準のJSONなので、Infinity・NaNを受け付けずに解析する
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line, parse_constant=reject_constant) for line in f]
+
+
+class TestMain:
+    def test_text(self, tmp_path, capsys, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("\n".join(texts) + "\n", encoding="utf-8")
+        output_file = tmp_path / "output.jsonl"
+
+        assert main([str(input_file), "-o", str(output_file), "--batch-size", "2"]) == 0
+        expect = [{"id": i, "expressions": json.loads(normalize_numexp.normalize_json(text))} for i, text in enumerate(texts)]
+        assert read_ndjson(output_file) == expect
+        assert "5 texts, 4 expressions" in capsys.readouterr().err
+
+        # 複数のファイルを指定した場合は続けて処理し、IDは入力全体での行番号になる
+        assert main([str(input_file), str(input_file), "-o", str(output_file), "--types", "numerical,abstime"]) == 0
+        results = read_ndjson(output_file)
+        assert [result["id"] for result in results] == list(range(10))
+        assert [expr["type"] for expr in results[5]["expressions"]] == ["abstime", "numerical"]
+        assert all(expr["type"] in ["numerical", "abstime"] for result in results for expr in result["expressions"])
+
+    def test_jsonl(self, tmp_path, capsys, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        input_file = tmp_path / "input.jsonl"
+        records = [{"doc_id": f"doc{i}", "body": text} for i, text in enumerate(texts)]
+        input_file.write_text("\n\n".join(json.dumps(record, ensure_ascii=False) for record in records), encoding="utf-8")
+        output_file = tmp_path / "output.jsonl"
+
+        assert main([str(input_file), "-o", str(output_file), "--format", "jsonl", "--text-field", "body", "--id-field", "doc_id"]) == 0
+        expect = [{"id": f"doc{i}", "expressions": json.loads(normalize_numexp.normalize_json(text))} for i, text in enumerate(texts)]
+        assert read_ndjson(output_file) == expect
+
+        # 標準のJSONで表せないIDはnullとして出力する
+        input_file.write_text('{"doc_id": Infinity, "body": "2012年4月3日"}\n{"doc_id": [NaN, 1], "body": "100人"}\n', encoding="utf-8")
+        assert main([str(input_file), "-o", str(output_file), "--format", "jsonl", "--text-field", "body", "--id-field", "doc_id"]) == 0
+        results = read_ndjson(output_file)
+        assert [result["id"] for result in results] == [None, [None, 1]]
+        assert results[0]["expressions"][0]["value_lower_bound"]["hour"] is None
+
+        # テキストのフィールドがない場合はエラーになる
+        assert main([str(input_file), "-o", str(output_file), "--format", "jsonl"]) == 1
+        assert f'String field "text" is not found at {input_file}:1' in capsys.readouterr().err
+
+    def test_error_keeps_output(self, tmp_path, capsys, normalize_numexp: NormalizeNumexp):
+        input_file = tmp_path / "input.jsonl"
+        input_file.write_text('{"text": "100人"}\n{"text": \n{"text": "200人"}\n', encoding="utf-8")
+        output_file = tmp_path / "output.jsonl"
+
+        # 不正な行より前の結果は出力される
+        for workers in ["1", "2"]:
+            assert main([str(input_file), "-o", str(output_file), "--format", "jsonl", "--workers", workers]) == 1
+            assert read_ndjson(output_file) == [{"id": 0, "expressions": json.loads(normalize_numexp.normalize_json("100人"))}]
+            assert f"Invalid JSON at {input_file}:2" in capsys.readouterr().err
+
+        # UTF-8として不正な場合も入力エラーになる
+        input_file.write_bytes("100人\n".encode("utf-8") + b"\xff\n")
+        assert main([str(input_file), "-o", str(output_file)]) == 1
+        assert "Invalid UTF-8" in capsys.readouterr().err
+
+    def test_internal_error(self, tmp_path, monkeypatch):
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("100人\n", encoding="utf-8")
+
+        def normalize(*args, **kwargs):
+            raise ValueError("internal error")
+
+        # 入力エラー以外の例外は終了コードに変換せずにそのまま送出する
+        monkeypatch.setattr(NormalizeNumexp, "normalize", normalize)
+        with pytest.raises(ValueError, match="internal error"):
+            main([str(input_file), "-o", str(tmp_path / "output.jsonl")])
+
+    def test_workers(self, tmp_path, texts: list[str]):
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("\n".join(texts * 10) + "\n", encoding="utf-8")
+
+        assert main([str(input_file), "-o", str(tmp_path / "single.jsonl")]) == 0
+        assert main([str(input_file), "-o", str(tmp_path / "parallel.jsonl"), "--workers", "2", "--batch-size", "3"]) == 0
+        assert read_ndjson(tmp_path / "parallel.jsonl") == read_ndjson(tmp_path / "single.jsonl")
+
+    def test_stdin(self, normalize_numexp: NormalizeNumexp, texts: list[str]):
+        proc = subprocess.run([sys.executable, "-m", "pynormalizenumexp"], input="\n".join(texts).encode("utf-8"),
+                              capture_output=True, check=True)
+        expect = [{"id": i, "expressions": json.loads(normalize_numexp.normalize_json(text))} for i, text in enumerate(texts)]
+        assert [json.loads(line, parse_constant=reject_constant) for line in proc.stdout.splitlines()] == expect
+        assert b"texts/s" in proc.stderr
+
+    def test_invalid_args(self, capsys):
+        assert parse_types("numerical, duration") == ["numerical", "duration"]
+        with pytest.raises(SystemExit):
+            main(["--types", "unknown"])
+        assert 'Invalid type: "unknown"' in capsys.readouterr().err
+        with pytest.raises(SystemExit):
+            main(["--workers", "0"])
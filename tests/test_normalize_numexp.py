@@ -1,8 +1,15 @@
 # flake8: noqa
+import json
+import time
+from dataclasses import asdict
+
 import pytest
 
 from pynormalizenumexp.expression.base import INF
 from pynormalizenumexp.normalize_numexp import Expression, NormalizeNumexp, Time
+from pynormalizenumexp.normalizer.abstime_expr_normalizer import AbstimeExpressionNormalizer
+from pynormalizenumexp.normalizer.inappropriate_expr_remover import InappropriateExpressionRemover
+from pynormalizenumexp.utility.result_cache import ResultCache
 
 
 @pytest.fixture(scope="class")
@@ -285,6 +292,13 @@ class TestNormalizeNumexp:
         ]
         assert res == expect
 
+    def test_normalize_long_digits(self, normalize_numexp: NormalizeNumexp):
+        # int()で変換できる桁数の上限（4300桁）を超える数字の並びも抽出できる
+        res = normalize_numexp.normalize("ID: " + "1" * 5000 + "番")
+        assert len(res) == 1
+        assert (res[0].type, res[0].position_start, res[0].position_end, res[0].counter) == ("numerical", 4, 5005, "番")
+        assert res[0].value_lower_bound == res[0].value_upper_bound == sum(10 ** i for i in range(5000))
+
     def test_normalize_custom_dict(self):
         normalize_numexp = NormalizeNumexp("ja", "./tests/resources/custom_expression.json")
         res = normalize_numexp.normalize("今日は2024年5月1日（祝）です")
@@ -352,3 +366,340 @@ class TestNormalizeNumexp:
             )
         ]
         assert res == expect
+
+    def test_normalize_return_dict_same_as_asdict(self, normalize_numexp: NormalizeNumexp):
+        texts = ["15年前、戦争があった", "2012/4/3~6に行われる", "彼の打率は3割4分5厘だ", "2012年4月3日から3日間、100人が参加する",
+                 "午後3時45分から約2時間"]
+        for text in texts:
+            expect = [asdict(expr) for expr in normalize_numexp.normalize(text)]
+            assert normalize_numexp.normalize(text, as_dict=True) == expect
+            assert [expr.to_dict() for expr in normalize_numexp.normalize(text)] == expect
+
+    def test_normalize_json(self, normalize_numexp: NormalizeNumexp):
+        text = "2012/4/3~6に彼の打率は3割4分5厘だった"
+        res = normalize_numexp.normalize_json(text)
+        assert isinstance(res, bytes)
+        assert "3割4分5厘" in res.decode("utf-8")
+
+        # 無限大の値は標準のJSONで表せないのでnullとして出力される
+        def reject_constant(name):
+            raise ValueError(f"Non-standard JSON constant: {name}")
+
+        res_dicts = json.loads(res, parse_constant=reject_constant)
+        expect = normalize_numexp.normalize(text, as_dict=True)
+        assert expect[0]["value_lower_bound"]["hour"] == float("inf")
+        assert res_dicts[0]["value_lower_bound"]["hour"] is None
+        assert res_dicts[0]["value_lower_bound"]["day"] == expect[0]["value_lower_bound"]["day"] == 3
+        assert res_dicts[1] == expect[1]
+
+        # 数値の無限大・NaNもnullになる
+        expr = normalize_numexp.normalize("100人", as_dict=True)[0]
+        expr["value_lower_bound"], expr["value_upper_bound"] = float("-inf"), float("nan")
+        res_dicts = json.loads(normalize_numexp.dumps_json([expr]), parse_constant=reject_constant)
+        assert res_dicts[0]["value_lower_bound"] is None
+        assert res_dicts[0]["value_upper_bound"] is None
+        assert expr["value_lower_bound"] == float("-inf")
+
+        assert normalize_numexp.normalize_json(text, types=["numerical"]) \
+            == normalize_numexp.dumps_json(normalize_numexp.normalize(text, types=["numerical"]))
+        assert normalize_numexp.normalize_json("数字のないテキスト") == b"[]"
+
+    def test_normalize_batch(self, normalize_numexp: NormalizeNumexp):
+        texts = ["15年前、戦争があった", "数字のないテキスト", "彼の打率は3割4分5厘だ"]
+        res = normalize_numexp.normalize_batch(texts)
+        assert res == [normalize_numexp.normalize(text) for text in texts]
+        assert res[1] == []
+
+        res = normalize_numexp.normalize_batch(texts, as_dict=True)
+        assert res == [normalize_numexp.normalize(text, as_dict=True) for text in texts]
+
+        res = normalize_numexp.normalize_batch([])
+        assert res == []
+
+    def test_normalize_batch_duplicated_texts(self):
+        normalize_numexp = NormalizeNumexp("ja")
+        extracted_texts = []
+        extract_normalized_expressions = normalize_numexp.extract_normalized_expressions
+
+        def spy(text, types=None):
+            extracted_texts.append(text)
+            return extract_normalized_expressions(text, types)
+
+        normalize_numexp.extract_normalized_expressions = spy
+        texts = ["2012年4月3日に100人が参加する", "数字のないテキスト", "2012年4月3日に100人が参加する"]
+        for as_dict in [False, True]:
+            extracted_texts.clear()
+            res = normalize_numexp.normalize_batch(texts, as_dict=as_dict)
+            # 同じテキストの抽出・正規化は1度だけ行い、結果はテキストごとに別のオブジェクトになる
+            assert extracted_texts == [texts[0]]
+            assert res == [normalize_numexp.normalize(text, as_dict=as_dict) for text in texts]
+            assert res[0][0] is not res[2][0]
+        res[0][0]["value_lower_bound"]["year"] = 2000
+        assert res[2][0]["value_lower_bound"]["year"] == 2012
+
+    def test_normalize_prefilter(self, normalize_numexp: NormalizeNumexp):
+        assert normalize_numexp.may_contain_expression("15年前、戦争があった") == True
+        assert normalize_numexp.may_contain_expression("三割") == True
+        assert normalize_numexp.may_contain_expression("明日は晴れ") == True
+        assert normalize_numexp.may_contain_expression("数字のないテキスト") == False
+        assert normalize_numexp.may_contain_expression("") == False
+
+        normalize_numexp.reset_prefilter_stats()
+        res = normalize_numexp.normalize_batch(["15年前、戦争があった", "数字のないテキスト", "明日は晴れ", ""])
+        assert res[1] == res[3] == []
+        # 数字がなくても「明日」などは抽出される
+        assert [expr.original_expr for expr in res[2]] == ["明日"]
+        assert normalize_numexp.get_prefilter_stats() == {"total": 4, "skipped": 2}
+
+        normalize_numexp.reset_prefilter_stats()
+        assert normalize_numexp.get_prefilter_stats() == {"total": 0, "skipped": 0}
+
+    def test_normalize_types(self, normalize_numexp: NormalizeNumexp):
+        text = "2012年4月3日から3日間、100人が参加する"
+        all_res = normalize_numexp.normalize(text)
+        assert sorted(set(expr.type for expr in all_res)) == ["abstime", "duration", "numerical"]
+
+        # インスタンス生成時に表現種別を指定すると、その表現種別のノーマライザだけを読み込む
+        numerical_normalize_numexp = NormalizeNumexp("ja", types=["numerical"])
+        assert numerical_normalize_numexp.types == ("numerical",)
+        assert list(numerical_normalize_numexp.get_normalizers().keys()) == ["numerical"]
+        with pytest.raises(ValueError):
+            numerical_normalize_numexp.abstime_expr_normalizer
+        res = numerical_normalize_numexp.normalize(text)
+        assert [expr.original_expr for expr in res] == ["100人"]
+        # 数値を含まないパターンしか持たない表現種別を読み込まなければ「今日」などは事前判定で省略される
+        assert numerical_normalize_numexp.may_contain_expression("今日は晴れ") == False
+
+        # 呼び出しごとに読み込み済みの表現種別から絞り込める（文字列1つでも指定できる）
+        assert normalize_numexp.normalize(text, types=["abstime", "duration"]) \
+            == [expr for expr in all_res if expr.type in ["abstime", "duration"]]
+        assert normalize_numexp.normalize(text, types="numerical") == res
+        assert normalize_numexp.normalize_batch([text], types=["numerical"]) == [res]
+        assert list(normalize_numexp.normalize_iter([text], types=["numerical"])) == [(0, res)]
+        assert list(normalize_numexp.normalize_parallel([text] * 2, workers=2, types=["numerical"])) == [res, res]
+
+        # 表現種別の順序や重複は結果に影響しない
+        assert normalize_numexp.normalize(text, types=["duration", "abstime", "abstime"]) \
+            == normalize_numexp.normalize(text, types=["abstime", "duration"])
+
+        with pytest.raises(ValueError):
+            NormalizeNumexp("ja", types=["time"])
+        with pytest.raises(ValueError):
+            normalize_numexp.normalize(text, types=["time"])
+        # 読み込んでいない表現種別は指定できない
+        with pytest.raises(ValueError):
+            numerical_normalize_numexp.normalize(text, types=["abstime"])
+
+    def test_normalize_types_with_result_cache(self):
+        text = "2012年4月3日から3日間、100人が参加する"
+        result_cache = ResultCache()
+        cached_normalize_numexp = NormalizeNumexp("ja", result_cache=result_cache)
+
+        # 表現種別ごとに結果をキャッシュするので、異なる表現種別の結果は混ざらない
+        all_res = cached_normalize_numexp.normalize(text)
+        res = cached_normalize_numexp.normalize(text, types=["numerical"])
+        assert [expr.type for expr in res] == ["numerical"]
+        assert cached_normalize_numexp.normalize(text) == all_res
+        assert result_cache.get_stats()["entries"] == 2
+
+    def test_normalize_with_result_cache(self, normalize_numexp: NormalizeNumexp):
+        texts = ["15年前、戦争があった", "2012/4/3~6に行われる", "数字のないテキスト", "15年前、戦争があった"]
+        result_cache = ResultCache(max_entries=10)
+        cached_normalize_numexp = NormalizeNumexp("ja", result_cache=result_cache)
+
+        for _ in range(2):
+            for text in texts:
+                assert cached_normalize_numexp.normalize(text) == normalize_numexp.normalize(text)
+                assert cached_normalize_numexp.normalize(text, as_dict=True) == normalize_numexp.normalize(text, as_dict=True)
+        # 数値表現を含まないテキストはキャッシュしない
+        stats = result_cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["misses"] == 2
+        assert stats["hits"] == 10
+        assert stats["bytes"] > 0
+
+        # 返り値を変更してもキャッシュには影響しない
+        res = cached_normalize_numexp.normalize(texts[1])
+        res[0].options.append("changed")
+        res[0].value_lower_bound.year = 1
+        assert cached_normalize_numexp.normalize(texts[1]) == normalize_numexp.normalize(texts[1])
+
+        # カスタム辞書が異なるインスタンスとキャッシュを共有しても結果は混ざらない
+        custom_normalize_numexp = NormalizeNumexp("ja", "./tests/resources/custom_expression.json", result_cache=result_cache)
+        assert custom_normalize_numexp.result_cache_key != cached_normalize_numexp.result_cache_key
+        # キャッシュを使わない場合はキーを計算しない
+        assert normalize_numexp.result_cache_key == ""
+        text = "メールに2ファイル添付する"
+        assert cached_normalize_numexp.normalize(text) == normalize_numexp.normalize(text)
+        assert [expr.counter for expr in custom_normalize_numexp.normalize(text)] == ["ファイル"]
+
+    def test_normalize_parallel(self, normalize_numexp: NormalizeNumexp):
+        texts = ["15年前、戦争があった", "数字のないテキスト", "彼の打率は3割4分5厘だ", "2012/4/3~6に行われる"] * 3
+
+        for workers in [1, 2]:
+            res = list(normalize_numexp.normalize_parallel(texts, workers=workers, chunksize=2))
+            assert res == [normalize_numexp.normalize(text) for text in texts]
+
+        res = list(normalize_numexp.normalize_parallel(texts, as_dict=True, workers=2))
+        assert res == [normalize_numexp.normalize(text, as_dict=True) for text in texts]
+
+        res = list(normalize_numexp.normalize_parallel([], workers=2))
+        assert res == []
+
+        with pytest.raises(ValueError):
+            list(normalize_numexp.normalize_parallel(texts, workers=0))
+
+    @pytest.mark.parametrize("start_methods", [["fork", "spawn"], ["spawn"]])
+    def test_normalize_parallel_with_profiling(self, monkeypatch, start_methods: list[str]):
+        normalize_numexp = NormalizeNumexp("ja", types=["numerical"])
+        texts = ["彼の打率は3割4分5厘だ", "数字のないテキスト"]
+        expect = [normalize_numexp.normalize(text) for text in texts]
+
+        # forkが使えない環境ではインスタンスをpickle化してワーカープロセスに渡す
+        monkeypatch.setattr("multiprocessing.get_all_start_methods", lambda: start_methods)
+        with normalize_numexp.profile() as profiler:
+            res = list(normalize_numexp.normalize_parallel(texts, workers=2))
+            assert res == expect
+            # ワーカープロセスの生成後も計測は続いている
+            normalize_numexp.normalize(texts[0])
+        assert profiler.get_stats()["normalize.total"]["count"] == 1
+
+    def test_normalize_iter(self, normalize_numexp: NormalizeNumexp):
+        texts = ["15年前、戦争があった", "数字のないテキスト", "彼の打率は3割4分5厘だ"]
+        expect = [normalize_numexp.normalize(text) for text in texts]
+
+        # テキストのみの場合は入力中の順番がIDになる
+        res = list(normalize_numexp.normalize_iter(iter(texts)))
+        assert res == list(enumerate(expect))
+
+        # (ID, テキスト)のタプルの場合はそのIDを返す
+        documents = [(f"doc{i}", text) for i, text in enumerate(texts)]
+        for prefetch in [0, 1, 2, 10]:
+            res = list(normalize_numexp.normalize_iter(documents, prefetch=prefetch))
+            assert res == [(f"doc{i}", exprs) for i, exprs in enumerate(expect)]
+
+        res = list(normalize_numexp.normalize_iter(texts, as_dict=True))
+        assert res == [(i, normalize_numexp.normalize(text, as_dict=True)) for i, text in enumerate(texts)]
+
+        with pytest.raises(ValueError):
+            list(normalize_numexp.normalize_iter(texts, prefetch=-1))
+
+    def test_normalize_iter_lazy(self, normalize_numexp: NormalizeNumexp):
+        consumed = []
+
+        def read_documents():
+            for i in range(100):
+                consumed.append(i)
+                yield "3人"
+
+        # 必要な分しか読み込まない
+        iterator = normalize_numexp.normalize_iter(read_documents())
+        next(iterator)
+        assert consumed == [0]
+
+        # 先読みする場合も指定数程度しか読み込まない
+        consumed.clear()
+        iterator = normalize_numexp.normalize_iter(read_documents(), prefetch=2)
+        next(iterator)
+        time.sleep(0.3)
+        # 処理済みの1件 + キューに入っている2件 + キューへの追加待ちの1件
+        assert len(consumed) <= 4
+        iterator.close()
+
+    def test_normalize_iter_prefetch_error(self, normalize_numexp: NormalizeNumexp):
+        def read_documents():
+            yield "3人"
+            raise IOError("read error")
+
+        iterator = normalize_numexp.normalize_iter(read_documents(), prefetch=2)
+        assert next(iterator)[0] == 0
+        with pytest.raises(IOError):
+            next(iterator)
+
+    def test_profile(self, normalize_numexp: NormalizeNumexp):
+        text = "2012/4/3~6に彼の打率は3割4分5厘だった"
+        expect = normalize_numexp.normalize(text)
+
+        with normalize_numexp.profile() as profiler:
+            res = normalize_numexp.normalize_batch([text, text])
+        assert res == [expect, expect]
+
+        stats = profiler.get_stats()
+        assert stats["normalize.total"]["count"] == 2
+        assert stats["normalize.number_extraction"]["count"] == 2
+        assert stats["normalize.inappropriate_removal"]["count"] == 2
+        assert stats["normalize.merge"]["count"] == 2
+        assert stats["normalize.prefilter"]["count"] == 2
+        for normalizer_type in ["numerical", "abstime", "reltime", "duration"]:
+            assert stats[f"{normalizer_type}.total"]["count"] == 2
+            assert stats[f"{normalizer_type}.limited_expression"]["count"] >= 2
+
+        # withブロックを抜けると計測しない
+        assert normalize_numexp.profiler is None
+        normalize_numexp.normalize(text)
+        assert profiler.get_stats() == stats
+
+    def test_lazy_loading(self, normalize_numexp: NormalizeNumexp):
+        text = "2012/4/3~6に彼の打率は3割4分5厘だった"
+
+        # インスタンス生成時にはノーマライザを作成しない
+        lazy_normalize_numexp = NormalizeNumexp("ja")
+        assert lazy_normalize_numexp._number_normalizer is None
+        assert lazy_normalize_numexp._inappropriate_expr_remover is None
+        assert lazy_normalize_numexp.get_loaded_normalizers() == {}
+
+        # 数値表現を含み得ないと判定したテキストでは、不適切な数値表現を削除するオブジェクトを作成しない
+        assert lazy_normalize_numexp.normalize("数字のないテキスト", types=["numerical"]) == []
+        assert lazy_normalize_numexp._inappropriate_expr_remover is None
+
+        # 初めて利用する時に、抽出対象の表現種別のノーマライザだけを作成する
+        assert lazy_normalize_numexp.normalize(text, types=["numerical"]) == normalize_numexp.normalize(text, types=["numerical"])
+        assert list(lazy_normalize_numexp.get_loaded_normalizers().keys()) == ["numerical"]
+        assert lazy_normalize_numexp.normalize(text) == normalize_numexp.normalize(text)
+        assert list(lazy_normalize_numexp.get_loaded_normalizers().keys()) == ["numerical", "abstime", "reltime", "duration"]
+
+        # warmupで事前にすべて作成しておける
+        warm_normalize_numexp = NormalizeNumexp("ja", types=["numerical", "reltime"])
+        warm_normalize_numexp.warmup()
+        assert warm_normalize_numexp._number_normalizer is not None
+        assert warm_normalize_numexp._inappropriate_expr_remover is not None
+        assert list(warm_normalize_numexp.get_loaded_normalizers().keys()) == ["numerical", "reltime"]
+        with pytest.raises(ValueError):
+            warm_normalize_numexp.warmup(["abstime"])
+        with pytest.raises(ValueError):
+            warm_normalize_numexp.get_normalizer("abstime")
+
+        # 各ノーマライザの属性は、参照すると未作成でも作成して返す
+        property_normalize_numexp = NormalizeNumexp("ja")
+        assert isinstance(property_normalize_numexp.abstime_expr_normalizer, AbstimeExpressionNormalizer)
+        assert list(property_normalize_numexp.get_loaded_normalizers().keys()) == ["abstime"]
+        assert property_normalize_numexp.abstime_expr_normalizer is property_normalize_numexp.get_normalizer("abstime")
+        assert property_normalize_numexp.abstime_expr_normalizer.number_normalizer is property_normalize_numexp.number_normalizer
+        assert isinstance(property_normalize_numexp.inappropriate_expr_remover, InappropriateExpressionRemover)
+
+    def test_profile_lazy_loading(self, normalize_numexp: NormalizeNumexp):
+        text = "2012/4/3~6に彼の打率は3割4分5厘だった"
+
+        # 計測中に作成したノーマライザも計測対象にする
+        lazy_normalize_numexp = NormalizeNumexp("ja")
+        with lazy_normalize_numexp.profile() as profiler:
+            assert lazy_normalize_numexp.normalize(text) == normalize_numexp.normalize(text)
+
+        stats = profiler.get_stats()
+        assert stats["normalize.total"]["count"] == 1
+        assert stats["normalize.number_extraction"]["count"] == 1
+        assert stats["normalize.inappropriate_removal"]["count"] == 1
+        for normalizer_type in ["numerical", "abstime", "reltime", "duration"]:
+            assert stats[f"{normalizer_type}.total"]["count"] == 1
+
+        # withブロックを抜けると作成したノーマライザも計測しない
+        for obj, stages, _ in lazy_normalize_numexp.get_profiling_targets():
+            assert all(method_name not in vars(obj) for method_name in stages)
+
+    def test_shared_number_normalizer(self, normalize_numexp: NormalizeNumexp):
+        normalize_numexp.warmup()
+
+        # 各表現種別のノーマライザは同じNumberNormalizerを共有する
+        number_normalizer = normalize_numexp.get_number_normalizer()
+        for normalizer in normalize_numexp.get_normalizers().values():
+            assert normalizer.number_normalizer is number_normalizer
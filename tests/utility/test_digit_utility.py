@@ -164,3 +164,13 @@ class TestDigitUtility:
         assert digit_utility.chars2full_notation_type("十") == NotationType.KANSUJI_KURAI_SEN
         assert digit_utility.chars2full_notation_type("万") == NotationType.KANSUJI_KURAI_MAN
         assert digit_utility.chars2full_notation_type("あ") == NotationType.NOT_NUMBER
+
+    def test_text2full_notation_type(self, digit_utility: DigitUtility):
+        digit_utility.init_kansuji()
+
+        text = "1１一十万あ 2.5億ǂ〇百"
+        res = digit_utility.text2full_notation_type(text)
+        assert res == [digit_utility.chars2full_notation_type(char) for char in text]
+        assert res[:6] == [NotationType.HANKAKU, NotationType.ZENKAKU, NotationType.KANSUJI_09,
+                           NotationType.KANSUJI_KURAI_SEN, NotationType.KANSUJI_KURAI_MAN, NotationType.NOT_NUMBER]
+        assert digit_utility.text2full_notation_type("") == []
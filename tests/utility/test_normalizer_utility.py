@@ -2,7 +2,7 @@
 import pytest
 
 from pynormalizenumexp.expression.base import NNumber, NTime
-from pynormalizenumexp.utility.normalizer_utility import NormalizerUtility
+from pynormalizenumexp.utility.normalizer_utility import NormalizerUtility, ShortenedText
 
 
 @pytest.fixture(scope="class")
@@ -62,6 +62,32 @@ class TestNormalizerUtility:
         res = normalizer_utility.search_suffix_number_modifier("あいうえおあ5あいうえおごごごごご", 7, patterns)
         assert res == 2
 
+    def test_shortened_text(self, normalizer_utility: NormalizerUtility):
+        text = "ǂǂǂそのǂǂ人がそれはǂǂǂǂǂǂ人でボボボǂ"
+        shortened_text = ShortenedText(text)
+        assert shortened_text.text == normalizer_utility.shorten_place_holder_in_text(text)
+        assert len(shortened_text.positions) == len(text) + 1
+        assert shortened_text.positions[:6] == [0, 0, 0, 1, 2, 3]
+        assert shortened_text.positions[-1] == len(shortened_text.text)
+
+    def test_shortened_text_search(self, normalizer_utility: NormalizerUtility, patterns):
+        # 各位置で切り出したテキストを縮約して探索した場合と同じ結果になる
+        for text in ["あいうえおあ5あいうえおごごご", "ǂǂあいǂǂǂうえおǂ", "いうえおあǂǂǂ", ""]:
+            shortened_text = ShortenedText(text)
+            for position in range(len(text) + 1):
+                assert shortened_text.search_prefix(position, patterns) == \
+                    normalizer_utility.search_pattern(text[position:], patterns, "prefix")
+                assert shortened_text.search_suffix(position, patterns) == \
+                    normalizer_utility.search_pattern(text[:position], patterns, "suffix")
+
+    def test_search_number_modifier_with_shortened_text(self, normalizer_utility: NormalizerUtility, patterns):
+        shortened_text = ShortenedText("あいうえおあ5あいうえおごごごごご")
+        res = normalizer_utility.search_prefix_number_modifier(shortened_text, 6, patterns)
+        assert res == 7
+
+        res = normalizer_utility.search_suffix_number_modifier(shortened_text, 7, patterns)
+        assert res == 2
+
     def test_is_finite(self, normalizer_utility: NormalizerUtility):
         res = normalizer_utility.is_finite(99.999)
         assert res == True
@@ -0,0 +1,44 @@
+# flake8: noqa
+import pytest
+
+from pynormalizenumexp.utility.pattern_automaton import PatternAutomaton
+
+
+@pytest.fixture(scope="class")
+def pattern_automaton():
+    return PatternAutomaton({
+        "昨年": 0,
+        "一昨年": 1,
+        "今日": 2,
+        "今年": 3,
+        "あいう": 4,
+        "いうえ": 5,
+        "う": 6
+    })
+
+
+class TestPatternAutomaton:
+    def test_len(self, pattern_automaton: PatternAutomaton):
+        assert len(pattern_automaton) == 7
+
+    def test_search_all(self, pattern_automaton: PatternAutomaton):
+        res = pattern_automaton.search_all("今日と今年と今日")
+        assert res == [(0, 2, 2), (3, 5, 3), (6, 8, 2)]
+
+        # 重なり合う出現箇所もすべて出力する
+        res = pattern_automaton.search_all("一昨年")
+        assert res == [(0, 3, 1), (1, 3, 0)]
+
+        res = pattern_automaton.search_all("あいうえお")
+        assert res == [(0, 3, 4), (2, 3, 6), (1, 4, 5)]
+
+        res = pattern_automaton.search_all("かきくけこ")
+        assert res == []
+
+        res = pattern_automaton.search_all("")
+        assert res == []
+
+    def test_search_empty_pattern(self):
+        # 空文字列のパターンは検索対象にしない
+        pattern_automaton = PatternAutomaton({"": 0, "あい": 1})
+        assert pattern_automaton.search_all("かあいき") == [(1, 3, 1)]
@@ -0,0 +1,64 @@
+# flake8: noqa
+import pytest
+
+from pynormalizenumexp.utility.pattern_trie import PatternTrie
+
+
+@pytest.fixture(scope="class")
+def pattern_trie():
+    return PatternTrie({
+        "あ": 0,
+        "あい": 1,
+        "あいう": 2,
+        "いう": 3,
+        "うえ": 4,
+        "うえお": 5,
+        "えお": 6,
+        "いうえおあ": 7
+    })
+
+
+class TestPatternTrie:
+    def test_len(self, pattern_trie: PatternTrie):
+        assert len(pattern_trie) == 8
+
+    def test_search_prefix(self, pattern_trie: PatternTrie):
+        res = pattern_trie.search_prefix("あいうえお")
+        assert res == 2
+
+        res = pattern_trie.search_prefix("あいか")
+        assert res == 1
+
+        res = pattern_trie.search_prefix("いうえおあいうえお")
+        assert res == 7
+
+        # 途中までしか一致しない長いパターンより、短いパターンの一致を優先する
+        res = pattern_trie.search_prefix("いうえおか")
+        assert res == 3
+
+        res = pattern_trie.search_prefix("かきくけこ")
+        assert res == -1
+
+        res = pattern_trie.search_prefix("")
+        assert res == -1
+
+    def test_search_suffix(self, pattern_trie: PatternTrie):
+        res = pattern_trie.search_suffix("あいうえお")
+        assert res == 5
+
+        res = pattern_trie.search_suffix("あいうえおあ")
+        assert res == 7
+
+        res = pattern_trie.search_suffix("かきくけこ")
+        assert res == -1
+
+        res = pattern_trie.search_suffix("")
+        assert res == -1
+
+    def test_search_empty_pattern(self):
+        # 空文字列のパターンは任意のテキストにマッチする
+        pattern_trie = PatternTrie({"": 0, "あい": 1})
+        assert pattern_trie.search_prefix("かきく") == 0
+        assert pattern_trie.search_prefix("あいう") == 1
+        assert pattern_trie.search_suffix("かきく") == 0
+        assert pattern_trie.search_suffix("うあい") == 1
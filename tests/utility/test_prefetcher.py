@@ -0,0 +1,36 @@
+# flake8: noqa
+import pytest
+
+from pynormalizenumexp.utility.prefetcher import Prefetcher
+
+
+class TestPrefetcher:
+    def test_iter_items(self):
+        prefetcher = Prefetcher(range(10), 2)
+        prefetcher.start()
+        assert list(prefetcher.iter_items()) == list(range(10))
+        prefetcher.thread.join(timeout=1)
+        assert not prefetcher.thread.is_alive()
+
+    def test_error(self):
+        def read_items():
+            yield 1
+            raise IOError("read error")
+
+        # 例外の前までの要素を返してから例外を送出する
+        prefetcher = Prefetcher(read_items(), 2)
+        prefetcher.start()
+        iterator = prefetcher.iter_items()
+        assert next(iterator) == 1
+        with pytest.raises(IOError, match="read error"):
+            next(iterator)
+
+    def test_stop(self):
+        # キューが一杯でもstopを呼ぶとスレッドが終了する
+        prefetcher = Prefetcher(range(100), 1)
+        prefetcher.start()
+        assert next(prefetcher.iter_items()) == 0
+        prefetcher.stop()
+        prefetcher.thread.join(timeout=1)
+        assert not prefetcher.thread.is_alive()
+        assert not prefetcher.put(100)
@@ -0,0 +1,55 @@
+# flake8: noqa
+import pickle
+
+import pytest
+
+from pynormalizenumexp.utility.result_cache import ResultCache
+
+
+class TestResultCache:
+    def test_get_put(self):
+        result_cache = ResultCache(max_entries=2)
+        assert result_cache.get("a") is None
+
+        result_cache.put("a", [1], 10)
+        result_cache.put("b", [2], 10)
+        assert result_cache.get("a") == [1]
+        # 最も長く使われていない「b」が削除される
+        result_cache.put("c", [3], 10)
+        assert result_cache.get("b") is None
+        assert result_cache.get("c") == [3]
+        assert len(result_cache) == 2
+
+        assert result_cache.get_stats() == {"hits": 2, "misses": 2, "hit_rate": 0.5, "entries": 2, "bytes": 20}
+
+        result_cache.clear()
+        assert result_cache.get_stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "entries": 0, "bytes": 0}
+
+    def test_max_bytes(self):
+        result_cache = ResultCache(max_entries=10, max_bytes=25)
+        result_cache.put("a", [1], 10)
+        result_cache.put("b", [2], 10)
+        result_cache.put("c", [3], 10)
+        assert list(result_cache.entries) == ["b", "c"]
+        assert result_cache.get_stats()["bytes"] == 20
+
+        # 同じキーで追加した場合は置き換える
+        result_cache.put("c", [4], 5)
+        assert result_cache.get("c") == [4]
+        assert result_cache.get_stats()["bytes"] == 15
+
+        # 上限を超える大きさのものはキャッシュしない
+        result_cache.put("d", [5], 30)
+        assert result_cache.get("d") is None
+        assert list(result_cache.entries) == ["b", "c"]
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=0)
+
+    def test_pickle(self):
+        result_cache = ResultCache(max_entries=2)
+        result_cache.put("a", [1], 10)
+
+        res = pickle.loads(pickle.dumps(result_cache))
+        assert res.get("a") == [1]
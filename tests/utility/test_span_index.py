@@ -0,0 +1,29 @@
+# flake8: noqa
+import pytest
+
+from pynormalizenumexp.utility.span_index import SpanIndex
+
+
+@pytest.fixture(scope="class")
+def span_index():
+    return SpanIndex([(10, 15), (0, 3), (2, 8), (20, 21)])
+
+
+class TestSpanIndex:
+    def test_len(self, span_index: SpanIndex):
+        assert len(span_index) == 4
+
+    def test_is_contained(self, span_index: SpanIndex):
+        assert span_index.is_contained(0, 3) == True
+        assert span_index.is_contained(3, 8) == True
+        assert span_index.is_contained(11, 14) == True
+        assert span_index.is_contained(20, 21) == True
+
+        # 複数の区間にまたがるものは含まれない
+        assert span_index.is_contained(1, 5) == False
+        assert span_index.is_contained(8, 11) == False
+        assert span_index.is_contained(14, 16) == False
+        assert span_index.is_contained(30, 31) == False
+
+    def test_is_contained_empty(self):
+        assert SpanIndex([]).is_contained(0, 1) == False
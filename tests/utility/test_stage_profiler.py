@@ -0,0 +1,56 @@
+# flake8: noqa
+import pytest
+
+from pynormalizenumexp.utility.stage_profiler import StageProfiler
+
+
+class Target:
+    def add(self, a, b):
+        return a + b
+
+    def fail(self):
+        raise ValueError("fail")
+
+
+class TestStageProfiler:
+    def test_record(self):
+        profiler = StageProfiler()
+        profiler.record("a", 1.0)
+        profiler.record("a", 3.0)
+        profiler.record("b", 0.5)
+
+        res = profiler.get_stats()
+        assert res == {
+            "a": {"count": 2, "total_sec": 4.0, "mean_sec": 2.0},
+            "b": {"count": 1, "total_sec": 0.5, "mean_sec": 0.5}
+        }
+
+        profiler.reset()
+        assert profiler.get_stats() == {}
+
+    def test_callback(self):
+        records = []
+        profiler = StageProfiler(callback=lambda stage, sec: records.append((stage, sec)))
+        profiler.record("a", 1.0)
+        assert records == [("a", 1.0)]
+
+    def test_instrument(self):
+        profiler = StageProfiler()
+        target = Target()
+        stages = {"add": "addition", "fail": "failure"}
+
+        profiler.instrument(target, stages, "target")
+        assert target.add(1, 2) == 3
+        with pytest.raises(ValueError):
+            target.fail()
+
+        # 例外が発生した場合も計測する
+        res = profiler.get_stats()
+        assert res["target.addition"]["count"] == 1
+        assert res["target.failure"]["count"] == 1
+
+        # 計測対象から外すと元のメソッドに戻る
+        profiler.uninstrument(target, stages)
+        assert "add" not in vars(target)
+        assert target.add(1, 2) == 3
+        assert profiler.get_stats()["target.addition"]["count"] == 1